@@ -5,6 +5,9 @@ from modules.teams.teams import render_teams
 from modules.projects.projects import render_projects
 from modules.monitoring.monitoring import render_monitoring
 from modules.plans.plans import render_plans
+from modules.common.data_context import data_scope
+from modules.common.migrations import run_migrations
+from modules.simulation.forecast_worker import start_forecast_worker
 
 # from modules.active_projects.active_projects import render_active_projects
 
@@ -19,21 +22,41 @@ st.set_page_config(
     initial_sidebar_state="auto",
 )
 
+
+@st.cache_resource
+def _apply_migrations():
+    """Aplica las migraciones pendientes una sola vez por proceso"""
+    return run_migrations()
+
+
+_apply_migrations()
+
+
+@st.cache_resource
+def _start_forecast_worker():
+    """Inicia el precálculo del pronóstico base una sola vez por proceso"""
+    return start_forecast_worker()
+
+
+_start_forecast_worker()
+
 st.title("Automatic Project Estimator (APE)")
 
 # Tabs for Teams and Projects
 tab1, tab2, tab3, tab4 = st.tabs(["Monitoring", "Planes Guardados", "Teams", "Projects"])
 
-with tab1:
-    render_monitoring()
+# Cada entidad se lee de la DB como máximo una vez por rerun
+with data_scope():
+    with tab1:
+        render_monitoring()
 
-with tab2:
-    render_plans()
+    with tab2:
+        render_plans()
 
-with tab3:
-    render_teams()
+    with tab3:
+        render_teams()
 
-with tab4:
-    render_projects()
+    with tab4:
+        render_projects()
 
 
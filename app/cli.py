@@ -0,0 +1,222 @@
+"""
+Punto de entrada de línea de comandos de APE
+Permite ejecutar simulaciones, migraciones y la API HTTP sin Streamlit (cron, CI, scripts)
+
+Uso (desde el directorio app/):
+    python cli.py simulate --priority 12=1 --priority 7=2 --format csv --output plan.csv
+    python cli.py simulate --save-plan "Plan nocturno" --activate
+    python cli.py simulate --format bin --output resultado.apeb
+    python cli.py export-plans --plan 3 --format parquet --output plan3.parquet
+    python cli.py archive-plans --min-age-days 90
+    python cli.py migrate
+    python cli.py serve --port 8502
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import sys
+from datetime import date
+from typing import List, Optional
+
+from modules.common.models import ScheduleResult
+from modules.common.constants import (
+    SIMULATION_LOAD_TIMEOUT_SECONDS, API_DEFAULT_HOST, API_DEFAULT_PORT, PLAN_ARCHIVE_MIN_AGE_DAYS,
+)
+from modules.common.export import EXPORT_FORMATS, export_plans, export_schedule, write_export
+from modules.common.serialization import dumps_result
+from modules.simulation.forecast import run_forecast
+from modules.simulation.scheduler import EnhancedJSONEncoder
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_priority(value: str) -> tuple:
+    """Convierte 'PROJECT_ID=PRIORIDAD' en (project_id, prioridad)"""
+    try:
+        project_id, priority = value.split("=", 1)
+        return int(project_id), int(priority)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Prioridad inválida '{value}': se espera PROJECT_ID=PRIORIDAD"
+        )
+
+
+def _parse_date(value: str) -> date:
+    """Convierte una fecha YYYY-MM-DD"""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Fecha inválida '{value}': se espera YYYY-MM-DD")
+
+
+def write_result(result: ScheduleResult, output_format: str, stream) -> None:
+    """
+    Escribe el resultado de la simulación en JSON, CSV, JSON Lines, Parquet o el formato binario en columnas
+
+    Args:
+        result: Resultado de la simulación
+        output_format: 'json', 'csv', 'jsonl', 'parquet' o 'bin'
+        stream: Archivo de salida abierto en modo binario
+    """
+    if output_format == "bin":
+        stream.write(dumps_result(result))
+        return
+    if output_format in EXPORT_FORMATS:
+        write_export(export_schedule(result, output_format), stream)
+        return
+
+    payload = {
+        "checksum": result.get_checksum(),
+        "project_summaries": result.project_summaries,
+        "assignments": result.assignments,
+    }
+    stream.write(json.dumps(payload, cls=EnhancedJSONEncoder, ensure_ascii=False, indent=2).encode("utf-8"))
+    stream.write(b"\n")
+
+
+def _open_output(path: Optional[str]):
+    """Archivo de salida en modo binario (stdout si no se indica)"""
+    if path:
+        return open(path, "wb")
+    return contextlib.nullcontext(sys.stdout.buffer)
+
+
+def _cmd_simulate(args) -> int:
+    """Subcomando simulate"""
+    priority_overrides = dict(args.priority or [])
+    forecast = run_forecast(priority_overrides, args.date, args.timeout)
+    simulation_input, result = forecast.simulation_input, forecast.result
+    if forecast.adjusted_assignments > 0:
+        logger.info(f"Se ajustaron las horas de {forecast.adjusted_assignments} fases según el progreso del plan activo")
+
+    with _open_output(args.output) as stream:
+        write_result(result, args.format, stream)
+    if args.output:
+        logger.info(f"Resultado escrito en {args.output}")
+
+    if args.save_plan is not None:
+        from modules.common.plans_crud import PlansError, save_plan
+
+        current_priorities = {pid: p.priority for pid, p in simulation_input.projects.items()}
+        try:
+            saved_plan = save_plan(
+                result=result,
+                name=args.save_plan,
+                description=args.description,
+                set_as_active=args.activate,
+                current_priorities=current_priorities,
+            )
+        except PlansError as e:
+            logger.error(f"No se pudo guardar el plan: {e}")
+            return 1
+        logger.info(f"Plan guardado: '{saved_plan.name}' (ID: {saved_plan.id})")
+
+    return 0
+
+
+def _cmd_export_plans(args) -> int:
+    """Subcomando export-plans"""
+    with _open_output(args.output) as stream:
+        written = write_export(export_plans(args.format, args.plan), stream)
+    scope = f"planes {args.plan}" if args.plan else "historial completo de planes"
+    logger.info(f"Exportados {written} bytes ({scope}) en formato {args.format}")
+    return 0
+
+
+def _cmd_archive_plans(args) -> int:
+    """Subcomando archive-plans"""
+    from modules.common.plan_archive import archive_old_plans
+
+    plan_ids = archive_old_plans(args.min_age_days, args.archive_dir, dry_run=args.dry_run)
+    action = "a archivar" if args.dry_run else "archivados"
+    logger.info(f"Planes {action}: {plan_ids or 'ninguno'}")
+    return 0
+
+
+def _cmd_migrate(args) -> int:
+    """Subcomando migrate"""
+    from modules.common.migrations import run_migrations
+
+    applied = run_migrations()
+    logger.info(f"Migraciones aplicadas: {applied or 'ninguna (esquema al día)'}")
+    return 0
+
+
+def _cmd_serve(args) -> int:
+    """Subcomando serve"""
+    from modules.api.server import serve
+
+    serve(args.host, args.port)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Construye el parser de argumentos"""
+    parser = argparse.ArgumentParser(prog="ape", description="Herramientas de línea de comandos de APE")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Mostrar logs de debug")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    simulate = subparsers.add_parser("simulate", help="Ejecutar una simulación con los datos de la DB")
+    simulate.add_argument("--priority", action="append", type=_parse_priority, metavar="PROJECT_ID=PRIORIDAD",
+                          help="Cambiar la prioridad de un proyecto (repetible)")
+    simulate.add_argument("--date", type=_parse_date, default=None,
+                          help="Fecha de referencia YYYY-MM-DD (por defecto hoy)")
+    simulate.add_argument("--format", choices=["json", *EXPORT_FORMATS, "bin"], default="json",
+                          help="Formato de salida (bin: formato binario en columnas, ver modules/common/serialization.py)")
+    simulate.add_argument("--output", "-o", default=None, help="Archivo de salida (por defecto stdout)")
+    simulate.add_argument("--timeout", type=float, default=SIMULATION_LOAD_TIMEOUT_SECONDS,
+                          help="Tiempo máximo en segundos para cargar los datos")
+    simulate.add_argument("--save-plan", metavar="NOMBRE", default=None,
+                          help="Guardar el resultado como plan (nombre vacío = automático)")
+    simulate.add_argument("--description", default="", help="Descripción del plan guardado")
+    simulate.add_argument("--activate", action="store_true", help="Marcar el plan guardado como activo")
+    simulate.set_defaults(handler=_cmd_simulate)
+
+    export = subparsers.add_parser("export-plans", help="Exportar asignaciones de planes guardados")
+    export.add_argument("--plan", action="append", type=int, metavar="PLAN_ID",
+                        help="Plan a exportar (repetible; por defecto todo el historial)")
+    export.add_argument("--format", choices=list(EXPORT_FORMATS), default="csv", help="Formato de salida")
+    export.add_argument("--output", "-o", default=None, help="Archivo de salida (por defecto stdout)")
+    export.set_defaults(handler=_cmd_export_plans)
+
+    archive = subparsers.add_parser("archive-plans", help="Mover planes antiguos de la DB al archivo Parquet")
+    archive.add_argument("--min-age-days", type=int, default=PLAN_ARCHIVE_MIN_AGE_DAYS,
+                         help="Antigüedad mínima de los planes a archivar (días)")
+    archive.add_argument("--archive-dir", default=None,
+                         help="Directorio del archivo (por defecto PLAN_ARCHIVE_DIR)")
+    archive.add_argument("--dry-run", action="store_true", help="Solo listar los planes que se archivarían")
+    archive.set_defaults(handler=_cmd_archive_plans)
+
+    migrate = subparsers.add_parser("migrate", help="Aplicar las migraciones pendientes del esquema")
+    migrate.set_defaults(handler=_cmd_migrate)
+
+    serve = subparsers.add_parser("serve", help="Iniciar la API HTTP local (JSON)")
+    serve.add_argument("--host", default=API_DEFAULT_HOST, help="Dirección de escucha")
+    serve.add_argument("--port", type=int, default=API_DEFAULT_PORT, help="Puerto de escucha")
+    serve.set_defaults(handler=_cmd_serve)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de la CLI"""
+    args = build_parser().parse_args(argv)
+
+    # Logs a stderr para no mezclarlos con la salida JSON/CSV en stdout
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(levelname)s:%(name)s:%(message)s',
+        stream=sys.stderr,
+    )
+
+    try:
+        return args.handler(args)
+    except Exception as e:
+        logger.error(f"Error ejecutando '{args.command}': {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
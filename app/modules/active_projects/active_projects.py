@@ -8,12 +8,12 @@ import pandas as pd
 from datetime import date
 from typing import List, Dict, Optional
 import logging
-import math
+import numpy as np
 
 from ..common.models import Project, Assignment, Team
 from ..common.simulation_data_loader import load_simulation_input_from_db
 from ..simulation.scheduler import ProjectScheduler
-from ..common.date_utils import calculate_business_days
+from ..common.date_utils import calculate_business_days_array, to_day_array
 
 logger = logging.getLogger(__name__)
 
@@ -96,12 +96,18 @@ def _identify_active_projects(result, projects: Dict[int, Project], teams: Dict[
     
     active_projects = []
     
-    # Agrupar asignaciones por proyecto
+    # Horas trabajadas de todas las asignaciones en una sola pasada vectorizada
+    assignment_hours = _calculate_assignment_hours_worked(result.assignments, today)
+    
+    # Agrupar asignaciones (y sus horas trabajadas) por proyecto
     project_assignments = {}
-    for assignment in result.assignments:
+    project_hours = {}
+    for position, assignment in enumerate(result.assignments):
         if assignment.project_id not in project_assignments:
             project_assignments[assignment.project_id] = []
+            project_hours[assignment.project_id] = []
         project_assignments[assignment.project_id].append(assignment)
+        project_hours[assignment.project_id].append(assignment_hours[position])
     
     # Verificar cada proyecto
     for project_id, assignments in project_assignments.items():
@@ -124,7 +130,8 @@ def _identify_active_projects(result, projects: Dict[int, Project], teams: Dict[
         # Si tiene asignaciones activas, incluir en la lista
         if active_assignments:
             project_data = _calculate_project_data(
-                project, assignments, active_assignments, teams, today
+                project, assignments, active_assignments, teams, today,
+                assignment_hours=np.asarray(project_hours[project_id])
             )
             active_projects.append(project_data)
     
@@ -135,7 +142,7 @@ def _identify_active_projects(result, projects: Dict[int, Project], teams: Dict[
 
 def _calculate_project_data(project: Project, all_assignments: List[Assignment], 
                           active_assignments: List[Assignment], teams: Dict[int, Team], 
-                          today: date) -> Dict:
+                          today: date, assignment_hours: Optional[np.ndarray] = None) -> Dict:
     """
     Calcula datos completos para un proyecto activo
     
@@ -145,6 +152,7 @@ def _calculate_project_data(project: Project, all_assignments: List[Assignment],
         active_assignments: Asignaciones activas hoy
         teams: Diccionario de equipos
         today: Fecha actual
+        assignment_hours: Horas trabajadas por asignación ya calculadas (opcional)
     
     Returns:
         Diccionario con datos del proyecto
@@ -169,11 +177,14 @@ def _calculate_project_data(project: Project, all_assignments: List[Assignment],
                 phase_hours[phase_name] = 0
             phase_hours[phase_name] += hours_needed
     
+    if assignment_hours is None:
+        assignment_hours = _calculate_assignment_hours_worked(all_assignments, today)
+    
     # Calcular horas trabajadas hasta hoy
-    hours_worked = _calculate_hours_worked(project, all_assignments, today)
+    hours_worked = _calculate_hours_worked(project, all_assignments, today, assignment_hours)
     
     # Calcular horas trabajadas por fase
-    phase_hours_worked = _calculate_hours_worked_by_phase(all_assignments, teams, today)
+    phase_hours_worked = _calculate_hours_worked_by_phase(all_assignments, teams, today, assignment_hours)
     
     # Determinar estado de cada fase
     phase_states = _calculate_phase_states(all_assignments, teams, today)
@@ -202,7 +213,47 @@ def _calculate_project_data(project: Project, all_assignments: List[Assignment],
     }
 
 
-def _calculate_hours_worked(project: Project, assignments: List[Assignment], today: date) -> int:
+def _calculate_assignment_hours_worked(assignments: List[Assignment], today: date) -> np.ndarray:
+    """
+    Calcula las horas trabajadas hasta hoy de cada asignación, de forma vectorizada
+    
+    Las asignaciones terminadas cuentan todas sus horas; las que están en progreso
+    cuentan la proporción de días hábiles transcurridos. En ambos casos se multiplica
+    por los desarrolladores asignados (mínimo 1).
+    
+    Args:
+        assignments: Asignaciones a evaluar
+        today: Fecha actual
+    
+    Returns:
+        Array con las horas trabajadas por asignación (mismo orden que assignments)
+    """
+    if not assignments:
+        return np.zeros(0)
+    
+    starts = to_day_array([a.calculated_start_date for a in assignments])
+    ends = to_day_array([a.calculated_end_date for a in assignments])
+    pending_hours = np.array([a.pending_hours or 0 for a in assignments], dtype=float)
+    devs_assigned = np.maximum(1, np.array([a.devs_assigned or 1 for a in assignments], dtype=float))
+    today_day = np.datetime64(today, 'D')
+    
+    started = ~np.isnat(starts) & (starts <= today_day)
+    finished = started & ~np.isnat(ends) & (ends <= today_day)
+    in_progress = started & ~finished & ~np.isnat(ends)
+    
+    total_days = calculate_business_days_array(starts, ends)
+    days_worked = calculate_business_days_array(starts, today_day)
+    proportion = np.minimum(1.0, days_worked / np.where(total_days > 0, total_days, 1))
+    
+    hours = np.zeros(len(assignments))
+    hours[finished] = pending_hours[finished] * devs_assigned[finished]
+    progressing = in_progress & (total_days > 0)
+    hours[progressing] = pending_hours[progressing] * proportion[progressing] * devs_assigned[progressing]
+    return hours
+
+
+def _calculate_hours_worked(project: Project, assignments: List[Assignment], today: date,
+                            assignment_hours: Optional[np.ndarray] = None) -> int:
     """
     Calcula horas trabajadas desde fecha_inicio_real hasta hoy, considerando múltiples desarrolladores
     
@@ -210,6 +261,7 @@ def _calculate_hours_worked(project: Project, assignments: List[Assignment], tod
         project: Proyecto
         assignments: Asignaciones del proyecto
         today: Fecha actual
+        assignment_hours: Horas trabajadas por asignación ya calculadas (opcional)
     
     Returns:
         Horas trabajadas (estimadas basadas en días hábiles y desarrolladores asignados)
@@ -221,42 +273,16 @@ def _calculate_hours_worked(project: Project, assignments: List[Assignment], tod
     if project.fecha_inicio_real > today:
         return 0
     
-    # Calcular días hábiles trabajados
-    business_days_worked = calculate_business_days(project.fecha_inicio_real, today)
+    if assignment_hours is None:
+        assignment_hours = _calculate_assignment_hours_worked(assignments, today)
+    if len(assignment_hours) == 0:
+        return 0
     
-    # Estimar horas trabajadas basándose en asignaciones que ya deberían haber empezado
-    hours_worked = 0
-    for assignment in assignments:
-        if (assignment.calculated_start_date and 
-            assignment.calculated_start_date <= today):
-            
-            # Obtener número de desarrolladores asignados (mínimo 1)
-            devs_assigned = max(1, assignment.devs_assigned or 1)
-            
-            # Si la asignación ya terminó, contar todas las horas multiplicadas por desarrolladores
-            if (assignment.calculated_end_date and 
-                assignment.calculated_end_date <= today):
-                assignment_hours = (assignment.pending_hours or 0) * devs_assigned
-                hours_worked += assignment_hours
-                logger.debug(f"Asignación completada - Proyecto: {assignment.project_name}, Equipo: {assignment.team_name}, "
-                           f"Horas base: {assignment.pending_hours}, Devs: {devs_assigned}, Horas totales: {assignment_hours}")
-            else:
-                # Si está en progreso, calcular proporcionalmente y multiplicar por desarrolladores
-                if assignment.calculated_end_date:
-                    total_days = calculate_business_days(
-                        assignment.calculated_start_date, 
-                        assignment.calculated_end_date
-                    )
-                    days_worked = calculate_business_days(
-                        assignment.calculated_start_date, 
-                        today
-                    )
-                    if total_days > 0:
-                        proportion = min(1.0, days_worked / total_days)
-                        assignment_hours = (assignment.pending_hours or 0) * proportion * devs_assigned
-                        hours_worked += int(assignment_hours)
-    
-    return hours_worked
+    # Las asignaciones en progreso se truncan a horas enteras
+    ends = to_day_array([a.calculated_end_date for a in assignments])
+    finished = ~np.isnat(ends) & (ends <= np.datetime64(today, 'D'))
+    hours_worked = np.where(finished, assignment_hours, np.trunc(assignment_hours)).sum()
+    return hours_worked.item()
 
 
 def _calculate_phase_states(assignments: List[Assignment], teams: Dict[int, Team], today: date) -> Dict[str, str]:
@@ -292,7 +318,8 @@ def _calculate_phase_states(assignments: List[Assignment], teams: Dict[int, Team
     return phase_states
 
 
-def _calculate_hours_worked_by_phase(assignments: List[Assignment], teams: Dict[int, Team], today: date) -> Dict[str, int]:
+def _calculate_hours_worked_by_phase(assignments: List[Assignment], teams: Dict[int, Team], today: date,
+                                     assignment_hours: Optional[np.ndarray] = None) -> Dict[str, int]:
     """
     Calcula horas trabajadas por fase individual, considerando múltiples desarrolladores y redondeando hacia arriba en múltiplos de 8
     
@@ -300,54 +327,26 @@ def _calculate_hours_worked_by_phase(assignments: List[Assignment], teams: Dict[
         assignments: Asignaciones del proyecto
         teams: Diccionario de equipos
         today: Fecha actual
+        assignment_hours: Horas trabajadas por asignación ya calculadas (opcional)
     
     Returns:
         Diccionario con horas trabajadas por fase
     """
-    phase_hours_worked = {}
+    if assignment_hours is None:
+        assignment_hours = _calculate_assignment_hours_worked(assignments, today)
     
-    for assignment in assignments:
+    # Redondear hacia arriba en múltiplos de 8 cada asignación
+    assignment_hours = np.asarray(assignment_hours)
+    rounded_hours = np.where(assignment_hours > 0, np.ceil(assignment_hours / 8) * 8, 0)
+    
+    phase_hours_worked = {}
+    for assignment, hours_worked in zip(assignments, rounded_hours.tolist()):
         team = teams.get(assignment.team_id)
         if not team:
             continue
         
         phase_name = team.name
-        
-        if phase_name not in phase_hours_worked:
-            phase_hours_worked[phase_name] = 0
-        
-        # Calcular horas trabajadas para esta asignación específica
-        hours_worked = 0
-        
-        if (assignment.calculated_start_date and 
-            assignment.calculated_start_date <= today):
-            
-            # Obtener número de desarrolladores asignados (mínimo 1)
-            devs_assigned = max(1, assignment.devs_assigned or 1)
-            
-            # Si la asignación ya terminó, contar todas las horas multiplicadas por desarrolladores
-            if (assignment.calculated_end_date and 
-                assignment.calculated_end_date <= today):
-                hours_worked = (assignment.pending_hours or 0) * devs_assigned
-            else:
-                # Si está en progreso, calcular proporcionalmente y multiplicar por desarrolladores
-                if assignment.calculated_end_date:
-                    total_days = calculate_business_days(
-                        assignment.calculated_start_date, 
-                        assignment.calculated_end_date
-                    )
-                    days_worked = calculate_business_days(
-                        assignment.calculated_start_date, 
-                        today
-                    )
-                    if total_days > 0:
-                        proportion = min(1.0, days_worked / total_days)
-                        hours_worked = (assignment.pending_hours or 0) * proportion * devs_assigned
-        
-        # Redondear hacia arriba en múltiplos de 8
-        if hours_worked > 0:
-            hours_worked_rounded = math.ceil(hours_worked / 8) * 8
-            phase_hours_worked[phase_name] += hours_worked_rounded
+        phase_hours_worked[phase_name] = phase_hours_worked.get(phase_name, 0) + int(hours_worked)
     
     return phase_hours_worked
 
@@ -0,0 +1,3 @@
+"""
+API HTTP local de APE (JSON)
+"""
@@ -0,0 +1,286 @@
+"""
+API HTTP local de APE
+Expone simulaciones y planes en JSON para otras herramientas internas, sin Streamlit
+
+Endpoints:
+    GET  /health            Estado del servicio y huella de los datos
+    POST /simulate          Pronóstico con cambios de prioridad y capacidad opcionales
+    GET  /plans?limit=N     Planes guardados (sin asignaciones; archived=1 incluye los archivados)
+    GET  /plans/<id>        Plan guardado o archivado con sus asignaciones
+    POST /compare           Compara un pronóstico con el plan activo
+    POST /slack             Esperas por fase y cuellos de botella por team
+"""
+
+import json
+import logging
+import re
+from decimal import Decimal
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from ..common.constants import API_DEFAULT_HOST, API_DEFAULT_PORT, API_MAX_BODY_BYTES
+from ..common.data_context import data_scope
+from ..common.result_cache import get_data_fingerprint
+from ..simulation.forecast import Forecast, get_forecast
+from ..simulation.scheduler import EnhancedJSONEncoder
+
+logger = logging.getLogger(__name__)
+
+_PLAN_PATH = re.compile(r"^/plans/(\d+)$")
+
+
+class ApiError(Exception):
+    """Error de la API con su código HTTP"""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ApiJSONEncoder(EnhancedJSONEncoder):
+    """Encoder JSON que además convierte los NUMERIC de la DB y los escalares de NumPy"""
+
+    def default(self, obj):
+        if isinstance(obj, Decimal):
+            return float(obj)
+        if isinstance(obj, np.generic):
+            return obj.item()
+        return super().default(obj)
+
+
+def parse_overrides(payload: Dict[str, Any], field_name: str) -> Dict[int, int]:
+    """
+    Valida un diccionario de cambios {id: valor} de un pedido
+
+    Args:
+        payload: Cuerpo del pedido, p. ej. {"priority_overrides": {"12": 1}}
+        field_name: "priority_overrides" ({project_id: prioridad}) o
+            "capacity_overrides" ({team_id: total_devs})
+
+    Returns:
+        Diccionario {id: valor} con enteros
+    """
+    raw = payload.get(field_name) or {}
+    if not isinstance(raw, dict):
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{field_name} debe ser un objeto {{id: valor}}")
+    try:
+        return {int(key): int(value) for key, value in raw.items()}
+    except (TypeError, ValueError):
+        raise ApiError(HTTPStatus.BAD_REQUEST, f"{field_name} debe contener solo enteros")
+
+
+def _scenario_forecast(payload: Dict[str, Any]) -> Forecast:
+    """Pronóstico del escenario pedido (prioridades y capacidad opcionales)"""
+    capacity_overrides = parse_overrides(payload, "capacity_overrides")
+    if any(devs < 0 for devs in capacity_overrides.values()):
+        raise ApiError(HTTPStatus.BAD_REQUEST, "capacity_overrides no admite valores negativos")
+    return get_forecast(
+        parse_overrides(payload, "priority_overrides"),
+        capacity_overrides=capacity_overrides,
+    )
+
+
+def _forecast_payload(forecast: Forecast) -> Dict[str, Any]:
+    """Representación JSON de un pronóstico"""
+    return {
+        "fingerprint": forecast.fingerprint,
+        "computed_at": forecast.computed_at,
+        "checksum": forecast.result.get_checksum(),
+        "adjusted_assignments": forecast.adjusted_assignments,
+        "project_summaries": forecast.result.project_summaries,
+        "assignments": forecast.result.assignments,
+    }
+
+
+def _plan_payload(plan, include_assignments: bool = False) -> Dict[str, Any]:
+    """Representación JSON de un plan"""
+    payload = {
+        "id": plan.id,
+        "name": plan.name,
+        "description": plan.description,
+        "checksum": plan.checksum,
+        "created_at": plan.created_at,
+        "is_active": plan.is_active,
+        "simulation_date": plan.simulation_date,
+        "total_assignments": plan.total_assignments,
+        "total_projects": plan.total_projects,
+        "archived": plan.archived,
+    }
+    if include_assignments:
+        payload["assignments"] = list(plan.assignments)
+    return payload
+
+
+def handle_health(query, payload) -> Dict[str, Any]:
+    """GET /health"""
+    return {"status": "ok", "fingerprint": get_data_fingerprint()}
+
+
+def handle_simulate(query, payload) -> Dict[str, Any]:
+    """POST /simulate"""
+    return _forecast_payload(_scenario_forecast(payload))
+
+
+def handle_compare(query, payload) -> Dict[str, Any]:
+    """POST /compare"""
+    from ..common.plans_crud import compare_plans
+
+    forecast = _scenario_forecast(payload)
+    comparison = compare_plans(forecast.result, active_plan=forecast.simulation_input.active_plan)
+    comparison["fingerprint"] = forecast.fingerprint
+    return comparison
+
+
+def handle_slack(query, payload) -> Dict[str, Any]:
+    """POST /slack"""
+    from ..simulation.analysis import compute_slack_analysis
+
+    forecast = _scenario_forecast(payload)
+    analysis = compute_slack_analysis(forecast.result, forecast.simulation_input)
+    queue = analysis.queue_length
+    return {
+        "fingerprint": forecast.fingerprint,
+        "teams": analysis.teams.to_dict(orient="records"),
+        "assignments": analysis.assignments.to_dict(orient="records"),
+        "queue_length": {
+            "days": [day.date() for day in queue.columns],
+            "teams": {team_name: row.tolist() for team_name, row in zip(queue.index, queue.to_numpy())},
+        },
+    }
+
+
+def handle_list_plans(query, payload) -> Dict[str, Any]:
+    """GET /plans"""
+    from ..common.plans_crud import list_plans
+
+    try:
+        limit = int(query.get("limit", ["50"])[0])
+    except ValueError:
+        raise ApiError(HTTPStatus.BAD_REQUEST, "limit debe ser un entero")
+    include_archived = query.get("archived", ["0"])[0].lower() in ("1", "true")
+    return {"plans": [_plan_payload(plan) for plan in list_plans(limit, include_archived=include_archived)]}
+
+
+def handle_get_plan(plan_id: int) -> Dict[str, Any]:
+    """GET /plans/<id>"""
+    from ..common.plans_crud import get_plan_by_id
+
+    plan = get_plan_by_id(plan_id)
+    if plan is None:
+        raise ApiError(HTTPStatus.NOT_FOUND, f"Plan {plan_id} no encontrado")
+    return _plan_payload(plan, include_assignments=True)
+
+
+ROUTES = {
+    ("GET", "/health"): handle_health,
+    ("POST", "/simulate"): handle_simulate,
+    ("POST", "/compare"): handle_compare,
+    ("POST", "/slack"): handle_slack,
+    ("GET", "/plans"): handle_list_plans,
+}
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    """Despacha los pedidos HTTP a los handlers de la API"""
+
+    server_version = "APE-API/1.0"
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _read_json_body(self) -> Dict[str, Any]:
+        """Lee y decodifica el cuerpo JSON del pedido"""
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > API_MAX_BODY_BYTES:
+            raise ApiError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Cuerpo del pedido demasiado grande")
+        if length == 0:
+            return {}
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "El cuerpo del pedido no es JSON válido")
+        if not isinstance(payload, dict):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "El cuerpo del pedido debe ser un objeto JSON")
+        return payload
+
+    def _resolve(self, method: str) -> Tuple[int, Any]:
+        """Ejecuta el handler correspondiente al pedido"""
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        path = url.path.rstrip("/") or "/"
+
+        plan_match = _PLAN_PATH.match(path)
+        if method == "GET" and plan_match:
+            return HTTPStatus.OK, handle_get_plan(int(plan_match.group(1)))
+
+        handler = ROUTES.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in ROUTES) or plan_match:
+                raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED, f"Método {method} no permitido en {path}")
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Ruta no encontrada: {path}")
+
+        payload = self._read_json_body() if method == "POST" else {}
+        return HTTPStatus.OK, handler(query, payload)
+
+    def _dispatch(self, method: str) -> None:
+        try:
+            # Cada pedido lee cada entidad de la DB como máximo una vez
+            with data_scope():
+                status, body = self._resolve(method)
+        except ApiError as e:
+            status, body = e.status, {"error": e.message}
+        except TimeoutError as e:
+            logger.error(f"Timeout atendiendo {method} {self.path}: {e}")
+            status, body = HTTPStatus.GATEWAY_TIMEOUT, {"error": str(e)}
+        except Exception as e:
+            logger.error(f"Error atendiendo {method} {self.path}: {e}")
+            status, body = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Error interno"}
+        self._send_json(status, body)
+
+    def _send_json(self, status: int, body: Any) -> None:
+        data = json.dumps(body, cls=ApiJSONEncoder, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.info(f"{self.address_string()} - {format % args}")
+
+
+def create_server(host: str = API_DEFAULT_HOST, port: int = API_DEFAULT_PORT) -> ThreadingHTTPServer:
+    """
+    Crea el servidor HTTP (un hilo por pedido)
+
+    Args:
+        host: Dirección de escucha
+        port: Puerto de escucha (0 = puerto libre)
+
+    Returns:
+        ThreadingHTTPServer: Servidor listo para serve_forever()
+    """
+    server = ThreadingHTTPServer((host, port), ApiRequestHandler)
+    server.daemon_threads = True
+    return server
+
+
+def serve(host: str = API_DEFAULT_HOST, port: int = API_DEFAULT_PORT,
+          server: Optional[ThreadingHTTPServer] = None) -> None:
+    """Atiende pedidos hasta recibir Ctrl+C"""
+    server = server or create_server(host, port)
+    logger.info(f"API de APE escuchando en http://{server.server_address[0]}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -6,31 +6,60 @@ Maneja el mapeo assignment_start_date <-> start_date
 
 import sqlalchemy as sa
 from typing import List, Optional
-from .db import engine, project_team_assignments_table, projects_table, teams_table
+from .db import engine, project_team_assignments_table, projects_table, teams_table, bulk_update_rows
 from .models import Assignment
+from .data_context import get_or_load, invalidate, PROJECTS_KEY, ASSIGNMENTS_KEY
+
+
+def _assignment_to_row(assignment: Assignment) -> dict:
+    """Columnas persistidas de un assignment (los campos calculados NO se guardan en DB)"""
+    return {
+        "project_id": assignment.project_id,
+        "team_id": assignment.team_id,
+        "tier": assignment.tier,
+        "devs_assigned": assignment.devs_assigned,
+        "max_devs": assignment.max_devs,
+        "estimated_hours": assignment.estimated_hours,
+        "start_date": assignment.assignment_start_date,  # Mapeo: assignment_start_date -> start_date
+        "ready_to_start_date": assignment.ready_to_start_date,
+        "pending_hours": assignment.pending_hours,
+        "status": assignment.status,
+        "custom_estimated_hours": assignment.custom_estimated_hours
+    }
 
 
 def create_assignment(assignment: Assignment) -> int:
     """Crear assignment en DB"""
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
     with engine.begin() as conn:
         result = conn.execute(
             project_team_assignments_table.insert().values(
-                project_id=assignment.project_id,
-                team_id=assignment.team_id,
-                tier=assignment.tier,
-                devs_assigned=assignment.devs_assigned,
-                max_devs=assignment.max_devs,
-                estimated_hours=assignment.estimated_hours,
-                start_date=assignment.assignment_start_date,  # Mapeo: assignment_start_date -> start_date
-                ready_to_start_date=assignment.ready_to_start_date,
-                pending_hours=assignment.pending_hours,
-                status=assignment.status,
-                custom_estimated_hours=assignment.custom_estimated_hours
+                **_assignment_to_row(assignment)
             ).returning(project_team_assignments_table.c.id)
         )
         return result.scalar()
 
 
+def create_assignments(assignments: List[Assignment]) -> List[int]:
+    """
+    Crear muchos assignments con un INSERT multi-fila en una sola transacción
+    
+    Returns:
+        IDs creados
+    """
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
+    if not assignments:
+        return []
+    
+    with engine.begin() as conn:
+        result = conn.execute(
+            project_team_assignments_table.insert()
+            .values([_assignment_to_row(assignment) for assignment in assignments])
+            .returning(project_team_assignments_table.c.id)
+        )
+        return list(result.scalars())
+
+
 def read_assignment(assignment_id: int) -> Optional[Assignment]:
     """Leer assignment desde DB con JOINs"""
     with engine.begin() as conn:
@@ -136,7 +165,12 @@ def read_assignments_by_project(project_id: int) -> List[Assignment]:
 
 
 def read_all_assignments() -> List[Assignment]:
-    """Leer todos los assignments"""
+    """Leer todos los assignments (una sola vez por rerun dentro de un data_scope)"""
+    return get_or_load(ASSIGNMENTS_KEY, _load_all_assignments)
+
+
+def _load_all_assignments() -> List[Assignment]:
+    """Lee todos los assignments con nombres de proyecto y equipo"""
     with engine.begin() as conn:
         results = conn.execute(
             sa.select(
@@ -189,29 +223,74 @@ def read_all_assignments() -> List[Assignment]:
 
 def update_assignment(assignment: Assignment):
     """Actualizar assignment en DB"""
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
     with engine.begin() as conn:
         conn.execute(
             project_team_assignments_table.update()
             .where(project_team_assignments_table.c.id == assignment.id)
-            .values(
-                project_id=assignment.project_id,
-                team_id=assignment.team_id,
-                tier=assignment.tier,
-                devs_assigned=assignment.devs_assigned,
-                max_devs=assignment.max_devs,
-                estimated_hours=assignment.estimated_hours,
-                start_date=assignment.assignment_start_date,  # Mapeo: assignment_start_date -> start_date
-                ready_to_start_date=assignment.ready_to_start_date,
-                pending_hours=assignment.pending_hours,
-                status=assignment.status,
-                custom_estimated_hours=assignment.custom_estimated_hours
-                # NOTA: campos calculados NO se guardan en DB
-            )
+            .values(**_assignment_to_row(assignment))
         )
 
 
+def update_assignments(assignments: List[Assignment]) -> int:
+    """
+    Actualizar muchos assignments con un único UPDATE ... FROM (VALUES ...)
+    
+    Returns:
+        Cantidad de assignments actualizados
+    """
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
+    if not assignments:
+        return 0
+    
+    with engine.begin() as conn:
+        return _update_assignments(conn, assignments)
+
+
+def _update_assignments(conn, assignments: List[Assignment], returning: bool = False):
+    """
+    Actualiza assignments dentro de una transacción existente
+    
+    Returns:
+        Cantidad de filas actualizadas, o los assignments actualizados según DB si returning=True
+    """
+    rows = [{"id": assignment.id, **_assignment_to_row(assignment)} for assignment in assignments]
+    if not returning:
+        return bulk_update_rows(conn, project_team_assignments_table, rows)
+    
+    updated_rows = bulk_update_rows(
+        conn, project_team_assignments_table, rows,
+        returning=list(project_team_assignments_table.c)
+    )
+    
+    # Completar nombres y prioridad (no están en la tabla) desde los assignments de entrada
+    by_id = {assignment.id: assignment for assignment in assignments}
+    updated = []
+    for row in updated_rows:
+        source = by_id[row.id]
+        updated.append(Assignment(
+            id=row.id,
+            project_id=row.project_id,
+            project_name=source.project_name,
+            project_priority=source.project_priority,
+            team_id=row.team_id,
+            team_name=source.team_name,
+            tier=row.tier,
+            devs_assigned=float(row.devs_assigned),
+            max_devs=float(row.max_devs),
+            estimated_hours=row.estimated_hours,
+            ready_to_start_date=row.ready_to_start_date,
+            assignment_start_date=row.start_date,  # Mapeo: start_date -> assignment_start_date
+            status=row.status,
+            pending_hours=row.pending_hours or 0,
+            custom_estimated_hours=row.custom_estimated_hours
+        ))
+    return updated
+
+
 def delete_assignment(assignment_id: int):
     """Borrar assignment de DB"""
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
     with engine.begin() as conn:
         conn.execute(
             project_team_assignments_table.delete()
@@ -221,6 +300,7 @@ def delete_assignment(assignment_id: int):
 
 def delete_assignments_by_project(project_id: int):
     """Borrar todas las asignaciones de un proyecto"""
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
     with engine.begin() as conn:
         conn.execute(
             project_team_assignments_table.delete()
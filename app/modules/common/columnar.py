@@ -0,0 +1,415 @@
+"""
+Representación en columnas (structure-of-arrays) para datos masivos
+Snapshots de planes y resultados del scheduler como arrays de NumPy: fechas como ordinales
+enteros y textos codificados por diccionario. Las vistas de fila se crean al acceder, por lo
+que el código que itera objetos con atributos sigue funcionando sin cambios.
+"""
+
+from collections.abc import Sequence
+from dataclasses import MISSING, fields, is_dataclass
+from datetime import date
+from itertools import repeat
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Mapping, Tuple
+
+import numpy as np
+
+from .date_utils import to_day_array
+
+# Ordinal de date.toordinal() que corresponde a 1970-01-01 (época de datetime64)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Valor de los enteros opcionales nulos (ids y prioridades son siempre positivos)
+NULL_INT = -1
+
+
+def dates_to_ordinals(values: Iterable[date]) -> np.ndarray:
+    """Convierte fechas en ordinales int32 (0 para None)"""
+    return np.fromiter((d.toordinal() if d else 0 for d in values), dtype=np.int32)
+
+
+def day_column(records, name: str) -> np.ndarray:
+    """
+    Columna de fechas como datetime64[D] desde una tabla en columnas o una lista de objetos
+
+    Args:
+        records: ColumnarTable o secuencia de objetos con el atributo
+        name: Nombre del atributo de fecha
+
+    Returns:
+        np.ndarray: Array datetime64[D] (NaT para None)
+    """
+    if isinstance(records, ColumnarTable):
+        return records.days(name)
+    return to_day_array([getattr(r, name) for r in records])
+
+
+def value_column(records, name: str) -> np.ndarray:
+    """
+    Columna de valores desde una tabla en columnas o una lista de objetos
+
+    Args:
+        records: ColumnarTable o secuencia de objetos con el atributo
+        name: Nombre del atributo
+
+    Returns:
+        np.ndarray: Valores de la columna
+    """
+    if isinstance(records, ColumnarTable):
+        return records.column(name)
+    return np.array([getattr(r, name) for r in records])
+
+
+def ordinals_to_days(ordinals: np.ndarray) -> np.ndarray:
+    """Convierte ordinales en un array datetime64[D] (NaT para 0)"""
+    days = (ordinals.astype(np.int64) - _EPOCH_ORDINAL).astype('datetime64[D]')
+    days[ordinals == 0] = np.datetime64('NaT')
+    return days
+
+
+class RowView:
+    """Vista perezosa de una fila: lee cada atributo de su columna al accederlo"""
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "ColumnarTable", index: int):
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._table.value(name, self._index)
+
+    def __setattr__(self, name, value):
+        if name in RowView.__slots__:
+            object.__setattr__(self, name, value)
+            return
+        raise AttributeError(f"{type(self._table).__name__} es de solo lectura")
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RowView):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self._table.ROW_NAME}({', '.join(f'{k}={v!r}' for k, v in self.to_dict().items())})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Valores de la fila como diccionario"""
+        return {name: self._table.value(name, self._index) for name in self._table.COLUMNS}
+
+
+class ColumnarTable(Sequence):
+    """
+    Tabla inmutable en columnas con vistas de fila
+
+    Las subclases declaran sus columnas por tipo:
+      - INT_COLUMNS: int32 (None se guarda como NULL_INT en OPTIONAL_COLUMNS y como 0 en el resto)
+      - FLOAT_COLUMNS: float64
+      - BOOL_COLUMNS: bool
+      - DATE_COLUMNS: ordinales int32 (0 para None)
+      - TEXT_COLUMNS: códigos int32 sobre una lista de valores únicos
+    """
+    ROW_NAME: ClassVar[str] = "Row"
+    INT_COLUMNS: ClassVar[Tuple[str, ...]] = ()
+    OPTIONAL_COLUMNS: ClassVar[Tuple[str, ...]] = ()
+    FLOAT_COLUMNS: ClassVar[Tuple[str, ...]] = ()
+    BOOL_COLUMNS: ClassVar[Tuple[str, ...]] = ()
+    DATE_COLUMNS: ClassVar[Tuple[str, ...]] = ()
+    TEXT_COLUMNS: ClassVar[Tuple[str, ...]] = ()
+    COLUMNS: ClassVar[Tuple[str, ...]] = ()
+
+    def __init__(self, columns: Dict[str, np.ndarray], categories: Dict[str, List[str]], length: int):
+        self._columns = columns
+        self._categories = categories
+        self._length = length
+
+    @classmethod
+    def from_records(cls, records: Iterable[Any]) -> "ColumnarTable":
+        """Construye la tabla desde objetos con los atributos de COLUMNS"""
+        return cls._build(list(records), attrgetter)
+
+    @classmethod
+    def from_dicts(cls, rows: Iterable[Mapping[str, Any]]) -> "ColumnarTable":
+        """Construye la tabla desde filas tipo diccionario (p. ej. RealDictCursor)"""
+        return cls._build(list(rows), itemgetter)
+
+    @classmethod
+    def _build(cls, records: List[Any], getter: Callable[[str], Callable[[Any], Any]]) -> "ColumnarTable":
+        count = len(records)
+        columns = {}
+        categories = {}
+        for name in cls.INT_COLUMNS:
+            values = list(map(getter(name), records))
+            if None in values:
+                null = NULL_INT if name in cls.OPTIONAL_COLUMNS else 0
+                values = [null if v is None else v for v in values]
+            columns[name] = np.array(values, dtype=np.int32)
+        for name in cls.FLOAT_COLUMNS:
+            columns[name] = np.fromiter((float(v or 0) for v in map(getter(name), records)),
+                                        dtype=np.float64, count=count)
+        for name in cls.BOOL_COLUMNS:
+            columns[name] = np.fromiter(map(bool, map(getter(name), records)), dtype=np.bool_, count=count)
+        for name in cls.DATE_COLUMNS:
+            columns[name] = dates_to_ordinals(map(getter(name), records))
+        for name in cls.TEXT_COLUMNS:
+            uniques, codes = np.unique(np.array([v or "" for v in map(getter(name), records)], dtype=object),
+                                       return_inverse=True)
+            categories[name] = uniques.tolist()
+            columns[name] = codes.astype(np.int32).reshape(count)
+        return cls(columns, categories, count)
+
+    @classmethod
+    def from_arrow(cls, table) -> "ColumnarTable":
+        """
+        Construye la tabla desde una tabla de pyarrow (p. ej. un Parquet mapeado en memoria)
+
+        Las columnas se convierten en bloque, sin pasar por objetos Python por fila. Las columnas
+        de COLUMNS que falten en la tabla quedan nulas y las que sobren se ignoran.
+
+        Args:
+            table: pyarrow.Table
+
+        Returns:
+            ColumnarTable: Tabla en columnas
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        count = table.num_rows
+        columns = {}
+        categories = {}
+
+        def source(name, fill=None):
+            if name not in table.column_names:
+                return None
+            values = table.column(name).combine_chunks()
+            return values if fill is None else pc.fill_null(values, fill)
+
+        for name in cls.INT_COLUMNS:
+            null = NULL_INT if name in cls.OPTIONAL_COLUMNS else 0
+            values = source(name, null)
+            columns[name] = (np.full(count, null, dtype=np.int32) if values is None
+                             else values.cast(pa.int32()).to_numpy(zero_copy_only=False))
+        for name in cls.FLOAT_COLUMNS:
+            values = source(name, 0.0)
+            columns[name] = (np.zeros(count) if values is None
+                             else values.cast(pa.float64()).to_numpy(zero_copy_only=False))
+        for name in cls.BOOL_COLUMNS:
+            values = source(name, False)
+            columns[name] = (np.zeros(count, dtype=np.bool_) if values is None
+                             else values.to_numpy(zero_copy_only=False))
+        for name in cls.DATE_COLUMNS:
+            values = source(name)
+            if values is None:
+                columns[name] = np.zeros(count, dtype=np.int32)
+                continue
+            # date32 son días desde 1970-01-01; los nulos quedan como ordinal 0
+            days = values.cast(pa.date32()).cast(pa.int32())
+            ordinals = pc.add(days, _EPOCH_ORDINAL)
+            columns[name] = pc.fill_null(ordinals, 0).to_numpy(zero_copy_only=False).astype(np.int32)
+        for name in cls.TEXT_COLUMNS:
+            values = source(name, "")
+            if values is None:
+                categories[name] = [""]
+                columns[name] = np.zeros(count, dtype=np.int32)
+                continue
+            encoded = values.dictionary_encode()
+            categories[name] = encoded.dictionary.to_pylist()
+            columns[name] = encoded.indices.to_numpy(zero_copy_only=False).astype(np.int32)
+        return cls(columns, categories, count)
+
+    @classmethod
+    def concat(cls, tables: List["ColumnarTable"]) -> "ColumnarTable":
+        """
+        Une tablas del mismo tipo (p. ej. lotes leídos de la DB) en una sola
+
+        Los diccionarios de las columnas de texto se combinan y los códigos se recalculan.
+
+        Args:
+            tables: Tablas a unir, en orden
+
+        Returns:
+            ColumnarTable: Tabla con todas las filas
+        """
+        if not tables:
+            return cls._build([], itemgetter)
+        if len(tables) == 1:
+            return tables[0]
+
+        columns = {}
+        categories = {}
+        for name in cls.COLUMNS:
+            if name in cls.TEXT_COLUMNS:
+                merged = sorted(set().union(*(t.categories[name] for t in tables)))
+                lookup = np.array(merged, dtype=object)
+                categories[name] = merged
+                columns[name] = np.concatenate([
+                    np.searchsorted(lookup, np.array(t.categories[name], dtype=object)).astype(np.int32)[t.arrays[name]]
+                    for t in tables
+                ])
+            else:
+                columns[name] = np.concatenate([t.arrays[name] for t in tables])
+        return cls(columns, categories, sum(len(t) for t in tables))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [RowView(self, i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return RowView(self, index)
+
+    def __iter__(self):
+        for i in range(self._length):
+            yield RowView(self, i)
+
+    def value(self, name: str, index: int) -> Any:
+        """Valor Python de una celda"""
+        column = self._columns.get(name)
+        if column is None:
+            raise AttributeError(name)
+        raw = column[index]
+        if name in self._categories:
+            return self._categories[name][raw]
+        if name in self.DATE_COLUMNS:
+            return date.fromordinal(int(raw)) if raw else None
+        if name in self.FLOAT_COLUMNS:
+            return float(raw)
+        if name in self.BOOL_COLUMNS:
+            return bool(raw)
+        if name in self.OPTIONAL_COLUMNS and raw == NULL_INT:
+            return None
+        return int(raw)
+
+    def to_list(self, name: str) -> List[Any]:
+        """Valores Python de una columna completa (más rápido que leer celda por celda)"""
+        raw = self._columns[name]
+        if name in self._categories:
+            categories = self._categories[name]
+            return [categories[code] for code in raw.tolist()]
+        if name in self.DATE_COLUMNS:
+            # Pocas fechas distintas: se convierte cada ordinal una sola vez
+            ordinals, positions = np.unique(raw, return_inverse=True)
+            days = [date.fromordinal(o) if o else None for o in ordinals.tolist()]
+            return [days[i] for i in positions.tolist()]
+        if name in self.OPTIONAL_COLUMNS:
+            return [None if v == NULL_INT else v for v in raw.tolist()]
+        return raw.tolist()
+
+    def to_objects(self, factory: Callable[..., Any]) -> List[Any]:
+        """
+        Materializa las filas como objetos (p. ej. dataclasses del modelo)
+
+        Args:
+            factory: Clase o función que recibe las columnas como argumentos con nombre
+
+        Returns:
+            List: Un objeto por fila
+        """
+        values = {name: self.to_list(name) for name in self.COLUMNS}
+        if is_dataclass(factory):
+            # Construcción posicional en el orden de los campos: evita un diccionario de argumentos por fila
+            init_fields = [f for f in fields(factory) if f.init]
+            if set(values) <= {f.name for f in init_fields} and all(
+                f.name in values or f.default is not MISSING for f in init_fields
+            ):
+                columns = [values[f.name] if f.name in values else repeat(f.default, self._length)
+                           for f in init_fields]
+                return [factory(*row) for row in zip(*columns)]
+        names = list(values)
+        return [factory(**dict(zip(names, row))) for row in zip(*values.values())]
+
+    def column(self, name: str) -> np.ndarray:
+        """Array de una columna numérica (los textos se devuelven decodificados)"""
+        if name in self._categories:
+            return np.array(self._categories[name], dtype=object)[self._columns[name]]
+        return self._columns[name]
+
+    def days(self, name: str) -> np.ndarray:
+        """Columna de fechas como datetime64[D] (NaT para None)"""
+        return ordinals_to_days(self._columns[name])
+
+    @property
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """Arrays crudos de la tabla (códigos para textos, ordinales para fechas)"""
+        return self._columns
+
+    @property
+    def categories(self) -> Dict[str, List[str]]:
+        """Valores únicos de cada columna de texto"""
+        return self._categories
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados por los arrays de la tabla"""
+        return sum(column.nbytes for column in self._columns.values())
+
+
+class PlanAssignmentColumns(ColumnarTable):
+    """Asignaciones de un plan guardado en columnas (filas con la interfaz de PlanAssignment)"""
+    ROW_NAME = "PlanAssignment"
+    INT_COLUMNS = ("id", "plan_id", "assignment_id", "project_id", "project_priority",
+                   "priority_order", "team_id", "tier", "estimated_hours", "pending_hours")
+    OPTIONAL_COLUMNS = ("id", "priority_order", "pending_hours")
+    FLOAT_COLUMNS = ("devs_assigned",)
+    DATE_COLUMNS = ("calculated_start_date", "calculated_end_date", "ready_to_start_date")
+    TEXT_COLUMNS = ("project_name", "team_name")
+    COLUMNS = ("id", "plan_id", "assignment_id", "project_id", "project_name", "project_priority",
+               "priority_order", "team_id", "team_name", "tier", "devs_assigned", "estimated_hours",
+               "calculated_start_date", "calculated_end_date", "pending_hours", "ready_to_start_date")
+
+
+class TeamColumns(ColumnarTable):
+    """Teams en columnas (las capacidades por tier se guardan aparte)"""
+    ROW_NAME = "Team"
+    INT_COLUMNS = ("id", "total_devs", "busy_devs")
+    TEXT_COLUMNS = ("name",)
+    COLUMNS = ("id", "name", "total_devs", "busy_devs")
+
+
+class ProjectColumns(ColumnarTable):
+    """Proyectos en columnas"""
+    ROW_NAME = "Project"
+    INT_COLUMNS = ("id", "priority", "estimated_hours_total")
+    BOOL_COLUMNS = ("active",)
+    DATE_COLUMNS = ("start_date", "due_date_wo_qa", "due_date_with_qa", "fecha_inicio_real")
+    TEXT_COLUMNS = ("name",)
+    COLUMNS = ("id", "name", "priority", "start_date", "due_date_wo_qa", "due_date_with_qa",
+               "active", "fecha_inicio_real", "estimated_hours_total")
+
+
+class AssignmentColumns(ColumnarTable):
+    """Asignaciones de entrada en columnas (sin las fechas calculadas por la simulación)"""
+    ROW_NAME = "Assignment"
+    INT_COLUMNS = ("id", "project_id", "project_priority", "team_id", "tier",
+                   "estimated_hours", "custom_estimated_hours", "pending_hours")
+    OPTIONAL_COLUMNS = ("custom_estimated_hours",)
+    FLOAT_COLUMNS = ("devs_assigned", "max_devs")
+    DATE_COLUMNS = ("ready_to_start_date", "assignment_start_date")
+    TEXT_COLUMNS = ("project_name", "team_name", "status")
+    COLUMNS = ("id", "project_id", "project_name", "project_priority", "team_id", "team_name",
+               "tier", "devs_assigned", "max_devs", "estimated_hours", "ready_to_start_date",
+               "assignment_start_date", "status", "custom_estimated_hours", "pending_hours")
+
+
+class ScheduleColumns(AssignmentColumns):
+    """Asignaciones programadas de un ScheduleResult en columnas"""
+    ROW_NAME = "ScheduledAssignment"
+    DATE_COLUMNS = AssignmentColumns.DATE_COLUMNS + ("calculated_start_date", "calculated_end_date")
+    COLUMNS = AssignmentColumns.COLUMNS + ("calculated_start_date", "calculated_end_date")
+
+    @classmethod
+    def from_records(cls, records: Iterable[Any]) -> "ScheduleColumns":
+        """Construye la tabla desde ScheduledAssignment (o asignaciones con fechas calculadas)"""
+        records = list(records)
+        # Leer de la asignación de entrada evita la delegación de ScheduledAssignment por celda
+        inputs = AssignmentColumns.from_records([getattr(r, "assignment", r) for r in records])
+        columns = dict(inputs.arrays)
+        for name in ("calculated_start_date", "calculated_end_date"):
+            columns[name] = dates_to_ordinals(map(attrgetter(name), records))
+        return cls(columns, inputs.categories, len(records))
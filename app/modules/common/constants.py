@@ -27,4 +27,60 @@ PROJECT_COLORS = [
 
 # Configuraciones de UI
 DEFAULT_GANTT_HEIGHT = 500
-MAX_GANTT_TRACES = 100
\ No newline at end of file
+MAX_GANTT_TRACES = 100
+# Caché de figuras Gantt (entradas LRU compartidas por el proceso)
+FIGURE_CACHE_MAX_ENTRIES = 32
+
+# Paginación del Gantt: proyectos por página (el tope de filas es MAX_GANTT_TRACES, o MAX_GANTT_WEBGL_ROWS con WebGL)
+GANTT_PAGE_SIZE = 25
+
+# Nivel de detalle del Gantt según el rango visible (días máximos para cada nivel)
+GANTT_DETAIL_LEVELS = ["day", "week", "month", "quarter"]
+GANTT_DETAIL_MAX_SPAN_DAYS = {
+    "day": 120,
+    "week": 365,
+    "month": 3 * 365,
+}
+
+# Filas de la vista detallada a partir de las cuales se dibuja con WebGL (Scattergl).
+# El tope MAX_GANTT_TRACES aplica a las figuras SVG; la vista detallada, que pasa a WebGL por
+# encima del umbral, se recorta recién en MAX_GANTT_WEBGL_ROWS
+GANTT_WEBGL_ROW_THRESHOLD = 75
+MAX_GANTT_WEBGL_ROWS = 2000
+
+# Carga de datos de simulación: timeout total para las lecturas concurrentes (segundos)
+SIMULATION_LOAD_TIMEOUT_SECONDS = 30
+
+# Pool de conexiones psycopg2 compartido entre hilos
+DB_POOL_MIN_CONNECTIONS = 1
+DB_POOL_MAX_CONNECTIONS = 10
+# Espera máxima por una conexión libre (segundos)
+DB_POOL_ACQUIRE_TIMEOUT_SECONDS = SIMULATION_LOAD_TIMEOUT_SECONDS
+
+# Filas por sentencia en las actualizaciones masivas (UPDATE ... FROM VALUES): mantiene cada
+# sentencia lejos del límite de 65535 parámetros de Postgres
+BULK_UPDATE_CHUNK_SIZE = 1000
+
+# Caché compartida de resultados (pronóstico base) y worker de precálculo
+RESULT_CACHE_MAX_ENTRIES = 32
+FORECAST_POLL_INTERVAL_SECONDS = 30
+
+# API HTTP local (JSON)
+API_DEFAULT_HOST = "127.0.0.1"
+API_DEFAULT_PORT = 8502
+API_MAX_BODY_BYTES = 1024 * 1024
+
+# Formato binario en columnas para inputs y resultados de simulación
+SERIALIZATION_FORMAT_VERSION = 1
+
+# Exportación de cronogramas y planes: filas por lote (cursor del servidor y grupos de Parquet)
+EXPORT_BATCH_SIZE = 5000
+# Tamaño máximo de una exportación descargable desde la interfaz (las mayores se hacen con la CLI)
+EXPORT_DOWNLOAD_MAX_BYTES = 200 * 1024 * 1024
+
+# Archivo frío de planes antiguos (Parquet en disco local). La ruta por defecto es relativa al
+# directorio de trabajo y solo sirve para desarrollo: en despliegues la variable de entorno
+# PLAN_ARCHIVE_DIR debe apuntar a un volumen persistente incluido en los backups, porque los
+# planes archivados ya no están en Postgres (ver docker-compose.yml)
+PLAN_ARCHIVE_DIR = "data/plan_archive"
+PLAN_ARCHIVE_MIN_AGE_DAYS = 90
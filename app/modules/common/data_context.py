@@ -0,0 +1,96 @@
+"""
+Contexto de datos por rerun (identity map)
+Cada conjunto de entidades se lee de la DB como máximo una vez dentro de un data_scope()
+y se descarta al terminar el rerun, por lo que nunca queda desactualizado entre reruns
+"""
+
+import copy
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Claves de los conjuntos de entidades cacheados
+TEAMS_KEY = "teams"
+PROJECTS_KEY = "projects"
+ASSIGNMENTS_KEY = "assignments"
+ACTIVE_PLAN_KEY = "active_plan"
+
+_current_scope: ContextVar[Optional[Dict[str, Any]]] = ContextVar("data_scope", default=None)
+
+
+@contextmanager
+def data_scope():
+    """
+    Abre un contexto de datos para la duración de un rerun
+
+    Si ya hay un contexto abierto se reutiliza; el contexto más externo
+    se descarta al salir (incluso si el rerun termina con una excepción).
+    """
+    if _current_scope.get() is not None:
+        yield
+        return
+
+    token = _current_scope.set({})
+    try:
+        yield
+    finally:
+        _current_scope.reset(token)
+
+
+def _copy_entities(value: Any) -> Any:
+    """
+    Copia superficial de las entidades entregadas a cada llamador
+
+    Los módulos modifican las entidades en memoria (prioridades, horas, fechas calculadas);
+    las copias evitan que esos cambios se filtren a otras vistas del mismo rerun.
+    """
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return {key: copy.copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy.copy(item) for item in value]
+    return copy.copy(value)
+
+
+def get_or_load(key: str, loader: Callable[[], Any]) -> Any:
+    """
+    Obtiene un conjunto de entidades del contexto actual, cargándolo si aún no se leyó
+
+    Args:
+        key: Clave del conjunto de entidades
+        loader: Función que lee el conjunto desde la DB
+
+    Returns:
+        Copia de las entidades (o el resultado directo del loader fuera de un data_scope)
+    """
+    scope = _current_scope.get()
+    if scope is None:
+        return loader()
+
+    if key not in scope:
+        scope[key] = loader()
+    else:
+        logger.debug(f"Datos '{key}' servidos desde el contexto del rerun")
+    return _copy_entities(scope[key])
+
+
+def invalidate(*keys: str) -> None:
+    """
+    Descarta conjuntos de entidades del contexto actual tras una escritura
+
+    Args:
+        keys: Claves a descartar; sin claves se descarta todo el contexto
+    """
+    scope = _current_scope.get()
+    if scope is None:
+        return
+
+    if not keys:
+        scope.clear()
+        return
+    for key in keys:
+        scope.pop(key, None)
@@ -3,6 +3,7 @@ Utilidades de fecha y tiempo consolidadas para APE
 Elimina duplicación entre scheduler.py y monitoring.py
 """
 from datetime import date
+import numpy as np
 import pandas as pd
 from pandas.tseries.offsets import BusinessDay
 import logging
@@ -64,4 +65,50 @@ def calculate_business_days(start_date: date, end_date: date) -> int:
         
     except Exception as e:
         logger.error(f"Error calculando días hábiles: {e}")
-        return 0
\ No newline at end of file
+        return 0
+
+
+def to_day_array(values) -> np.ndarray:
+    """
+    Convierte fechas (date, Timestamp, str o None) a un array datetime64[D]
+
+    Args:
+        values: Fecha o secuencia de fechas; None se convierte en NaT
+
+    Returns:
+        np.ndarray: Array datetime64[D] de al menos una dimensión
+    """
+    values = np.atleast_1d(np.asarray(values, dtype=object))
+    return pd.to_datetime(values, errors='coerce').to_numpy(dtype='datetime64[D]')
+
+
+def calculate_business_days_array(start_dates, end_dates) -> np.ndarray:
+    """
+    Versión vectorizada de calculate_business_days para muchos pares de fechas
+
+    Mantiene la misma semántica: días hábiles en [inicio, fin] menos el día de inicio
+    (-1 si inicio > fin). Los pares con fechas nulas devuelven 0.
+
+    Args:
+        start_dates: Fecha o secuencia de fechas de inicio
+        end_dates: Fecha o secuencia de fechas de fin (se difunde contra start_dates)
+
+    Returns:
+        np.ndarray: Días hábiles por par (int64)
+    """
+    starts, ends = np.broadcast_arrays(to_day_array(start_dates), to_day_array(end_dates))
+    result = np.zeros(starts.shape, dtype=np.int64)
+
+    valid = ~(np.isnat(starts) | np.isnat(ends))
+    if not valid.any():
+        return result
+
+    # Mismo rango válido que validate_date_range
+    min_day, max_day = np.datetime64(MIN_DATE, 'D'), np.datetime64(MAX_DATE, 'D')
+    safe_starts = np.clip(starts[valid], min_day, max_day)
+    safe_ends = np.clip(ends[valid], min_day, max_day)
+
+    business_days = np.busday_count(safe_starts, safe_ends + np.timedelta64(1, 'D'))
+    result[valid] = np.where(safe_starts <= safe_ends, business_days - 1, -1)
+    return result
+
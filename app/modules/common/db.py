@@ -1,8 +1,15 @@
 import os
 import sqlalchemy as sa
 from sqlalchemy import MetaData
+import threading
 import psycopg2
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from .constants import (
+    BULK_UPDATE_CHUNK_SIZE, DB_POOL_ACQUIRE_TIMEOUT_SECONDS, DB_POOL_MAX_CONNECTIONS, DB_POOL_MIN_CONNECTIONS,
+)
 
 db_url = os.getenv("DATABASE_URL")
 if not db_url:
@@ -11,14 +18,98 @@ if not db_url:
 engine = sa.create_engine(db_url, future=True)
 metadata = MetaData()
 
+_IS_POSTGRES = db_url.startswith("postgres")
+
+# Timeout por sentencia (ms) de las transacciones abiertas dentro de statement_timeout();
+# fuera de ese contexto (migraciones, archivo, escrituras) las sentencias no tienen límite
+_statement_timeout_ms: ContextVar[Optional[int]] = ContextVar("statement_timeout_ms", default=None)
+
+
+@contextmanager
+def statement_timeout(seconds: float):
+    """
+    Limita la duración de cada sentencia de las transacciones abiertas en este contexto
+
+    Se aplica con SET LOCAL al comenzar cada transacción (SQLAlchemy y pool psycopg2), por lo
+    que una lectura abandonada por un timeout no retiene su conexión. Los hilos que copian el
+    contexto (contextvars.copy_context) heredan el límite.
+
+    Args:
+        seconds: Duración máxima de cada sentencia
+    """
+    token = _statement_timeout_ms.set(max(1, int(seconds * 1000)))
+    try:
+        yield
+    finally:
+        _statement_timeout_ms.reset(token)
+
+
+def _apply_statement_timeout(dbapi_connection) -> None:
+    """Ejecuta SET LOCAL statement_timeout si hay un límite en el contexto actual"""
+    timeout_ms = _statement_timeout_ms.get()
+    if timeout_ms is None or not _IS_POSTGRES:
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"SET LOCAL statement_timeout = {timeout_ms}")
+    finally:
+        cursor.close()
+
+
+@sa.event.listens_for(engine, "begin")
+def _on_engine_begin(conn):
+    _apply_statement_timeout(conn.connection.dbapi_connection)
+
+_connection_pool = None
+_connection_pool_lock = threading.Lock()
+# ThreadedConnectionPool lanza PoolError si no quedan conexiones libres: el semáforo
+# hace esperar a los hilos hasta que se devuelva una
+_connection_slots = threading.BoundedSemaphore(DB_POOL_MAX_CONNECTIONS)
+
+
+def _get_connection_pool() -> ThreadedConnectionPool:
+    """Crea (una sola vez) el pool de conexiones psycopg2 compartido entre hilos"""
+    global _connection_pool
+    if _connection_pool is None:
+        with _connection_pool_lock:
+            if _connection_pool is None:
+                _connection_pool = ThreadedConnectionPool(
+                    DB_POOL_MIN_CONNECTIONS, DB_POOL_MAX_CONNECTIONS, db_url
+                )
+    return _connection_pool
+
+
 @contextmanager
 def get_db_connection():
-    """Proporciona una conexión de base de datos usando psycopg2 para compatibilidad con plans_crud"""
-    conn = psycopg2.connect(db_url)
+    """
+    Proporciona una conexión psycopg2 del pool para compatibilidad con plans_crud
+
+    Si todas las conexiones están en uso, espera hasta DB_POOL_ACQUIRE_TIMEOUT_SECONDS
+    a que se libere una.
+
+    Raises:
+        PoolError: Si no se liberó ninguna conexión dentro del tiempo de espera
+    """
+    pool = _get_connection_pool()
+    if not _connection_slots.acquire(timeout=DB_POOL_ACQUIRE_TIMEOUT_SECONDS):
+        raise PoolError(
+            f"Sin conexiones libres tras {DB_POOL_ACQUIRE_TIMEOUT_SECONDS}s "
+            f"({DB_POOL_MAX_CONNECTIONS} en uso)"
+        )
     try:
-        yield conn
+        conn = pool.getconn()
+        try:
+            _apply_statement_timeout(conn)
+            yield conn
+        finally:
+            # Descartar transacciones sin commit antes de devolver la conexión al pool
+            try:
+                conn.rollback()
+                pool.putconn(conn)
+            except psycopg2.Error:
+                pool.putconn(conn, close=True)
     finally:
-        conn.close()
+        _connection_slots.release()
 
 projects_table = sa.Table(
     "projects", metadata, autoload_with=engine
@@ -35,4 +126,56 @@ tier_capacity_table = sa.Table(
 
 def run(stmt):
     with engine.begin() as conn:
-        conn.execute(stmt)
\ No newline at end of file
+        conn.execute(stmt)
+
+
+def bulk_update_rows(conn, table, rows, key="id", where=None, returning=None):
+    """
+    Actualiza muchas filas con UPDATE ... FROM (VALUES ...)
+
+    Las filas se envían en sentencias de BULK_UPDATE_CHUNK_SIZE filas dentro de la misma
+    transacción, para no superar el límite de parámetros por sentencia de Postgres.
+
+    Args:
+        conn: Conexión SQLAlchemy dentro de una transacción
+        table: Tabla a actualizar
+        rows: Lista de dicts con la clave y las columnas a actualizar (mismas claves en todas)
+        key: Columna que identifica cada fila
+        where: Condición adicional opcional sobre la tabla
+        returning: Columnas a devolver de las filas actualizadas (opcional)
+
+    Returns:
+        int con las filas actualizadas, o la lista de filas devueltas si se indica returning
+    """
+    if not rows:
+        return [] if returning is not None else 0
+
+    if len(rows) > BULK_UPDATE_CHUNK_SIZE:
+        results = [
+            bulk_update_rows(conn, table, rows[start:start + BULK_UPDATE_CHUNK_SIZE], key, where, returning)
+            for start in range(0, len(rows), BULK_UPDATE_CHUNK_SIZE)
+        ]
+        if returning is not None:
+            return [row for chunk in results for row in chunk]
+        return sum(results)
+
+    columns = list(rows[0].keys())
+    new_values = sa.values(
+        *[sa.column(name, table.c[name].type) for name in columns],
+        name="new_values"
+    ).data([tuple(row[name] for name in columns) for row in rows])
+
+    # Los literales de VALUES llegan sin tipo (NULL, fechas, textos): castear al tipo de la columna
+    stmt = (
+        table.update()
+        .where(table.c[key] == sa.cast(new_values.c[key], table.c[key].type))
+        .values({
+            name: sa.cast(new_values.c[name], table.c[name].type)
+            for name in columns if name != key
+        })
+    )
+    if where is not None:
+        stmt = stmt.where(where)
+    if returning is not None:
+        return conn.execute(stmt.returning(*returning)).fetchall()
+    return conn.execute(stmt).rowcount
\ No newline at end of file
@@ -0,0 +1,263 @@
+"""
+Exportación de cronogramas y planes guardados a CSV, JSON Lines y Parquet
+Las filas se escriben por lotes a medida que se generan, sin armar un DataFrame intermedio:
+cada exportación es un generador de bloques de bytes que se puede volcar a un archivo,
+a la salida estándar o a una respuesta HTTP
+"""
+
+import csv
+import io
+import json
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .constants import EXPORT_BATCH_SIZE
+from .models import Plan, ScheduleResult
+
+# Parquet requiere pyarrow (opcional)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Formatos soportados: (tipo MIME, extensión)
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+# Columnas exportadas y su tipo (define el esquema de Parquet)
+SCHEDULE_EXPORT_COLUMNS: List[Tuple[str, str]] = [
+    ("id", "int"), ("project_id", "int"), ("project_name", "str"), ("project_priority", "int"),
+    ("team_id", "int"), ("team_name", "str"), ("tier", "int"), ("devs_assigned", "float"),
+    ("estimated_hours", "int"), ("ready_to_start_date", "date"), ("calculated_start_date", "date"),
+    ("calculated_end_date", "date"), ("pending_hours", "int"), ("status", "str"),
+]
+
+PLAN_EXPORT_COLUMNS: List[Tuple[str, str]] = [
+    ("plan_id", "int"), ("plan_name", "str"), ("plan_created_at", "datetime"),
+    ("id", "int"), ("assignment_id", "int"), ("project_id", "int"), ("project_name", "str"), ("project_priority", "int"),
+    ("priority_order", "int"), ("team_id", "int"), ("team_name", "str"), ("tier", "int"),
+    ("devs_assigned", "float"), ("estimated_hours", "int"), ("calculated_start_date", "date"),
+    ("calculated_end_date", "date"), ("pending_hours", "int"), ("ready_to_start_date", "date"),
+]
+
+
+class ExportError(Exception):
+    """Error de exportación (formato desconocido o dependencia faltante)"""
+    pass
+
+
+def available_formats() -> List[str]:
+    """Formatos que se pueden exportar en este entorno"""
+    return [fmt for fmt in EXPORT_FORMATS if fmt != "parquet" or PARQUET_AVAILABLE]
+
+
+def export_filename(base_name: str, fmt: str) -> str:
+    """Nombre de archivo con la extensión del formato"""
+    return f"{base_name}.{EXPORT_FORMATS[fmt][1]}"
+
+
+def _text_value(value: Any) -> Any:
+    """Valor apto para CSV/JSON: fechas en ISO 8601 y NUMERIC de la DB como float"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _batches(rows: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _iter_csv(rows: Iterable[Dict[str, Any]], names: List[str], batch_size: int) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(names)
+    for batch in _batches(rows, batch_size):
+        writer.writerows([_text_value(row.get(name)) for name in names] for row in batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _iter_jsonl(rows: Iterable[Dict[str, Any]], names: List[str], batch_size: int) -> Iterator[bytes]:
+    for batch in _batches(rows, batch_size):
+        yield "".join(
+            json.dumps({name: _text_value(row.get(name)) for name in names}, ensure_ascii=False) + "\n"
+            for row in batch
+        ).encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Archivo de solo escritura que acumula bytes hasta que se retiran (el Parquet se emite por grupos)"""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_schema(columns: List[Tuple[str, str]]) -> "pa.Schema":
+    types = {
+        "int": pa.int64(), "float": pa.float64(), "str": pa.string(),
+        "date": pa.date32(), "datetime": pa.timestamp("us"),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in columns])
+
+
+def _iter_parquet(rows: Iterable[Dict[str, Any]], columns: List[Tuple[str, str]],
+                  batch_size: int) -> Iterator[bytes]:
+    schema = _parquet_schema(columns)
+    float_columns = {name for name, kind in columns if kind == "float"}
+    sink = _ChunkSink()
+    # Un grupo de filas por lote: cada lote se emite apenas se escribe
+    with pq.ParquetWriter(sink, schema) as writer:
+        for batch in _batches(rows, batch_size):
+            data = {name: [row.get(name) for row in batch] for name in schema.names}
+            for name in float_columns:
+                data[name] = [None if value is None else float(value) for value in data[name]]
+            writer.write_table(pa.Table.from_pydict(data, schema=schema))
+            yield sink.drain()
+    yield sink.drain()
+
+
+def iter_export(rows: Iterable[Dict[str, Any]], columns: List[Tuple[str, str]], fmt: str,
+                batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    Serializa filas en el formato pedido, por lotes
+
+    Args:
+        rows: Filas como diccionarios (se consumen una sola vez)
+        columns: Columnas a exportar con su tipo
+        fmt: 'csv', 'jsonl' o 'parquet'
+        batch_size: Filas por bloque emitido
+
+    Returns:
+        Iterator[bytes]: Bloques del archivo, en orden
+
+    Raises:
+        ExportError: Si el formato no existe o falta pyarrow para Parquet
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ExportError(f"Formato de exportación desconocido: {fmt} (opciones: {', '.join(EXPORT_FORMATS)})")
+    if fmt == "parquet":
+        if not PARQUET_AVAILABLE:
+            raise ExportError("La exportación a Parquet requiere pyarrow (pip install pyarrow)")
+        return _iter_parquet(rows, columns, batch_size)
+    names = [name for name, _ in columns]
+    if fmt == "jsonl":
+        return _iter_jsonl(rows, names, batch_size)
+    return _iter_csv(rows, names, batch_size)
+
+
+def write_export(chunks: Iterable[bytes], stream) -> int:
+    """
+    Vuelca una exportación en un archivo abierto en modo binario
+
+    Returns:
+        int: Bytes escritos
+    """
+    written = 0
+    for chunk in chunks:
+        if chunk:
+            stream.write(chunk)
+            written += len(chunk)
+    return written
+
+
+def iter_schedule_rows(result: ScheduleResult) -> Iterator[Dict[str, Any]]:
+    """Filas de exportación de un resultado de simulación (una por asignación)"""
+    names = [name for name, _ in SCHEDULE_EXPORT_COLUMNS]
+    for assignment in result.assignments:
+        yield {name: getattr(assignment, name, None) for name in names}
+
+
+def export_schedule(result: ScheduleResult, fmt: str, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    Exporta las asignaciones de un resultado de simulación
+
+    Args:
+        result: Resultado de la simulación
+        fmt: 'csv', 'jsonl' o 'parquet'
+        batch_size: Filas por bloque emitido
+
+    Returns:
+        Iterator[bytes]: Bloques del archivo exportado
+    """
+    return iter_export(iter_schedule_rows(result), SCHEDULE_EXPORT_COLUMNS, fmt, batch_size)
+
+
+def export_plans(fmt: str, plan_ids: Optional[List[int]] = None,
+                 batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    Exporta las asignaciones de planes guardados leyendo la DB con un cursor del servidor
+
+    Args:
+        fmt: 'csv', 'jsonl' o 'parquet'
+        plan_ids: Planes a exportar (None = historial completo)
+        batch_size: Filas por lote leído y emitido
+
+    Returns:
+        Iterator[bytes]: Bloques del archivo exportado
+    """
+    # Importación diferida: exportar un resultado no requiere la conexión a la DB de planes
+    from .plans_crud import iter_plan_assignment_rows
+
+    rows = iter_plan_assignment_rows(plan_ids, batch_size)
+    return iter_export(rows, PLAN_EXPORT_COLUMNS, fmt, batch_size)
+
+
+def export_plan(plan: Plan, fmt: str, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    Exporta las asignaciones de un plan ya cargado (p. ej. un plan del archivo frío)
+
+    Args:
+        plan: Plan con sus asignaciones
+        fmt: 'csv', 'jsonl' o 'parquet'
+        batch_size: Filas por bloque emitido
+
+    Returns:
+        Iterator[bytes]: Bloques del archivo exportado
+    """
+    names = [name for name, _ in PLAN_EXPORT_COLUMNS]
+    plan_fields = {"plan_id": plan.id, "plan_name": plan.name, "plan_created_at": plan.created_at}
+    rows = (
+        {name: plan_fields[name] if name in plan_fields else getattr(assignment, name, None) for name in names}
+        for assignment in plan.assignments
+    )
+    return iter_export(rows, PLAN_EXPORT_COLUMNS, fmt, batch_size)
@@ -0,0 +1,129 @@
+"""
+Migraciones versionadas del esquema APE
+Crea las tablas de planes y los índices que usan las consultas de los CRUD
+"""
+
+import logging
+from typing import List
+
+import sqlalchemy as sa
+
+logger = logging.getLogger(__name__)
+
+# Clave del advisory lock: evita que dos procesos apliquen migraciones a la vez
+MIGRATIONS_LOCK_ID = 7342001
+
+# (versión, nombre, sentencias) - nunca modificar una migración ya publicada, agregar una nueva
+MIGRATIONS = [
+    (1, "create_plan_tables", [
+        """
+        CREATE TABLE IF NOT EXISTS plans (
+          id SERIAL PRIMARY KEY,
+          name TEXT NOT NULL DEFAULT '',
+          description TEXT,
+          checksum TEXT NOT NULL,
+          created_at TIMESTAMP NOT NULL DEFAULT now(),
+          is_active BOOLEAN NOT NULL DEFAULT false,
+          simulation_date DATE,
+          total_assignments INTEGER NOT NULL DEFAULT 0,
+          total_projects INTEGER NOT NULL DEFAULT 0
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS plan_assignments (
+          id SERIAL PRIMARY KEY,
+          plan_id INTEGER NOT NULL REFERENCES plans(id) ON DELETE CASCADE,
+          assignment_id INTEGER NOT NULL,
+          project_id INTEGER NOT NULL,
+          project_name TEXT NOT NULL,
+          project_priority INTEGER NOT NULL,
+          priority_order INTEGER,
+          team_id INTEGER NOT NULL,
+          team_name TEXT NOT NULL,
+          tier INTEGER NOT NULL,
+          devs_assigned NUMERIC(4,2) NOT NULL,
+          estimated_hours INTEGER NOT NULL,
+          calculated_start_date DATE,
+          calculated_end_date DATE,
+          pending_hours INTEGER,
+          ready_to_start_date DATE
+        )
+        """,
+    ]),
+    (2, "performance_indexes", [
+        # Asignaciones por proyecto (read_assignments_by_project, borrado por proyecto) y JOIN con teams
+        "CREATE INDEX IF NOT EXISTS idx_pta_project_id ON project_team_assignments (project_id)",
+        "CREATE INDEX IF NOT EXISTS idx_pta_team_id ON project_team_assignments (team_id)",
+        # Capacidades por team (read_team, update_team, delete_team)
+        "CREATE INDEX IF NOT EXISTS idx_tier_capacity_team_id ON tier_capacity (team_id)",
+        # _load_plan_assignments: WHERE plan_id = ? ORDER BY calculated_start_date, ...
+        "CREATE INDEX IF NOT EXISTS idx_plan_assignments_plan_start "
+        "ON plan_assignments (plan_id, calculated_start_date)",
+        # list_plans: ORDER BY created_at DESC LIMIT n
+        "CREATE INDEX IF NOT EXISTS idx_plans_created_at ON plans (created_at DESC)",
+    ]),
+    (3, "single_active_plan", [
+        # Dejar activo solo el plan más reciente antes de crear el índice único
+        """
+        UPDATE plans SET is_active = false
+        WHERE is_active
+          AND id <> (
+            SELECT id FROM plans WHERE is_active
+            ORDER BY created_at DESC, id DESC
+            LIMIT 1
+          )
+        """,
+        # get_active_plan: WHERE is_active = true pasa a ser una búsqueda por índice
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_plans_single_active ON plans (is_active) WHERE is_active",
+    ]),
+]
+
+
+def get_applied_versions(conn) -> List[int]:
+    """Versiones ya aplicadas según la tabla schema_migrations"""
+    return list(conn.execute(
+        sa.text("SELECT version FROM schema_migrations ORDER BY version")
+    ).scalars())
+
+
+def run_migrations(engine=None) -> List[int]:
+    """
+    Aplica las migraciones pendientes en una sola transacción
+
+    Args:
+        engine: Engine de SQLAlchemy (por defecto el de db.py)
+
+    Returns:
+        Lista de versiones aplicadas en esta ejecución
+    """
+    if engine is None:
+        from .db import engine
+
+    applied_now = []
+    with engine.begin() as conn:
+        conn.execute(sa.text("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+              version INTEGER PRIMARY KEY,
+              name TEXT NOT NULL,
+              applied_at TIMESTAMP NOT NULL DEFAULT now()
+            )
+        """))
+        conn.execute(sa.text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": MIGRATIONS_LOCK_ID})
+
+        applied = set(get_applied_versions(conn))
+        for version, name, statements in MIGRATIONS:
+            if version in applied:
+                continue
+
+            logger.info(f"Aplicando migración {version}: {name}")
+            for statement in statements:
+                conn.execute(sa.text(statement))
+            conn.execute(
+                sa.text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                {"version": version, "name": name}
+            )
+            applied_now.append(version)
+
+    if applied_now:
+        logger.info(f"Migraciones aplicadas: {applied_now}")
+    return applied_now
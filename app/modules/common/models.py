@@ -3,17 +3,19 @@ Modelos de datos unificados para el sistema APE
 Versión refactorizada con código limpio y métodos optimizados
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import date, datetime
-from typing import List, Dict, Optional, TYPE_CHECKING
+from typing import Any, Callable, List, Dict, Optional, Sequence, TYPE_CHECKING
 import hashlib
 import json
+import threading
 
 if TYPE_CHECKING:
     from .assignments_crud import Assignment
+    from .columnar import ScheduleColumns
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """Equipo con capacidad real de la aplicación APE"""
     id: int
@@ -35,7 +37,7 @@ class Team:
         return self.tier_capacities.get(tier, 0)
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Proyecto con estructura simplificada APE"""
     id: int
@@ -48,7 +50,7 @@ class Project:
     fecha_inicio_real: Optional[date] = None
     
     # Campos calculados dinámicamente (NO van a DB)
-    _assignments: List['Assignment'] = field(default_factory=list)
+    estimated_hours_total: int = 0
     
     def is_active(self) -> bool:
         """Verifica si el proyecto está activo"""
@@ -63,10 +65,8 @@ class Project:
         return "#28a745" if self.active else "#6c757d"
     
     def get_horas_totales_estimadas(self) -> int:
-        """Calcula horas totales estimadas desde assignments"""
-        if not self._assignments:
-            return 0
-        return sum(a.estimated_hours for a in self._assignments)
+        """Horas totales estimadas de los assignments del proyecto"""
+        return self.estimated_hours_total
     
     def get_horas_trabajadas(self) -> int:
         """Calcula horas trabajadas desde assignments (simulado)"""
@@ -100,8 +100,8 @@ class Project:
         return f"{porcentaje:.1f}% ({trabajadas}/{total}h)"
     
     def set_assignments(self, assignments: List['Assignment']):
-        """Establece los assignments para cálculos dinámicos"""
-        self._assignments = assignments
+        """Calcula las horas totales estimadas desde una lista de assignments"""
+        self.estimated_hours_total = sum(a.estimated_hours for a in assignments)
     
     def get_progreso_color(self) -> str:
         """Retorna color para barra de progreso según porcentaje"""
@@ -116,7 +116,7 @@ class Project:
             return "#dc3545"  # Rojo - poco progreso
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment:
     """Asignación real de equipo a proyecto"""
     id: int
@@ -157,16 +157,89 @@ class Assignment:
         return target_date >= self.ready_to_start_date
 
 
+
+class ScheduledAssignment:
+    """
+    Resultado de la simulación para una asignación
+    
+    Guarda las fechas calculadas y delega el resto de los atributos en la asignación
+    de entrada, que no se modifica: un mismo SimulationInput puede alimentar varias
+    simulaciones (escenarios, hilos, resultados cacheados) sin copiarse.
+    """
+    __slots__ = ("assignment", "calculated_start_date", "calculated_end_date")
+    
+    def __init__(self, assignment: Assignment, calculated_start_date: Optional[date],
+                 calculated_end_date: Optional[date]):
+        self.assignment = assignment
+        self.calculated_start_date = calculated_start_date
+        self.calculated_end_date = calculated_end_date
+    
+    def __getattr__(self, name):
+        # Solo se llama para atributos que no son slots; evita recursión al deserializar
+        if name == "assignment":
+            raise AttributeError(name)
+        return getattr(self.assignment, name)
+    
+    def __repr__(self) -> str:
+        return (f"ScheduledAssignment(id={self.assignment.id}, "
+                f"start={self.calculated_start_date}, end={self.calculated_end_date})")
+    
+    def to_dict(self) -> Dict:
+        """Atributos de la asignación con las fechas calculadas de la simulación"""
+        data = {f.name: getattr(self.assignment, f.name) for f in fields(self.assignment)}
+        data['calculated_start_date'] = self.calculated_start_date
+        data['calculated_end_date'] = self.calculated_end_date
+        return data
+
+
+def calculate_assignments_checksum(assignments: List[Assignment]) -> str:
+    """
+    Calcula checksum SHA-256 basado en el contenido de las asignaciones
+    Usa assignment_id + fechas calculadas para detectar cambios
+    """
+    if not assignments:
+        return hashlib.sha256("empty".encode()).hexdigest()
+    
+    # Crear estructura ordenada para hash consistente
+    assignment_data = []
+    for assignment in sorted(assignments, key=lambda a: a.id):
+        data = {
+            'assignment_id': assignment.id,
+            'project_id': assignment.project_id,
+            'team_id': assignment.team_id,
+            'calculated_start_date': assignment.calculated_start_date.isoformat() if assignment.calculated_start_date else None,
+            'calculated_end_date': assignment.calculated_end_date.isoformat() if assignment.calculated_end_date else None,
+            'pending_hours': assignment.pending_hours,
+            'devs_assigned': float(assignment.devs_assigned)
+        }
+        assignment_data.append(data)
+    
+    # Convertir a JSON ordenado y calcular hash
+    json_str = json.dumps(assignment_data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(json_str.encode('utf-8')).hexdigest()
+
+
 @dataclass
 class ScheduleResult:
     """Resultado de la simulación"""
-    assignments: List[Assignment]
+    assignments: List[ScheduledAssignment]
     project_summaries: List[Dict]
     
     # Campos para sistema de planes
     checksum: str = ""
     has_changes: bool = True
     
+    def get_checksum(self) -> str:
+        """Checksum estilo plan del resultado (se calcula una sola vez)"""
+        if not self.checksum:
+            self.checksum = calculate_assignments_checksum(self.assignments)
+        return self.checksum
+    
+    def to_columns(self) -> 'ScheduleColumns':
+        """Asignaciones del resultado en columnas (representación compacta para guardar o cachear)"""
+        from .columnar import ScheduleColumns
+        return ScheduleColumns.from_records(self.assignments)
+    
     def get_project_end_date(self, project_id: int) -> Optional[date]:
         """Fecha de fin del proyecto (última asignación)"""
         project_assignments = [a for a in self.assignments if a.project_id == project_id]
@@ -204,11 +277,45 @@ class SimulationInput:
     assignments: List[Assignment]
     simulation_start_date: date = None
     
+    # Plan activo y fases completadas según ese plan (cargados junto con los datos)
+    active_plan: Optional['Plan'] = None
+    completed_phases: Dict[int, date] = field(default_factory=dict)
+    
     def __post_init__(self):
         if self.simulation_start_date is None:
             self.simulation_start_date = date.today()
 
 
+class _SharedAssignmentsLoader:
+    """
+    Carga diferida memoizada de las asignaciones de un plan
+
+    Las copias superficiales de un plan (p. ej. las del data_scope) comparten esta instancia,
+    por lo que las asignaciones se leen una sola vez aunque cada copia acceda a ellas.
+    Si la lectura falla, el próximo acceso vuelve a intentarla.
+    """
+    __slots__ = ("_loader", "_value", "_lock")
+
+    def __init__(self, loader: Callable[[], Sequence['PlanAssignment']]):
+        self._loader = loader
+        self._value = None
+        self._lock = threading.Lock()
+
+    def __call__(self) -> Sequence['PlanAssignment']:
+        with self._lock:
+            if self._loader is not None:
+                self._value = self._loader()
+                self._loader = None
+            return self._value
+
+    def __getstate__(self):
+        return self._loader, self._value
+
+    def __setstate__(self, state):
+        self._loader, self._value = state
+        self._lock = threading.Lock()
+
+
 @dataclass
 class Plan:
     """Plan persistente - snapshot de un resultado de simulación"""
@@ -221,9 +328,13 @@ class Plan:
     simulation_date: date = None
     total_assignments: int = 0
     total_projects: int = 0
+    archived: bool = False  # Movido al archivo frío (solo lectura, fuera de la DB)
     
-    # Assignments del plan (cargados dinámicamente)
-    assignments: List['PlanAssignment'] = field(default_factory=list)
+    # Assignments del plan (cargados dinámicamente; ver set_assignments_loader)
+    assignments: List['PlanAssignment'] = field(default_factory=list, repr=False)
+    _assignments_loader: Optional[Callable[[], Sequence['PlanAssignment']]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self):
         if self.simulation_date is None:
@@ -231,31 +342,39 @@ class Plan:
         if self.created_at is None:
             self.created_at = datetime.now()
     
+    def set_assignments_loader(self, loader: Callable[[], Sequence['PlanAssignment']]) -> None:
+        """
+        Difiere la lectura de las asignaciones hasta el primer acceso a plan.assignments
+        (una sola lectura compartida por todas las copias del plan)
+        """
+        self.__dict__.pop('assignments', None)
+        self._assignments_loader = _SharedAssignmentsLoader(loader)
+    
+    @property
+    def assignments_loaded(self) -> bool:
+        """Si las asignaciones ya están en memoria"""
+        return 'assignments' in self.__dict__
+    
+    def load_assignments(self) -> Sequence['PlanAssignment']:
+        """Fuerza la carga diferida de las asignaciones y las devuelve"""
+        return self.assignments
+    
+    def __getattr__(self, name: str) -> Any:
+        # Solo se llama si el atributo no está en la instancia: assignments aún sin cargar
+        if name == 'assignments':
+            loader = self.__dict__.get('_assignments_loader')
+            if loader is not None:
+                self.assignments = loader()
+                self._assignments_loader = None
+                return self.assignments
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    
     def calculate_checksum(self, assignments: List[Assignment]) -> str:
         """
         Calcula checksum SHA-256 basado en el contenido de las asignaciones
         Usa assignment_id + fechas calculadas para detectar cambios
         """
-        if not assignments:
-            return hashlib.sha256("empty".encode()).hexdigest()
-        
-        # Crear estructura ordenada para hash consistente
-        assignment_data = []
-        for assignment in sorted(assignments, key=lambda a: a.id):
-            data = {
-                'assignment_id': assignment.id,
-                'project_id': assignment.project_id,
-                'team_id': assignment.team_id,
-                'calculated_start_date': assignment.calculated_start_date.isoformat() if assignment.calculated_start_date else None,
-                'calculated_end_date': assignment.calculated_end_date.isoformat() if assignment.calculated_end_date else None,
-                'pending_hours': assignment.pending_hours,
-                'devs_assigned': float(assignment.devs_assigned)
-            }
-            assignment_data.append(data)
-        
-        # Convertir a JSON ordenado y calcular hash
-        json_str = json.dumps(assignment_data, sort_keys=True, ensure_ascii=False)
-        return hashlib.sha256(json_str.encode('utf-8')).hexdigest()
+        return calculate_assignments_checksum(assignments)
     
     @classmethod
     def from_schedule_result(cls, result: ScheduleResult, name: str = "", description: str = "") -> 'Plan':
@@ -269,12 +388,12 @@ class Plan:
         )
         
         # Calcular checksum
-        plan.checksum = plan.calculate_checksum(result.assignments)
+        plan.checksum = result.get_checksum()
         
         return plan
 
 
-@dataclass
+@dataclass(slots=True)
 class PlanAssignment:
     """Asignación dentro de un plan - snapshot de Assignment calculado"""
     id: Optional[int] = None
@@ -0,0 +1,231 @@
+"""
+Archivo frío de planes antiguos
+Mueve los planes viejos de Postgres a archivos Parquet particionados en disco local y los
+vuelve a abrir en modo de solo lectura, mapeados en memoria, cuando se consultan
+
+Estructura del directorio:
+    <PLAN_ARCHIVE_DIR>/manifest.json                       metadatos de cada plan archivado
+    <PLAN_ARCHIVE_DIR>/year=AAAA/month=MM/plan_<id>.parquet asignaciones del plan (esquema de exportación)
+
+Los planes archivados se eliminan de Postgres: el directorio debe estar en un volumen
+persistente y entrar en los mismos backups que la base (en docker-compose, el volumen
+plan_archive montado en /var/lib/ape/plan_archive).
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from .columnar import PlanAssignmentColumns
+from .constants import PLAN_ARCHIVE_DIR, PLAN_ARCHIVE_MIN_AGE_DAYS
+from .models import Plan
+
+# Los archivos Parquet requieren pyarrow (opcional)
+try:
+    import pyarrow.parquet as pq
+    ARCHIVE_AVAILABLE = True
+except ImportError:
+    ARCHIVE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+_manifest_lock = threading.Lock()
+_manifest_cache: Dict[str, Any] = {"path": None, "mtime": None, "plans": {}}
+
+
+class PlanArchiveError(Exception):
+    """Error archivando o leyendo planes archivados"""
+    pass
+
+
+def get_archive_dir() -> str:
+    """Directorio del archivo (variable de entorno PLAN_ARCHIVE_DIR o valor por defecto)"""
+    return os.getenv("PLAN_ARCHIVE_DIR", PLAN_ARCHIVE_DIR)
+
+
+def _manifest_path(archive_dir: str) -> str:
+    return os.path.join(archive_dir, MANIFEST_FILENAME)
+
+
+def _load_manifest(archive_dir: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Lee el manifiesto del archivo (cacheado mientras el archivo no cambie)
+
+    Returns:
+        Dict: {plan_id (str): metadatos del plan y ruta relativa de su Parquet}
+    """
+    path = _manifest_path(archive_dir)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return {}
+
+    with _manifest_lock:
+        if _manifest_cache["path"] == path and _manifest_cache["mtime"] == mtime:
+            return _manifest_cache["plans"]
+        with open(path, encoding="utf-8") as stream:
+            manifest = json.load(stream)
+        if manifest.get("version", 0) > MANIFEST_VERSION:
+            raise PlanArchiveError(f"Versión de manifiesto no soportada: {manifest.get('version')}")
+        _manifest_cache.update(path=path, mtime=mtime, plans=manifest.get("plans", {}))
+        return _manifest_cache["plans"]
+
+
+def _write_manifest(archive_dir: str, plans: Dict[str, Dict[str, Any]]) -> None:
+    """Escribe el manifiesto de forma atómica (archivo temporal + rename)"""
+    path = _manifest_path(archive_dir)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as stream:
+        json.dump({"version": MANIFEST_VERSION, "plans": plans}, stream, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _plan_entry(plan: Plan, relative_path: str) -> Dict[str, Any]:
+    """Metadatos de un plan para el manifiesto"""
+    return {
+        "path": relative_path,
+        "name": plan.name,
+        "description": plan.description,
+        "checksum": plan.checksum,
+        "created_at": plan.created_at.isoformat() if plan.created_at else None,
+        "simulation_date": plan.simulation_date.isoformat() if plan.simulation_date else None,
+        "total_assignments": plan.total_assignments,
+        "total_projects": plan.total_projects,
+        "archived_at": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def _plan_from_entry(plan_id: int, entry: Dict[str, Any]) -> Plan:
+    """Plan archivado (sin asignaciones) desde su entrada del manifiesto"""
+    return Plan(
+        id=plan_id,
+        name=entry["name"],
+        description=entry["description"],
+        checksum=entry["checksum"],
+        created_at=datetime.fromisoformat(entry["created_at"]) if entry["created_at"] else None,
+        is_active=False,
+        simulation_date=date.fromisoformat(entry["simulation_date"]) if entry["simulation_date"] else None,
+        total_assignments=entry["total_assignments"],
+        total_projects=entry["total_projects"],
+        archived=True,
+    )
+
+
+def list_archived_plans(archive_dir: Optional[str] = None) -> List[Plan]:
+    """
+    Lista los planes archivados (sin asignaciones), más recientes primero
+
+    Args:
+        archive_dir: Directorio del archivo (por defecto get_archive_dir())
+
+    Returns:
+        Lista de planes archivados
+    """
+    manifest = _load_manifest(archive_dir or get_archive_dir())
+    plans = [_plan_from_entry(int(plan_id), entry) for plan_id, entry in manifest.items()]
+    return sorted(plans, key=lambda p: p.created_at or datetime.min, reverse=True)
+
+
+def get_archived_plan(plan_id: int, archive_dir: Optional[str] = None) -> Optional[Plan]:
+    """
+    Abre un plan archivado
+
+    Sus asignaciones se leen al primer acceso: el Parquet se abre mapeado en memoria y se
+    convierte en columnas sin crear objetos por fila.
+
+    Args:
+        plan_id: ID del plan
+        archive_dir: Directorio del archivo (por defecto get_archive_dir())
+
+    Returns:
+        Plan archivado (archived=True) o None si no está en el archivo
+    """
+    archive_dir = archive_dir or get_archive_dir()
+    entry = _load_manifest(archive_dir).get(str(plan_id))
+    if entry is None:
+        return None
+    if not ARCHIVE_AVAILABLE:
+        logger.error(f"El plan {plan_id} está archivado pero pyarrow no está instalado")
+        return None
+
+    plan = _plan_from_entry(plan_id, entry)
+    plan.set_assignments_loader(partial(_read_archived_assignments, os.path.join(archive_dir, entry["path"])))
+    return plan
+
+
+def _read_archived_assignments(path: str) -> PlanAssignmentColumns:
+    """Lee el Parquet de un plan archivado (mapeado en memoria) como columnas"""
+    return PlanAssignmentColumns.from_arrow(pq.read_table(path, memory_map=True))
+
+
+def archive_old_plans(min_age_days: int = PLAN_ARCHIVE_MIN_AGE_DAYS, archive_dir: Optional[str] = None,
+                      dry_run: bool = False) -> List[int]:
+    """
+    Mueve al archivo los planes no activos creados hace más de `min_age_days` días
+
+    Por cada plan: escribe su Parquet (temporal + rename), verifica la cantidad de filas,
+    lo registra en el manifiesto y recién entonces lo elimina de Postgres. Si el proceso se
+    corta a mitad de camino, el plan queda en ambos lados y la DB sigue teniendo prioridad.
+
+    Args:
+        min_age_days: Antigüedad mínima en días
+        archive_dir: Directorio del archivo (por defecto get_archive_dir())
+        dry_run: Solo listar los planes que se archivarían
+
+    Returns:
+        IDs de los planes archivados (o a archivar si dry_run)
+
+    Raises:
+        PlanArchiveError: Si falta pyarrow o un Parquet no coincide con el plan
+    """
+    # Importaciones diferidas: plans_crud importa este módulo para leer planes archivados
+    from .export import export_plans, write_export
+    from .plans_crud import delete_plan, list_plans_created_before
+
+    if not ARCHIVE_AVAILABLE:
+        raise PlanArchiveError("Archivar planes requiere pyarrow (pip install pyarrow)")
+
+    archive_dir = archive_dir or get_archive_dir()
+    cutoff = datetime.now() - timedelta(days=min_age_days)
+    candidates = [plan for plan in list_plans_created_before(cutoff) if not plan.is_active]
+    logger.info(f"{len(candidates)} planes creados antes de {cutoff:%Y-%m-%d} para archivar")
+    if dry_run or not candidates:
+        return [plan.id for plan in candidates]
+
+    os.makedirs(archive_dir, exist_ok=True)
+    manifest = dict(_load_manifest(archive_dir))
+    archived = []
+    for plan in candidates:
+        created_at = plan.created_at or datetime.now()
+        relative_path = os.path.join(f"year={created_at:%Y}", f"month={created_at:%m}", f"plan_{plan.id}.parquet")
+        path = os.path.join(archive_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as stream:
+            write_export(export_plans("parquet", [plan.id]), stream)
+        rows = pq.ParquetFile(tmp_path).metadata.num_rows
+        if rows != plan.total_assignments:
+            os.remove(tmp_path)
+            raise PlanArchiveError(
+                f"El plan {plan.id} tiene {plan.total_assignments} asignaciones pero se exportaron {rows}"
+            )
+        os.replace(tmp_path, path)
+
+        manifest[str(plan.id)] = _plan_entry(plan, relative_path)
+        _write_manifest(archive_dir, manifest)
+
+        if not delete_plan(plan.id):
+            logger.warning(f"Plan {plan.id} archivado pero no se pudo eliminar de la DB")
+            continue
+        archived.append(plan.id)
+        logger.info(f"Plan {plan.id} ('{plan.name}') archivado en {relative_path} ({rows} asignaciones)")
+
+    return archived
@@ -4,9 +4,12 @@ Utilidades para el manejo de planes
 
 import logging
 from datetime import date
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
-from .models import Plan, PlanAssignment
+import numpy as np
+
+from .columnar import day_column, value_column
+from .models import Plan, PlanAssignment, SimulationInput
 from .plans_crud import get_active_plan
 
 logger = logging.getLogger(__name__)
@@ -27,59 +30,148 @@ def get_active_assignments(plan: Plan, current_date: date) -> List[Dict[str, Any
     if not plan or not plan.assignments:
         return []
 
-    active_assignments_with_progress = []
-    for assignment in plan.assignments:
-        if assignment.calculated_start_date and assignment.calculated_end_date and \
-           assignment.calculated_start_date <= current_date <= assignment.calculated_end_date:
-            
-            days_elapsed = (current_date - assignment.calculated_start_date).days
-            total_days = (assignment.calculated_end_date - assignment.calculated_start_date).days + 1
-            
-            # Calcular horas trabajadas y restantes
-            # Asumimos 8 horas por dev por día
-            hours_per_day = assignment.devs_assigned * 8
-            worked_hours = days_elapsed * hours_per_day
-            remaining_hours = assignment.estimated_hours - worked_hours
-
-            progress_info = {
-                "assignment": assignment,
-                "days_elapsed": days_elapsed,
-                "total_days": total_days,
-                "worked_hours": worked_hours,
-                "remaining_hours": remaining_hours,
-                "progress_percentage": (worked_hours / assignment.estimated_hours) * 100 if assignment.estimated_hours > 0 else 0
-            }
-            active_assignments_with_progress.append(progress_info)
-
-    return active_assignments_with_progress
-
-
-def get_completed_phases() -> Dict[int, date]:
+    assignments = plan.assignments
+    starts = day_column(assignments, 'calculated_start_date')
+    ends = day_column(assignments, 'calculated_end_date')
+    today = np.datetime64(current_date, 'D')
+
+    # Asignaciones en curso a la fecha indicada (todas a la vez)
+    active = ~np.isnat(starts) & ~np.isnat(ends) & (starts <= today) & (today <= ends)
+    positions = np.flatnonzero(active)
+    if positions.size == 0:
+        return []
+
+    devs_assigned = value_column(assignments, 'devs_assigned')[positions].astype(float)
+    estimated_hours = value_column(assignments, 'estimated_hours')[positions]
+
+    days_elapsed = (today - starts[positions]).astype(np.int64)
+    total_days = (ends[positions] - starts[positions]).astype(np.int64) + 1
+
+    # Calcular horas trabajadas y restantes
+    # Asumimos 8 horas por dev por día
+    worked_hours = days_elapsed * (devs_assigned * 8)
+    remaining_hours = estimated_hours - worked_hours
+    progress_percentage = np.divide(
+        worked_hours * 100, estimated_hours,
+        out=np.zeros(len(positions)), where=estimated_hours > 0
+    )
+
+    return [
+        {
+            "assignment": assignments[i],
+            "days_elapsed": elapsed,
+            "total_days": total,
+            "worked_hours": worked,
+            "remaining_hours": remaining,
+            "progress_percentage": progress
+        }
+        for i, elapsed, total, worked, remaining, progress in zip(
+            positions.tolist(), days_elapsed.tolist(), total_days.tolist(),
+            worked_hours.tolist(), remaining_hours.tolist(), progress_percentage.tolist()
+        )
+    ]
+
+
+def get_remaining_hours_map(plan: Plan, current_date: date) -> Dict[Tuple[int, int, int], Any]:
+    """
+    Horas restantes de las asignaciones en curso de un plan.
+
+    Args:
+        plan: El plan a analizar.
+        current_date: La fecha actual.
+
+    Returns:
+        Un diccionario {(project_id, team_id, tier): horas_restantes}.
+    """
+    return {
+        (p['assignment'].project_id, p['assignment'].team_id, p['assignment'].tier): p['remaining_hours']
+        for p in get_active_assignments(plan, current_date)
+    }
+
+
+def get_plan_progress_overrides(simulation_input: SimulationInput, active_plan: Optional[Plan],
+                                current_date: date) -> Dict[int, Any]:
+    """
+    Horas estimadas reducidas según el progreso del plan activo, sin modificar el input.
+
+    Solo se incluyen las asignaciones cuyas horas restantes son menores que las estimadas.
+
+    Args:
+        simulation_input: Datos de simulación.
+        active_plan: Plan activo (o None).
+        current_date: La fecha actual.
+
+    Returns:
+        Un diccionario {assignment_id: horas_restantes} para usar como cambios de horas de un escenario.
+    """
+    if not active_plan:
+        return {}
+
+    progress_map = get_remaining_hours_map(active_plan, current_date)
+    if not progress_map:
+        return {}
+
+    logger.info(f"Progreso encontrado para {len(progress_map)} asignaciones activas.")
+
+    hours_overrides = {}
+    for assignment in simulation_input.assignments:
+        key = (assignment.project_id, assignment.team_id, assignment.tier)
+        if key in progress_map:
+            remaining_hours = progress_map[key]
+            if remaining_hours < assignment.estimated_hours:
+                logger.info(f"  - Ajustando asignación: Proyecto {assignment.project_name} (Tier {assignment.tier})")
+                logger.info(f"    Horas originales: {assignment.estimated_hours}, Horas restantes: {remaining_hours}")
+                hours_overrides[assignment.id] = remaining_hours
+
+    return hours_overrides
+
+
+def get_completed_phases(active_plan: Optional[Plan] = None) -> Dict[int, date]:
     """
     Recupera las fases que se consideran completadas basándose en el plan activo.
     Una fase se considera "completada" si su fecha de finalización calculada en el plan activo
     es anterior a la fecha actual.
 
+    Args:
+        active_plan: Plan activo ya cargado (opcional); si no se indica se lee de la DB.
+
+    Returns:
+        Un diccionario que mapea el ID de la asignación a su fecha de finalización.
+    """
+    if active_plan is None:
+        active_plan = get_active_plan()
+    return completed_phases_from_plan(active_plan, date.today())
+
+
+def completed_phases_from_plan(active_plan: Optional[Plan], today: date) -> Dict[int, date]:
+    """
+    Fases del plan cuya fecha de finalización calculada es anterior a la fecha indicada.
+
+    Args:
+        active_plan: Plan activo (o None).
+        today: Fecha de referencia.
+
     Returns:
         Un diccionario que mapea el ID de la asignación a su fecha de finalización.
     """
     completed_phases = {}
-    active_plan = get_active_plan()
     
     if not active_plan:
         logger.info("No hay un plan activo. No se anclarán fases completadas.")
         return completed_phases
 
-    today = date.today()
     logger.info(f"Buscando fases completadas en el plan activo '{active_plan.name}' (ID: {active_plan.id}) con fecha de hoy: {today}")
 
-    for assignment in active_plan.assignments:
-        if assignment.calculated_end_date and assignment.calculated_end_date < today:
-            completed_phases[assignment.assignment_id] = assignment.calculated_end_date
+    # Fases terminadas antes de hoy, calculadas sobre las columnas del snapshot
+    ends = day_column(active_plan.assignments, 'calculated_end_date')
+    finished = np.flatnonzero(~np.isnat(ends) & (ends < np.datetime64(today, 'D')))
+    if finished.size:
+        assignment_ids = value_column(active_plan.assignments, 'assignment_id')[finished].tolist()
+        completed_phases = dict(zip(assignment_ids, ends[finished].astype(object).tolist()))
     
     if completed_phases:
         logger.info(f"Se encontraron {len(completed_phases)} fases consideradas completadas según el plan activo.")
     else:
         logger.info("No se encontraron fases completadas en el plan activo para la fecha actual.")
         
-    return completed_phases
\ No newline at end of file
+    return completed_phases
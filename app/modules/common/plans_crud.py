@@ -5,12 +5,17 @@ Maneja guardado, recuperación y comparación de planes de simulación
 
 import logging
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 
+from .constants import EXPORT_BATCH_SIZE
 from .db import get_db_connection
+from .data_context import get_or_load, invalidate, ACTIVE_PLAN_KEY, PROJECTS_KEY, ASSIGNMENTS_KEY
 from .models import Plan, PlanAssignment, ScheduleResult, Assignment
+from .columnar import PlanAssignmentColumns
+from .plan_archive import get_archived_plan, list_archived_plans
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +43,7 @@ def save_plan(result: ScheduleResult, name: str = "", description: str = "",
     Raises:
         PlansError: Si hay error guardando el plan
     """
+    invalidate(ACTIVE_PLAN_KEY)
     try:
         # Crear plan desde resultado
         plan = Plan.from_schedule_result(result, name, description)
@@ -76,13 +82,14 @@ def save_plan(result: ScheduleResult, name: str = "", description: str = "",
                     plan_assignments.append(plan_assignment)
                 
                 if plan_assignments:
-                    cursor.executemany("""
+                    # INSERT multi-fila en lotes (executemany envía una sentencia por fila)
+                    execute_values(cursor, """
                         INSERT INTO plan_assignments (
                             plan_id, assignment_id, project_id, project_name, project_priority,
                             priority_order, team_id, team_name, tier, devs_assigned, estimated_hours,
                             calculated_start_date, calculated_end_date, pending_hours,
                             ready_to_start_date
-                        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                        ) VALUES %s
                     """, [
                         (
                             pa.plan_id, pa.assignment_id, pa.project_id, pa.project_name,
@@ -90,7 +97,7 @@ def save_plan(result: ScheduleResult, name: str = "", description: str = "",
                             pa.devs_assigned, pa.estimated_hours, pa.calculated_start_date,
                             pa.calculated_end_date, pa.pending_hours, pa.ready_to_start_date
                         ) for pa in plan_assignments
-                    ])
+                    ], page_size=1000)
                 
                 plan.assignments = plan_assignments
                 conn.commit()
@@ -103,12 +110,35 @@ def save_plan(result: ScheduleResult, name: str = "", description: str = "",
         raise PlansError(f"No se pudo guardar el plan: {e}")
 
 
-def get_active_plan() -> Optional[Plan]:
+def get_active_plan(raise_errors: bool = False) -> Optional[Plan]:
     """
-    Obtiene el plan actualmente activo
+    Obtiene el plan actualmente activo (una sola vez por rerun dentro de un data_scope)
+    
+    Un error de lectura no se guarda en el data_scope: el siguiente llamador vuelve a intentar.
+    
+    Args:
+        raise_errors: Relanzar los errores de la DB en lugar de devolver None
     
     Returns:
-        Plan activo o None si no hay ninguno activo
+        Plan activo o None si no hay ninguno activo (o hubo un error y raise_errors es False)
+    
+    Raises:
+        PlansError: Si hay error leyendo el plan y raise_errors es True
+    """
+    try:
+        return get_or_load(ACTIVE_PLAN_KEY, _load_active_plan)
+    except PlansError:
+        if raise_errors:
+            raise
+        return None
+
+
+def _load_active_plan() -> Optional[Plan]:
+    """
+    Lee el plan activo (sus asignaciones se leen al primer acceso)
+    
+    Raises:
+        PlansError: Si hay error leyendo el plan
     """
     try:
         with get_db_connection() as conn:
@@ -138,13 +168,13 @@ def get_active_plan() -> Optional[Plan]:
                     total_projects=row['total_projects']
                 )
                 
-                # Cargar asignaciones del plan
-                plan.assignments = _load_plan_assignments(cursor, plan.id)
+                # Asignaciones del plan: se leen al primer acceso a plan.assignments
+                plan.set_assignments_loader(partial(load_plan_assignments, plan.id))
                 return plan
                 
     except Exception as e:
         logger.error(f"Error obteniendo plan activo: {e}")
-        return None
+        raise PlansError(f"No se pudo leer el plan activo: {e}")
 
 
 def get_plan_by_id(plan_id: int) -> Optional[Plan]:
@@ -155,7 +185,7 @@ def get_plan_by_id(plan_id: int) -> Optional[Plan]:
         plan_id: ID del plan
     
     Returns:
-        Plan encontrado o None si no existe
+        Plan encontrado o None si no existe (las asignaciones se leen al primer acceso)
     """
     try:
         with get_db_connection() as conn:
@@ -169,7 +199,8 @@ def get_plan_by_id(plan_id: int) -> Optional[Plan]:
                 
                 row = cursor.fetchone()
                 if not row:
-                    return None
+                    # Los planes antiguos se mueven al archivo frío (solo lectura)
+                    return get_archived_plan(plan_id)
                 
                 plan = Plan(
                     id=row['id'],
@@ -183,8 +214,8 @@ def get_plan_by_id(plan_id: int) -> Optional[Plan]:
                     total_projects=row['total_projects']
                 )
                 
-                # Cargar asignaciones del plan
-                plan.assignments = _load_plan_assignments(cursor, plan.id)
+                # Asignaciones del plan: se leen al primer acceso a plan.assignments
+                plan.set_assignments_loader(partial(load_plan_assignments, plan.id))
                 
                 return plan
                 
@@ -262,6 +293,7 @@ def set_active_plan(plan_id: int) -> bool:
     Returns:
         True si se activó correctamente, False en caso contrario
     """
+    invalidate(ACTIVE_PLAN_KEY)
     try:
         with get_db_connection() as conn:
             with conn.cursor() as cursor:
@@ -287,16 +319,22 @@ def set_active_plan(plan_id: int) -> bool:
         return False
 
 
-def list_plans(limit: int = 50) -> List[Plan]:
+def list_plans(limit: int = 50, include_archived: bool = False) -> List[Plan]:
     """
     Lista todos los planes ordenados por fecha de creación (más recientes primero)
     
     Args:
         limit: Número máximo de planes a retornar
+        include_archived: Incluir los planes del archivo frío
     
     Returns:
         Lista de planes (sin asignaciones cargadas para eficiencia)
     """
+    if include_archived:
+        plans = list_plans(limit) + list_archived_plans()
+        plans.sort(key=lambda p: p.created_at or datetime.min, reverse=True)
+        return plans[:limit]
+    
     try:
         with get_db_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cursor:
@@ -330,6 +368,34 @@ def list_plans(limit: int = 50) -> List[Plan]:
         return []
 
 
+def list_plans_created_before(cutoff: datetime) -> List[Plan]:
+    """
+    Lista los planes creados antes de una fecha (más antiguos primero, sin asignaciones)
+    
+    Args:
+        cutoff: Fecha y hora límite
+    
+    Returns:
+        Lista de planes
+    """
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                cursor.execute("""
+                    SELECT id, name, description, checksum, created_at, is_active,
+                           simulation_date, total_assignments, total_projects
+                    FROM plans 
+                    WHERE created_at < %s
+                    ORDER BY created_at
+                """, (cutoff,))
+                
+                return [Plan(**row) for row in cursor.fetchall()]
+                
+    except Exception as e:
+        logger.error(f"Error listando planes anteriores a {cutoff}: {e}")
+        return []
+
+
 def delete_plan(plan_id: int) -> bool:
     """
     Elimina un plan y todas sus asignaciones
@@ -340,6 +406,7 @@ def delete_plan(plan_id: int) -> bool:
     Returns:
         True si se eliminó correctamente, False en caso contrario
     """
+    invalidate(ACTIVE_PLAN_KEY)
     try:
         with get_db_connection() as conn:
             with conn.cursor() as cursor:
@@ -359,43 +426,126 @@ def delete_plan(plan_id: int) -> bool:
         return False
 
 
-def _load_plan_assignments(cursor, plan_id: int) -> List[PlanAssignment]:
-    """Carga las asignaciones de un plan (función auxiliar)"""
-    cursor.execute("""
-        SELECT id, plan_id, assignment_id, project_id, project_name, project_priority,
-               priority_order, team_id, team_name, tier, devs_assigned, estimated_hours,
-               calculated_start_date, calculated_end_date, pending_hours,
-               ready_to_start_date
-        FROM plan_assignments 
-        WHERE plan_id = %s
-        ORDER BY calculated_start_date, COALESCE(priority_order, project_priority), assignment_id
-    """, (plan_id,))
-    
-    assignments = []
-    for row in cursor.fetchall():
-        assignment = PlanAssignment(
-            id=row['id'],
-            plan_id=row['plan_id'],
-            assignment_id=row['assignment_id'],
-            project_id=row['project_id'],
-            project_name=row['project_name'],
-            project_priority=row['project_priority'],
-            priority_order=row['priority_order'],
-            team_id=row['team_id'],
-            team_name=row['team_name'],
-            tier=row['tier'],
-            devs_assigned=row['devs_assigned'],
-            estimated_hours=row['estimated_hours'],
-            calculated_start_date=row['calculated_start_date'],
-            calculated_end_date=row['calculated_end_date'],
-            pending_hours=row['pending_hours'],
-            ready_to_start_date=row['ready_to_start_date']
-        )
-        assignments.append(assignment)
+# Asignaciones de un plan en el orden en que se muestran y se anclan
+_PLAN_ASSIGNMENTS_QUERY = """
+    SELECT id, plan_id, assignment_id, project_id, project_name, project_priority,
+           priority_order, team_id, team_name, tier, devs_assigned, estimated_hours,
+           calculated_start_date, calculated_end_date, pending_hours,
+           ready_to_start_date
+    FROM plan_assignments 
+    WHERE plan_id = %s
+    ORDER BY calculated_start_date, COALESCE(priority_order, project_priority), assignment_id
+"""
+
+
+def iter_plan_assignment_rows(plan_ids: Optional[List[int]] = None,
+                              batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    Recorre las asignaciones guardadas de uno o varios planes con un cursor del servidor
+    
+    Las filas se traen de a `batch_size`, por lo que la memoria usada no depende de la
+    cantidad de planes exportados. La conexión queda tomada hasta agotar o cerrar el generador.
+    
+    Args:
+        plan_ids: IDs de los planes a recorrer (None = todos los planes)
+        batch_size: Filas pedidas al servidor en cada viaje
     
+    Yields:
+        Diccionario por asignación, con el nombre y la fecha de creación de su plan
+    
+    Raises:
+        PlansError: Si hay error leyendo los planes
+    """
+    where = "WHERE pa.plan_id = ANY(%s)" if plan_ids is not None else ""
+    params = (list(plan_ids),) if plan_ids is not None else ()
+    query = f"""
+        SELECT pa.plan_id, p.name AS plan_name, p.created_at AS plan_created_at,
+               pa.id, pa.assignment_id, pa.project_id, pa.project_name, pa.project_priority,
+               pa.priority_order, pa.team_id, pa.team_name, pa.tier, pa.devs_assigned,
+               pa.estimated_hours, pa.calculated_start_date, pa.calculated_end_date,
+               pa.pending_hours, pa.ready_to_start_date
+        FROM plan_assignments pa
+        JOIN plans p ON p.id = pa.plan_id
+        {where}
+        ORDER BY pa.plan_id, pa.calculated_start_date,
+                 COALESCE(pa.priority_order, pa.project_priority), pa.assignment_id
+    """
+    for batch in _stream_row_batches("plan_assignments_export", query, params, batch_size):
+        yield from batch
+
+
+def iter_plan_assignments(plan_id: int, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[PlanAssignment]:
+    """
+    Recorre las asignaciones de un plan guardado sin cargarlas todas en memoria
+    
+    Usa un cursor del servidor: solo hay `batch_size` filas en memoria a la vez. Los planes
+    archivados no están en la DB; para ellos usar plan.assignments.
+    
+    Args:
+        plan_id: ID del plan
+        batch_size: Filas pedidas al servidor en cada viaje
+    
+    Yields:
+        PlanAssignment por fila, en el orden del plan
+    
+    Raises:
+        PlansError: Si hay error leyendo el plan
+    """
+    for batch in _stream_row_batches("plan_assignments_iter", _PLAN_ASSIGNMENTS_QUERY, (plan_id,), batch_size):
+        for row in batch:
+            yield PlanAssignment(**row)
+
+
+def load_plan_assignments(plan_id: int, batch_size: int = EXPORT_BATCH_SIZE) -> PlanAssignmentColumns:
+    """
+    Carga las asignaciones de un plan en columnas (carga diferida de Plan.assignments)
+    
+    Cada lote del cursor del servidor se convierte en columnas antes de pedir el siguiente,
+    por lo que las filas como diccionarios nunca están todas en memoria a la vez.
+    
+    Args:
+        plan_id: ID del plan
+        batch_size: Filas pedidas al servidor en cada viaje
+    
+    Returns:
+        PlanAssignmentColumns: Asignaciones del plan
+    
+    Raises:
+        PlansError: Si hay error leyendo el plan
+    """
+    batches = [
+        PlanAssignmentColumns.from_dicts(batch)
+        for batch in _stream_row_batches("plan_assignments_load", _PLAN_ASSIGNMENTS_QUERY, (plan_id,), batch_size)
+    ]
+    assignments = PlanAssignmentColumns.concat(batches)
+    logger.debug(f"Cargadas {len(assignments)} asignaciones del plan {plan_id}")
     return assignments
 
 
+def _stream_row_batches(cursor_name: str, query: str, params: tuple,
+                        batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Ejecuta una consulta con un cursor del servidor (cursor con nombre) y devuelve las filas por lotes
+    
+    La conexión queda tomada hasta agotar o cerrar el generador.
+    
+    Raises:
+        PlansError: Si hay error leyendo de la DB
+    """
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor(name=cursor_name, cursor_factory=RealDictCursor) as cursor:
+                cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield rows
+    except psycopg2.Error as e:
+        logger.error(f"Error recorriendo asignaciones de planes: {e}")
+        raise PlansError(f"No se pudieron leer las asignaciones de los planes: {e}")
+
+
 def _analyze_detailed_changes(result: ScheduleResult, active_plan: Plan, comparison: Dict[str, Any]):
     """Analiza cambios detallados entre resultado y plan activo (función auxiliar)"""
     try:
@@ -432,6 +582,7 @@ def apply_plan_priorities(plan_id: int) -> bool:
     Returns:
         True si se aplicaron correctamente, False en caso contrario
     """
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
     try:
         plan = get_plan_by_id(plan_id)
         if not plan:
@@ -439,26 +590,21 @@ def apply_plan_priorities(plan_id: int) -> bool:
             return False
         
         # Extraer prioridades únicas por proyecto del plan
-        project_priorities = {}
-        for assignment in plan.assignments:
-            if assignment.priority_order is not None:
-                project_priorities[assignment.project_id] = assignment.priority_order
-            else:
-                project_priorities[assignment.project_id] = assignment.project_priority
+        project_priorities = _plan_priorities(plan)
         
         if not project_priorities:
             logger.warning(f"Plan {plan_id} no tiene prioridades para aplicar")
             return True
         
-        # Aplicar prioridades a la tabla de proyectos
+        # Aplicar prioridades a la tabla de proyectos en una sola sentencia
         with get_db_connection() as conn:
             with conn.cursor() as cursor:
-                for project_id, priority in project_priorities.items():
-                    cursor.execute("""
-                        UPDATE projects 
-                        SET priority = %s 
-                        WHERE id = %s AND active = true
-                    """, (priority, project_id))
+                execute_values(cursor, """
+                    UPDATE projects AS p
+                    SET priority = v.priority
+                    FROM (VALUES %s) AS v(id, priority)
+                    WHERE p.id = v.id AND p.active = true
+                """, list(project_priorities.items()), page_size=len(project_priorities))
                 
                 conn.commit()
                 logger.info(f"Prioridades del plan {plan_id} aplicadas a {len(project_priorities)} proyectos")
@@ -507,6 +653,7 @@ def deactivate_plan(plan_id: int) -> bool:
     Returns:
         True si se desactivó correctamente, False en caso contrario
     """
+    invalidate(ACTIVE_PLAN_KEY)
     try:
         with get_db_connection() as conn:
             with conn.cursor() as cursor:
@@ -543,15 +690,24 @@ def get_plan_priorities(plan_id: int) -> Dict[int, int]:
         if not plan:
             return {}
         
-        priorities = {}
-        for assignment in plan.assignments:
-            if assignment.priority_order is not None:
-                priorities[assignment.project_id] = assignment.priority_order
-            else:
-                priorities[assignment.project_id] = assignment.project_priority
-        
-        return priorities
+        return _plan_priorities(plan)
         
     except Exception as e:
         logger.error(f"Error obteniendo prioridades del plan {plan_id}: {e}")
-        return {}
\ No newline at end of file
+        return {}
+
+
+def _plan_priorities(plan: Plan) -> Dict[int, int]:
+    """Prioridad de cada proyecto en un plan, recorriendo sus asignaciones por lotes si están en la DB"""
+    if plan.assignments_loaded or plan.archived:
+        assignments = plan.assignments
+    else:
+        assignments = iter_plan_assignments(plan.id)
+    
+    priorities = {}
+    for assignment in assignments:
+        if assignment.priority_order is not None:
+            priorities[assignment.project_id] = assignment.priority_order
+        else:
+            priorities[assignment.project_id] = assignment.project_priority
+    return priorities
@@ -121,4 +121,4 @@ def sort_by_plan_priority(items: List, plan_priorities: Dict[int, int] = None) -
     def key_func(item):
         return get_effective_priority_with_plan(item, plan_priorities)
     
-    return sorted(items, key=key_func)
\ No newline at end of file
+    return sorted(items, key=key_func)
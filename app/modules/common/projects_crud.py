@@ -4,13 +4,15 @@ Operaciones directas con DB optimizadas
 """
 
 import sqlalchemy as sa
-from typing import Dict, Optional
-from .db import engine, projects_table
-from .models import Project
+from typing import Dict, List, Optional
+from .db import engine, projects_table, bulk_update_rows
+from .models import Project, Assignment
+from .data_context import get_or_load, invalidate, PROJECTS_KEY, ASSIGNMENTS_KEY
 
 
 def create_project(project: Project) -> int:
     """Crear project en DB"""
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
     with engine.begin() as conn:
         result = conn.execute(
             projects_table.insert().values(
@@ -58,7 +60,12 @@ def read_project(project_id: int) -> Optional[Project]:
 
 
 def read_all_projects() -> Dict[int, Project]:
-    """Leer todos los projects desde DB con assignments para cálculos dinámicos"""
+    """Leer todos los projects desde DB con horas estimadas para cálculos dinámicos (una vez por rerun)"""
+    return get_or_load(PROJECTS_KEY, _load_all_projects)
+
+
+def _load_all_projects() -> Dict[int, Project]:
+    """Lee todos los projects con sus horas estimadas totales para cálculos dinámicos"""
     with engine.begin() as conn:
         results = conn.execute(
             sa.select(
@@ -73,6 +80,9 @@ def read_all_projects() -> Dict[int, Project]:
             ).order_by(projects_table.c.priority)
         ).fetchall()
         
+        # Horas estimadas de todos los proyectos en una consulta (en lugar de una por proyecto)
+        hours_by_project = _load_estimated_hours_by_project(conn)
+        
         projects = {}
         for row in results:
             project = Project(
@@ -83,74 +93,80 @@ def read_all_projects() -> Dict[int, Project]:
                 due_date_wo_qa=row.due_date_wo_qa,
                 due_date_with_qa=row.due_date_with_qa,
                 active=bool(row.active) if row.active is not None else True,
-                fecha_inicio_real=row.fecha_inicio_real
+                fecha_inicio_real=row.fecha_inicio_real,
+                estimated_hours_total=hours_by_project.get(row.id, 0)
             )
-            
-            # Cargar assignments para cálculos dinámicos
-            _load_project_assignments(project, conn)
             projects[row.id] = project
         
         return projects
 
 
-def _load_project_assignments(project: Project, conn):
-    """Carga los assignments de un proyecto para cálculos dinámicos"""
+def _load_estimated_hours_by_project(conn) -> Dict[int, int]:
+    """
+    Horas estimadas totales por proyecto en una sola consulta agregada
+
+    Usa custom_estimated_hours cuando está cargado (y no es 0), sino estimated_hours.
+    """
     from .db import project_team_assignments_table
-    
-    assignment_results = conn.execute(
-        sa.select(
-            project_team_assignments_table.c.estimated_hours,
-            project_team_assignments_table.c.custom_estimated_hours,
-            project_team_assignments_table.c.devs_assigned
-        ).where(project_team_assignments_table.c.project_id == project.id)
+
+    pta = project_team_assignments_table
+    effective_hours = sa.func.coalesce(sa.func.nullif(pta.c.custom_estimated_hours, 0), pta.c.estimated_hours)
+    results = conn.execute(
+        sa.select(pta.c.project_id, sa.func.sum(effective_hours).label("total_hours"))
+        .group_by(pta.c.project_id)
     ).fetchall()
-    
-    # Crear objetos Assignment simplificados para cálculos
-    from .models import Assignment
-    assignments = []
-    for row in assignment_results:
-        # Usar custom_estimated_hours si está disponible, sino estimated_hours
-        effective_hours = row.custom_estimated_hours if row.custom_estimated_hours else row.estimated_hours
-        
-        assignment = Assignment(
-            id=0,  # No necesario para cálculos
-            project_id=project.id,
-            project_name=project.name,
-            project_priority=project.priority,
-            team_id=0,  # No necesario para cálculos
-            team_name="",
-            tier=1,
-            devs_assigned=row.devs_assigned,
-            max_devs=row.devs_assigned,
-            estimated_hours=effective_hours,
-            ready_to_start_date=project.start_date,
-            assignment_start_date=project.start_date
-        )
-        assignments.append(assignment)
-    
-    project.set_assignments(assignments)
+    return {row.project_id: int(row.total_hours or 0) for row in results}
 
 
 def update_project(project: Project):
     """Actualizar project en DB"""
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
     with engine.begin() as conn:
-        conn.execute(
-            projects_table.update()
-            .where(projects_table.c.id == project.id)
-            .values(
-                name=project.name,
-                priority=project.priority,
-                start_date=project.start_date,
-                due_date_wo_qa=project.due_date_wo_qa,
-                due_date_with_qa=project.due_date_with_qa,
-                active=project.active,
-                fecha_inicio_real=project.fecha_inicio_real
-            )
+        _update_project(conn, project)
+
+
+def _update_project(conn, project: Project):
+    """Actualiza project dentro de una transacción existente"""
+    conn.execute(
+        projects_table.update()
+        .where(projects_table.c.id == project.id)
+        .values(
+            name=project.name,
+            priority=project.priority,
+            start_date=project.start_date,
+            due_date_wo_qa=project.due_date_wo_qa,
+            due_date_with_qa=project.due_date_with_qa,
+            active=project.active,
+            fecha_inicio_real=project.fecha_inicio_real
         )
+    )
+
+
+def apply_project_edit(project: Project, changed_assignments: List[Assignment]) -> List[Assignment]:
+    """
+    Aplica la edición completa de un proyecto en una sola transacción:
+    datos del proyecto más un único UPDATE para todas sus asignaciones modificadas
+    
+    Args:
+        project: Proyecto con los valores nuevos
+        changed_assignments: Asignaciones del proyecto ya modificadas
+    
+    Returns:
+        Asignaciones actualizadas tal como quedaron en DB
+    """
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
+    from .assignments_crud import _update_assignments
+    
+    with engine.begin() as conn:
+        _update_project(conn, project)
+        if not changed_assignments:
+            return []
+        return _update_assignments(conn, changed_assignments, returning=True)
 
 
 def delete_project(project_id: int):
     """Borrar project de DB"""
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
     with engine.begin() as conn:
         conn.execute(
             projects_table.delete()
@@ -160,6 +176,7 @@ def delete_project(project_id: int):
 
 def delete_project_by_name(project_name: str) -> bool:
     """Borrar project por nombre, incluyendo sus asignaciones"""
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
     from .assignments_crud import delete_assignments_by_project
     
     with engine.begin() as conn:
@@ -225,6 +242,30 @@ def read_all_projects_with_plan_priorities() -> Dict[int, Project]:
     return projects
 
 
+def update_project_priorities(priorities: Dict[int, int], only_active: bool = False) -> int:
+    """
+    Actualiza la prioridad de muchos proyectos en una sola sentencia
+    
+    Args:
+        priorities: Diccionario {project_id: nueva_prioridad}
+        only_active: Si solo actualizar proyectos activos
+    
+    Returns:
+        Cantidad de proyectos actualizados
+    """
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
+    if not priorities:
+        return 0
+    
+    with engine.begin() as conn:
+        return bulk_update_rows(
+            conn,
+            projects_table,
+            [{"id": project_id, "priority": priority} for project_id, priority in priorities.items()],
+            where=projects_table.c.active.is_(True) if only_active else None
+        )
+
+
 def update_project_priority_from_plan(project_id: int, new_priority: int):
     """
     Actualiza la prioridad de un proyecto específico
@@ -233,6 +274,7 @@ def update_project_priority_from_plan(project_id: int, new_priority: int):
         project_id: ID del proyecto
         new_priority: Nueva prioridad
     """
+    invalidate(PROJECTS_KEY, ASSIGNMENTS_KEY)
     with engine.begin() as conn:
         conn.execute(
             projects_table.update()
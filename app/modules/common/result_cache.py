@@ -0,0 +1,118 @@
+"""
+Caché compartida de resultados calculados (pronóstico base)
+Las entradas se indexan por la huella de los datos de la DB, por lo que un cambio
+en proyectos, asignaciones, teams o plan activo produce una clave nueva
+"""
+
+import logging
+import threading
+from datetime import date
+from typing import Any, Callable, Dict, Hashable
+
+import sqlalchemy as sa
+
+from .cache_utils import LRUCache
+from .constants import RESULT_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+FORECAST_KEY = "forecast"
+SIMULATION_INPUT_KEY = "simulation_input"
+
+_result_cache = LRUCache(maxsize=RESULT_CACHE_MAX_ENTRIES)
+
+# Cálculos en curso por clave (single-flight): los pedidos concurrentes esperan al primero
+_inflight: Dict[Hashable, threading.Event] = {}
+_inflight_lock = threading.Lock()
+
+# Huella de todas las tablas que alimentan la simulación (son tablas pequeñas)
+_DATA_FINGERPRINT_SQL = sa.text("""
+    SELECT md5(
+      (SELECT COALESCE(string_agg(t::text, '|' ORDER BY t.id), '') FROM projects t) || '#' ||
+      (SELECT COALESCE(string_agg(t::text, '|' ORDER BY t.id), '') FROM teams t) || '#' ||
+      (SELECT COALESCE(string_agg(t::text, '|' ORDER BY t.id), '') FROM project_team_assignments t) || '#' ||
+      (SELECT COALESCE(string_agg(t::text, '|' ORDER BY t.id), '') FROM tier_capacity t) || '#' ||
+      (SELECT COALESCE(string_agg(t.id::text, '|' ORDER BY t.id), '') FROM plans t WHERE t.is_active)
+    )
+""")
+
+
+def get_data_fingerprint(engine=None) -> str:
+    """
+    Calcula la huella de los datos que usa la simulación
+
+    Incluye la fecha actual: el pronóstico depende del día aunque los datos no cambien.
+
+    Args:
+        engine: Engine de SQLAlchemy (por defecto el de db.py)
+
+    Returns:
+        str: Huella de los datos
+    """
+    if engine is None:
+        from .db import engine
+
+    with engine.connect() as conn:
+        digest = conn.execute(_DATA_FINGERPRINT_SQL).scalar()
+    return f"{date.today().isoformat()}:{digest}"
+
+
+def get_cached_result(key: Hashable, default: Any = None) -> Any:
+    """Obtiene un resultado publicado"""
+    return _result_cache.get(key, default)
+
+
+def publish_result(key: Hashable, value: Any) -> None:
+    """Publica un resultado para todas las sesiones del proceso"""
+    _result_cache.set(key, value)
+
+
+def get_or_compute(key: Hashable, compute: Callable[[], Any]) -> Any:
+    """
+    Obtiene un resultado publicado o lo calcula y lo publica
+
+    Si varios hilos piden la misma clave a la vez, solo el primero calcula;
+    el resto espera y recibe el mismo resultado.
+
+    Args:
+        key: Clave del resultado (debe incluir la huella de los datos)
+        compute: Función que calcula el resultado
+
+    Returns:
+        El resultado cacheado o recién calculado
+    """
+    value = _result_cache.get(key)
+    if value is not None:
+        return value
+
+    with _inflight_lock:
+        event = _inflight.get(key)
+        is_leader = event is None
+        if is_leader:
+            event = _inflight[key] = threading.Event()
+
+    if not is_leader:
+        event.wait()
+        value = _result_cache.get(key)
+        if value is not None:
+            return value
+        # El cálculo del primer pedido falló: calcular sin compartir
+        logger.warning(f"Cálculo compartido fallido para {key!r}, recalculando")
+        return compute()
+
+    try:
+        # Otro hilo pudo publicar el resultado entre la consulta y el registro
+        value = _result_cache.get(key)
+        if value is None:
+            value = compute()
+            _result_cache.set(key, value)
+        return value
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        event.set()
+
+
+def clear_result_cache() -> None:
+    """Vacía la caché de resultados"""
+    _result_cache.clear()
@@ -0,0 +1,92 @@
+"""
+Escenarios de simulación como capas sobre un SimulationInput compartido
+Los cambios (prioridades, horas, capacidad) se guardan aparte y se aplican al leer,
+sin modificar ni copiar el input base
+"""
+
+import logging
+from collections import ChainMap
+from dataclasses import replace
+from datetime import date
+from typing import Dict, List, Optional
+
+from .models import Assignment, Project, SimulationInput, Team
+
+logger = logging.getLogger(__name__)
+
+
+class ScenarioOverlay:
+    """
+    Vista de solo lectura de un SimulationInput con cambios aplicados (copy-on-write)
+
+    Expone la misma interfaz que SimulationInput (teams, projects, assignments, ...),
+    por lo que el scheduler y las vistas lo usan sin cambios. Crear un escenario cuesta
+    O(cambios): solo se copian los proyectos y teams modificados; el resto se lee del base.
+    La base puede ser otro ScenarioOverlay.
+    """
+
+    def __init__(self, base: SimulationInput,
+                 priority_overrides: Optional[Dict[int, int]] = None,
+                 hours_overrides: Optional[Dict[int, int]] = None,
+                 capacity_overrides: Optional[Dict[int, int]] = None,
+                 simulation_start_date: Optional[date] = None):
+        """
+        Args:
+            base: Input compartido (no se modifica)
+            priority_overrides: {project_id: nueva_prioridad}
+            hours_overrides: {assignment_id: nuevas_horas_estimadas}
+            capacity_overrides: {team_id: nuevo_total_devs}
+            simulation_start_date: Fecha de inicio de la simulación (por defecto la del base)
+        """
+        self.base = base
+        self.priority_overrides = {
+            project_id: priority for project_id, priority in (priority_overrides or {}).items()
+            if project_id in base.projects
+        }
+        self.hours_overrides = dict(hours_overrides or {})
+        self.capacity_overrides = {
+            team_id: devs for team_id, devs in (capacity_overrides or {}).items()
+            if team_id in base.teams
+        }
+        self.simulation_start_date = simulation_start_date or base.simulation_start_date
+
+        self.projects: ChainMap[int, Project] = ChainMap(
+            {project_id: replace(base.projects[project_id], priority=priority)
+             for project_id, priority in self.priority_overrides.items()},
+            base.projects,
+        )
+        self.teams: ChainMap[int, Team] = ChainMap(
+            {team_id: replace(base.teams[team_id], total_devs=devs)
+             for team_id, devs in self.capacity_overrides.items()},
+            base.teams,
+        )
+        self._assignments: Optional[List[Assignment]] = None
+
+    @property
+    def assignments(self) -> List[Assignment]:
+        """Asignaciones del base con prioridad de proyecto y horas del escenario (se arma al primer acceso)"""
+        if self._assignments is None:
+            if not self.priority_overrides and not self.hours_overrides:
+                self._assignments = self.base.assignments
+            else:
+                self._assignments = [self._overlay_assignment(a) for a in self.base.assignments]
+        return self._assignments
+
+    def _overlay_assignment(self, assignment: Assignment) -> Assignment:
+        """Copia de la asignación con los cambios del escenario (o la misma si no cambia)"""
+        changes = {}
+        if assignment.project_id in self.priority_overrides:
+            changes['project_priority'] = self.priority_overrides[assignment.project_id]
+        if assignment.id in self.hours_overrides:
+            changes['estimated_hours'] = self.hours_overrides[assignment.id]
+        return replace(assignment, **changes) if changes else assignment
+
+    def __getattr__(self, name):
+        # Atributos no modificables por el escenario (active_plan, completed_phases, ...)
+        if name == "base":
+            raise AttributeError(name)
+        return getattr(self.base, name)
+
+    def __repr__(self) -> str:
+        return (f"ScenarioOverlay(priorities={len(self.priority_overrides)}, "
+                f"hours={len(self.hours_overrides)}, capacity={len(self.capacity_overrides)})")
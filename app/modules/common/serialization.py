@@ -0,0 +1,362 @@
+"""
+Serialización binaria de inputs y resultados de simulación
+Formato versionado en columnas para moverlos entre procesos (cachés, workers, CLI)
+
+Estructura del archivo (little-endian):
+    prefijo   magic b"APEB", versión uint16, reservado uint16, largo del encabezado uint32
+    encabezado JSON (UTF-8): tipo de contenido, metadatos y, por tabla, el tipo de cada columna,
+              su offset y tamaño, y los valores únicos de las columnas de texto
+    datos     arrays de cada columna, alineados a 8 bytes
+
+Al leer, las columnas son vistas de NumPy sobre el buffer (sin copiar), por lo que un archivo
+abierto con read_file() solo se carga de disco a medida que se accede a sus columnas.
+"""
+
+import json
+import logging
+import mmap
+import struct
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+from .columnar import (
+    AssignmentColumns, ColumnarTable, PlanAssignmentColumns, ProjectColumns, ScheduleColumns, TeamColumns,
+)
+from .constants import SERIALIZATION_FORMAT_VERSION
+from .models import Assignment, Plan, Project, ScheduleResult, ScheduledAssignment, SimulationInput, Team
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"APEB"
+_PREFIX = struct.Struct("<4sHHI")
+_ALIGNMENT = 8
+
+KIND_SIMULATION_INPUT = "simulation_input"
+KIND_SCHEDULE_RESULT = "schedule_result"
+
+
+class SerializationError(ValueError):
+    """Datos que no están en el formato binario de APE o en una versión no soportada"""
+
+
+class _TierCapacityColumns(ColumnarTable):
+    ROW_NAME = "TierCapacity"
+    INT_COLUMNS = ("team_id", "tier", "hours_per_person")
+    COLUMNS = ("team_id", "tier", "hours_per_person")
+
+
+class _CompletedPhaseColumns(ColumnarTable):
+    ROW_NAME = "CompletedPhase"
+    INT_COLUMNS = ("assignment_id",)
+    DATE_COLUMNS = ("end_date",)
+    COLUMNS = ("assignment_id", "end_date")
+
+
+class _ProjectSummaryColumns(ColumnarTable):
+    ROW_NAME = "ProjectSummary"
+    INT_COLUMNS = ("project_id", "priority")
+    DATE_COLUMNS = ("calculated_start_date", "calculated_end_date")
+    TEXT_COLUMNS = ("project_name",)
+    COLUMNS = ("project_id", "project_name", "priority", "calculated_start_date", "calculated_end_date")
+
+
+# Tipos de tabla que pueden aparecer en un archivo (el nombre se guarda en el encabezado)
+_TABLE_TYPES = {
+    cls.__name__: cls for cls in (
+        TeamColumns, ProjectColumns, AssignmentColumns, ScheduleColumns, PlanAssignmentColumns,
+        _TierCapacityColumns, _CompletedPhaseColumns, _ProjectSummaryColumns,
+    )
+}
+
+
+@dataclass
+class SerializedTables:
+    """Contenido de un archivo sin materializar objetos: tablas en columnas sobre el buffer"""
+    kind: str
+    meta: Dict[str, Any]
+    tables: Dict[str, ColumnarTable]
+
+
+def _pad(buffer: bytearray) -> None:
+    buffer.extend(b"\0" * (-len(buffer) % _ALIGNMENT))
+
+
+def _encode(kind: str, meta: Dict[str, Any], tables: Dict[str, ColumnarTable]) -> bytes:
+    """
+    Escribe tablas en columnas y metadatos en el formato binario
+
+    Args:
+        kind: Tipo de contenido (KIND_SIMULATION_INPUT o KIND_SCHEDULE_RESULT)
+        meta: Metadatos serializables en JSON
+        tables: Tablas a escribir por nombre
+
+    Returns:
+        bytes: Contenido del archivo
+    """
+    data = bytearray()
+    table_headers = {}
+    for table_name, table in tables.items():
+        columns = {}
+        for name in table.COLUMNS:
+            array = np.ascontiguousarray(table.arrays[name])
+            array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+            _pad(data)
+            columns[name] = [array.dtype.str, len(data), array.nbytes]
+            data.extend(array.tobytes())
+        table_headers[table_name] = {
+            "type": type(table).__name__,
+            "length": len(table),
+            "columns": columns,
+            "categories": table.categories,
+        }
+
+    header = json.dumps(
+        {"kind": kind, "meta": meta, "tables": table_headers}, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+    header += b" " * (-(len(header) + _PREFIX.size) % _ALIGNMENT)
+    return _PREFIX.pack(MAGIC, SERIALIZATION_FORMAT_VERSION, 0, len(header)) + header + bytes(data)
+
+
+def load_tables(data: Union[bytes, bytearray, memoryview, mmap.mmap]) -> SerializedTables:
+    """
+    Lee un archivo en formato binario sin copiar sus columnas
+
+    Las tablas devueltas son vistas de solo lectura sobre `data`, que debe mantenerse
+    sin modificar mientras se usen.
+
+    Args:
+        data: Contenido del archivo
+
+    Returns:
+        SerializedTables: Tipo de contenido, metadatos y tablas en columnas
+
+    Raises:
+        SerializationError: Si el contenido no está en el formato o la versión es posterior a la soportada
+    """
+    view = memoryview(data)
+    if len(view) < _PREFIX.size:
+        raise SerializationError("Contenido demasiado corto para el formato binario de APE")
+    magic, version, _, header_length = _PREFIX.unpack_from(view)
+    if magic != MAGIC:
+        raise SerializationError("El contenido no está en el formato binario de APE")
+    if version > SERIALIZATION_FORMAT_VERSION:
+        raise SerializationError(
+            f"Versión de formato {version} no soportada (máxima: {SERIALIZATION_FORMAT_VERSION})"
+        )
+
+    data_start = _PREFIX.size + header_length
+    try:
+        header = json.loads(bytes(view[_PREFIX.size:data_start]).decode("utf-8"))
+    except ValueError as e:
+        raise SerializationError(f"Encabezado inválido: {e}")
+
+    tables = {}
+    for table_name, spec in header["tables"].items():
+        table_type = _TABLE_TYPES.get(spec["type"])
+        if table_type is None:
+            raise SerializationError(f"Tipo de tabla desconocido: {spec['type']}")
+        length = spec["length"]
+        columns = {}
+        for name, (dtype, offset, nbytes) in spec["columns"].items():
+            if data_start + offset + nbytes > len(view):
+                raise SerializationError(f"Columna '{table_name}.{name}' fuera del contenido")
+            columns[name] = np.frombuffer(view, dtype=np.dtype(dtype), count=length, offset=data_start + offset)
+        missing = set(table_type.COLUMNS) - set(columns)
+        if missing:
+            raise SerializationError(f"Faltan columnas en '{table_name}': {sorted(missing)}")
+        tables[table_name] = table_type(columns, spec["categories"], length)
+
+    return SerializedTables(kind=header["kind"], meta=header["meta"], tables=tables)
+
+
+def _date_or_none(value: Optional[str]) -> Optional[date]:
+    return date.fromisoformat(value) if value else None
+
+
+def _plan_meta(plan: Plan) -> Dict[str, Any]:
+    """Metadatos de un plan (sin asignaciones) para el encabezado"""
+    return {
+        "id": plan.id,
+        "name": plan.name,
+        "description": plan.description,
+        "checksum": plan.checksum,
+        "created_at": plan.created_at.isoformat() if plan.created_at else None,
+        "is_active": plan.is_active,
+        "simulation_date": plan.simulation_date.isoformat() if plan.simulation_date else None,
+        "total_assignments": plan.total_assignments,
+        "total_projects": plan.total_projects,
+    }
+
+
+def _plan_from_meta(meta: Dict[str, Any], assignments: ColumnarTable) -> Plan:
+    """Reconstruye un plan; sus asignaciones quedan en columnas sobre el buffer"""
+    return Plan(
+        id=meta["id"],
+        name=meta["name"],
+        description=meta["description"],
+        checksum=meta["checksum"],
+        created_at=datetime.fromisoformat(meta["created_at"]) if meta["created_at"] else None,
+        is_active=meta["is_active"],
+        simulation_date=_date_or_none(meta["simulation_date"]),
+        total_assignments=meta["total_assignments"],
+        total_projects=meta["total_projects"],
+        assignments=assignments,
+    )
+
+
+def dumps_input(simulation_input: SimulationInput) -> bytes:
+    """
+    Serializa un SimulationInput (o un ScenarioOverlay, que se guarda con sus cambios aplicados)
+
+    Args:
+        simulation_input: Input de la simulación
+
+    Returns:
+        bytes: Contenido en formato binario
+    """
+    teams = list(simulation_input.teams.values())
+    active_plan = simulation_input.active_plan
+    completed_phases = simulation_input.completed_phases or {}
+
+    tables = {
+        "teams": TeamColumns.from_records(teams),
+        "tier_capacities": _TierCapacityColumns.from_dicts(
+            {"team_id": team.id, "tier": tier, "hours_per_person": hours}
+            for team in teams for tier, hours in (team.tier_capacities or {}).items()
+        ),
+        "projects": ProjectColumns.from_records(simulation_input.projects.values()),
+        "assignments": AssignmentColumns.from_records(simulation_input.assignments),
+        "completed_phases": _CompletedPhaseColumns.from_dicts(
+            {"assignment_id": assignment_id, "end_date": end_date}
+            for assignment_id, end_date in completed_phases.items()
+        ),
+    }
+    if active_plan is not None:
+        plan_assignments = active_plan.assignments
+        if not isinstance(plan_assignments, PlanAssignmentColumns):
+            plan_assignments = PlanAssignmentColumns.from_records(plan_assignments)
+        tables["active_plan_assignments"] = plan_assignments
+
+    meta = {
+        "simulation_start_date": simulation_input.simulation_start_date.isoformat(),
+        "active_plan": _plan_meta(active_plan) if active_plan is not None else None,
+    }
+    return _encode(KIND_SIMULATION_INPUT, meta, tables)
+
+
+def _input_from_tables(content: SerializedTables) -> SimulationInput:
+    tables = content.tables
+    tier_capacities: Dict[int, Dict[int, int]] = {}
+    capacities = tables["tier_capacities"]
+    for team_id, tier, hours in zip(*(capacities.to_list(name) for name in capacities.COLUMNS)):
+        tier_capacities.setdefault(team_id, {})[tier] = hours
+
+    teams = {team.id: team for team in tables["teams"].to_objects(Team)}
+    for team in teams.values():
+        team.tier_capacities = tier_capacities.get(team.id, {})
+
+    completed = tables["completed_phases"]
+    active_plan_meta = content.meta["active_plan"]
+    return SimulationInput(
+        teams=teams,
+        projects={project.id: project for project in tables["projects"].to_objects(Project)},
+        assignments=tables["assignments"].to_objects(Assignment),
+        simulation_start_date=date.fromisoformat(content.meta["simulation_start_date"]),
+        active_plan=(
+            _plan_from_meta(active_plan_meta, tables["active_plan_assignments"])
+            if active_plan_meta is not None else None
+        ),
+        completed_phases=dict(zip(completed.to_list("assignment_id"), completed.to_list("end_date"))),
+    )
+
+
+def dumps_result(result: ScheduleResult) -> bytes:
+    """
+    Serializa un ScheduleResult
+
+    Args:
+        result: Resultado de la simulación
+
+    Returns:
+        bytes: Contenido en formato binario
+    """
+    tables = {
+        "assignments": ScheduleColumns.from_records(result.assignments),
+        "project_summaries": _ProjectSummaryColumns.from_dicts(result.project_summaries),
+    }
+    meta = {"checksum": result.checksum, "has_changes": result.has_changes}
+    return _encode(KIND_SCHEDULE_RESULT, meta, tables)
+
+
+def _result_from_tables(content: SerializedTables) -> ScheduleResult:
+    schedule = content.tables["assignments"]
+    inputs = AssignmentColumns(schedule.arrays, schedule.categories, len(schedule)).to_objects(Assignment)
+    assignments = [
+        ScheduledAssignment(assignment, start, end)
+        for assignment, start, end in zip(
+            inputs, schedule.to_list("calculated_start_date"), schedule.to_list("calculated_end_date")
+        )
+    ]
+    summaries = content.tables["project_summaries"]
+    return ScheduleResult(
+        assignments=assignments,
+        project_summaries=summaries.to_objects(dict),
+        checksum=content.meta["checksum"],
+        has_changes=content.meta["has_changes"],
+    )
+
+
+def dumps(obj: Union[SimulationInput, ScheduleResult]) -> bytes:
+    """Serializa un SimulationInput o un ScheduleResult según su tipo"""
+    if isinstance(obj, ScheduleResult):
+        return dumps_result(obj)
+    return dumps_input(obj)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, mmap.mmap]) -> Union[SimulationInput, ScheduleResult]:
+    """
+    Reconstruye un SimulationInput o un ScheduleResult desde el formato binario
+
+    Args:
+        data: Contenido del archivo
+
+    Returns:
+        SimulationInput o ScheduleResult, según lo que se haya guardado
+
+    Raises:
+        SerializationError: Si el contenido no es válido
+    """
+    content = load_tables(data)
+    if content.kind == KIND_SIMULATION_INPUT:
+        return _input_from_tables(content)
+    if content.kind == KIND_SCHEDULE_RESULT:
+        return _result_from_tables(content)
+    raise SerializationError(f"Tipo de contenido desconocido: {content.kind}")
+
+
+def write_file(obj: Union[SimulationInput, ScheduleResult], path: str) -> int:
+    """
+    Guarda un input o resultado en un archivo
+
+    Returns:
+        int: Bytes escritos
+    """
+    payload = dumps(obj)
+    with open(path, "wb") as stream:
+        stream.write(payload)
+    logger.debug(f"Serializados {len(payload)} bytes en {path}")
+    return len(payload)
+
+
+def read_file(path: str) -> SerializedTables:
+    """
+    Abre un archivo mapeado en memoria y devuelve sus tablas sin copiarlas
+
+    Para obtener los objetos del modelo, usar loads(open(path, 'rb').read()).
+    """
+    with open(path, "rb") as stream:
+        mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+    return load_tables(mapped)
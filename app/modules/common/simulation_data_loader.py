@@ -3,32 +3,106 @@ Cargador de datos reales para simulación
 Convierte datos de DB a SimulationInput
 """
 
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict
+
 from .models import SimulationInput
 from .teams_crud import read_all_teams
 from .projects_crud import read_all_projects
 from .assignments_crud import read_all_assignments
+from .plans_crud import get_active_plan
+from .plan_utils import completed_phases_from_plan
+from .constants import SIMULATION_LOAD_TIMEOUT_SECONDS
+from .db import statement_timeout
 from datetime import date
 
+logger = logging.getLogger(__name__)
+
 
-def load_simulation_input_from_db(simulation_start_date: date = None) -> SimulationInput:
+def load_simulation_input_from_db(simulation_start_date: date = None,
+                                  timeout: float = SIMULATION_LOAD_TIMEOUT_SECONDS) -> SimulationInput:
     """
     Carga datos reales desde la DB para usar en simulación
     Incluye TODOS los proyectos (activos y pausados) con prioridad efectiva
+    
+    Equipos, proyectos, asignaciones y plan activo se leen en paralelo, por lo que
+    el tiempo total queda acotado por la consulta más lenta.
+    
+    Args:
+        simulation_start_date: Fecha de inicio de la simulación (default: hoy)
+        timeout: Tiempo máximo total en segundos para todas las lecturas
+    
+    Raises:
+        TimeoutError: Si alguna lectura no terminó dentro del timeout
+        PlansError: Si falló la lectura del plan activo
     """
     if simulation_start_date is None:
         simulation_start_date = date.today()
     
-    # Cargar datos usando CRUDs
-    teams = read_all_teams()
-    all_projects = read_all_projects()
-    all_assignments = read_all_assignments()
+    # Cargar datos usando CRUDs (lecturas independientes entre sí). Cada sentencia se corta
+    # en Postgres al mismo timeout, así una lectura abandonada no retiene su conexión
+    with statement_timeout(timeout):
+        data = _load_concurrently({
+            "teams": read_all_teams,
+            "projects": read_all_projects,
+            "assignments": read_all_assignments,
+            "active_plan": _get_active_plan_with_assignments,
+        }, timeout)
     
     # Incluir TODOS los proyectos (activos y pausados)
     # La prioridad efectiva se maneja en el scheduler
     
     return SimulationInput(
-        teams=teams,
-        projects=all_projects,
-        assignments=all_assignments,
-        simulation_start_date=simulation_start_date
-    )
\ No newline at end of file
+        teams=data["teams"],
+        projects=data["projects"],
+        assignments=data["assignments"],
+        simulation_start_date=simulation_start_date,
+        active_plan=data["active_plan"],
+        completed_phases=completed_phases_from_plan(data["active_plan"], date.today())
+    )
+
+
+def _get_active_plan_with_assignments():
+    """
+    Plan activo con sus asignaciones ya leídas (la carga diferida corre en el hilo del pool)
+    
+    Los errores de la DB se relanzan: un input sin el plan activo por una falla transitoria
+    perdería las fases completadas y no debe publicarse en la caché compartida.
+    """
+    active_plan = get_active_plan(raise_errors=True)
+    if active_plan is not None:
+        active_plan.load_assignments()
+    return active_plan
+
+
+def _load_concurrently(loaders: Dict[str, Callable[[], Any]], timeout: float) -> Dict[str, Any]:
+    """
+    Ejecuta lecturas independientes en un pool de hilos con un timeout combinado
+    
+    Cada tarea corre con una copia del contexto actual para compartir el data_scope del rerun.
+    
+    Args:
+        loaders: Diccionario {nombre: función de lectura}
+        timeout: Tiempo máximo total en segundos
+    
+    Returns:
+        Diccionario {nombre: resultado}
+    """
+    executor = ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix="simulation-loader")
+    try:
+        futures = {
+            executor.submit(contextvars.copy_context().run, loader): name
+            for name, loader in loaders.items()
+        }
+        done, pending = wait(futures, timeout=timeout)
+        if pending:
+            pending_names = sorted(futures[future] for future in pending)
+            logger.error(f"Timeout de {timeout}s cargando datos de simulación: {pending_names}")
+            raise TimeoutError(f"Timeout cargando datos de simulación: {', '.join(pending_names)}")
+        
+        # result() relanza la excepción de la lectura que haya fallado
+        return {futures[future]: future.result() for future in done}
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
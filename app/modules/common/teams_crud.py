@@ -7,10 +7,12 @@ import sqlalchemy as sa
 from typing import Dict, Optional
 from .db import engine, teams_table, tier_capacity_table
 from .models import Team
+from .data_context import get_or_load, invalidate, TEAMS_KEY, ASSIGNMENTS_KEY
 
 
 def create_team(team: Team) -> int:
     """Crear team en DB"""
+    invalidate(TEAMS_KEY, ASSIGNMENTS_KEY)
     with engine.begin() as conn:
         # Insert team
         result = conn.execute(
@@ -23,18 +25,24 @@ def create_team(team: Team) -> int:
         team_id = result.scalar()
         
         # Insert tier capacities
-        for tier, hours in team.tier_capacities.items():
-            conn.execute(
-                tier_capacity_table.insert().values(
-                    team_id=team_id,
-                    tier=tier,
-                    hours_per_person=hours
-                )
-            )
+        _insert_tier_capacities(conn, team_id, team.tier_capacities)
         
         return team_id
 
 
+def _insert_tier_capacities(conn, team_id: int, tier_capacities: Dict[int, int]):
+    """Inserta las capacidades por tier de un team con un único INSERT multi-fila"""
+    if not tier_capacities:
+        return
+    
+    conn.execute(
+        tier_capacity_table.insert().values([
+            {"team_id": team_id, "tier": tier, "hours_per_person": hours}
+            for tier, hours in tier_capacities.items()
+        ])
+    )
+
+
 def read_team(team_id: int) -> Optional[Team]:
     """Leer team desde DB"""
     with engine.begin() as conn:
@@ -74,7 +82,12 @@ def read_team(team_id: int) -> Optional[Team]:
 
 
 def read_all_teams() -> Dict[int, Team]:
-    """Leer todos los teams desde DB"""
+    """Leer todos los teams desde DB (una sola vez por rerun dentro de un data_scope)"""
+    return get_or_load(TEAMS_KEY, _load_all_teams)
+
+
+def _load_all_teams() -> Dict[int, Team]:
+    """Lee todos los teams con sus capacidades por tier"""
     with engine.begin() as conn:
         # Get all teams
         teams_results = conn.execute(
@@ -118,6 +131,7 @@ def read_all_teams() -> Dict[int, Team]:
 
 def update_team(team: Team):
     """Actualizar team en DB"""
+    invalidate(TEAMS_KEY, ASSIGNMENTS_KEY)
     with engine.begin() as conn:
         # Update team
         conn.execute(
@@ -137,18 +151,12 @@ def update_team(team: Team):
         )
         
         # Insert new tier capacities
-        for tier, hours in team.tier_capacities.items():
-            conn.execute(
-                tier_capacity_table.insert().values(
-                    team_id=team.id,
-                    tier=tier,
-                    hours_per_person=hours
-                )
-            )
+        _insert_tier_capacities(conn, team.id, team.tier_capacities)
 
 
 def delete_team(team_id: int):
     """Borrar team de DB"""
+    invalidate(TEAMS_KEY, ASSIGNMENTS_KEY)
     with engine.begin() as conn:
         # Delete tier capacities first (FK constraint)
         conn.execute(
@@ -2,8 +2,12 @@
 Utilidades de interfaz de usuario para APE
 Consolida funciones de UI comunes y drag & drop
 """
+import os
+import tempfile
 import streamlit as st
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Iterable
+
+from .constants import EXPORT_DOWNLOAD_MAX_BYTES
 
 # Configuración global de drag & drop
 try:
@@ -108,4 +112,64 @@ def render_progress_bar(current: float, total: float, label: str = "") -> None:
 def show_info_expandable(title: str, content: str, expanded: bool = False):
     """Muestra información en un expandable consistente"""
     with st.expander(title, expanded=expanded):
-        st.info(content)
\ No newline at end of file
+        st.info(content)
+
+def render_export_downloads(key: str, base_name: str, make_export: Callable[[str], Iterable[bytes]],
+                            version: str = "") -> None:
+    """
+    Renderiza selector de formato y descarga para una exportación por lotes
+    El archivo se genera solo al pedirlo y se vuelca a un archivo temporal en disco: la sesión
+    solo guarda su ruta y el archivo se elimina una vez descargado
+    Args:
+        key: Prefijo único para los componentes Streamlit
+        base_name: Nombre del archivo sin extensión
+        make_export: Función que recibe el formato y devuelve los bloques de bytes del archivo
+        version: Identificador de los datos (p. ej. checksum); si cambia, hay que volver a preparar el archivo
+    """
+    from .export import EXPORT_FORMATS, available_formats, export_filename, write_export
+
+    state_key = f"{key}_export"
+    cols = st.columns([1, 1, 2])
+    fmt = cols[0].selectbox("Formato", available_formats(), key=f"{key}_format", label_visibility="collapsed")
+
+    if cols[1].button("📦 Preparar exportación", key=f"{key}_prepare", use_container_width=True):
+        _discard_export(state_key)
+        try:
+            with st.spinner("Generando archivo..."):
+                with tempfile.NamedTemporaryFile(prefix="ape_export_", suffix=f".{EXPORT_FORMATS[fmt][1]}",
+                                                 delete=False) as stream:
+                    st.session_state[state_key] = (fmt, version, stream.name)
+                    size = write_export(make_export(fmt), stream)
+            if size > EXPORT_DOWNLOAD_MAX_BYTES:
+                _discard_export(state_key)
+                st.warning(
+                    f"⚠️ El archivo ocupa {size / 1024 ** 2:,.0f} MB, más que el máximo para descargar desde "
+                    f"la interfaz ({EXPORT_DOWNLOAD_MAX_BYTES / 1024 ** 2:,.0f} MB). Usa la CLI "
+                    f"(`python cli.py simulate` o `python cli.py export-plans` con `--format {fmt} --output`)"
+                )
+        except Exception as e:
+            st.error(f"❌ Error exportando: {e}")
+            _discard_export(state_key)
+
+    prepared = st.session_state.get(state_key)
+    if prepared and prepared[:2] != (fmt, version):
+        _discard_export(state_key)
+    elif prepared:
+        file_name = export_filename(base_name, fmt)
+        # Streamlit lee el archivo al renderizar el botón; al descargarlo se elimina
+        with open(prepared[2], "rb") as stream:
+            cols[2].download_button(
+                f"⬇️ Descargar {file_name}", data=stream, file_name=file_name,
+                mime=EXPORT_FORMATS[fmt][0], key=f"{key}_download", use_container_width=True,
+                on_click=_discard_export, args=(state_key,)
+            )
+
+
+def _discard_export(state_key: str) -> None:
+    """Elimina el archivo temporal de una exportación preparada y su entrada en la sesión"""
+    prepared = st.session_state.pop(state_key, None)
+    if prepared:
+        try:
+            os.remove(prepared[2])
+        except OSError:
+            pass
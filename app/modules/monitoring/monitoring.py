@@ -124,8 +124,10 @@ def _render_simulation_with_plans_integration():
         result, simulation_input, priority_overrides = simulation_result
         logger.info(f"🔍 DEBUG: render_simulation_for_monitoring retornó: result={result is not None}, simulation_input={simulation_input is not None}, priority_overrides={priority_overrides is not None}")
         
-        # Si hay resultados, mostrar la sección de guardado de planes
+        # Si hay resultados, mostrar la carga de los teams y la sección de guardado de planes
         if result is not None and simulation_input is not None:
+            st.markdown("---")
+            _render_team_utilization(result, simulation_input)
             st.markdown("---")
             _render_simple_save_section(result, simulation_input, priority_overrides)
         # La sección de guardado ha sido removida para implementar el guardado automático.
@@ -137,6 +139,71 @@ def _render_simulation_with_plans_integration():
         return
 
 
+def _render_team_utilization(result, simulation_input):
+    """Renderiza el heatmap de utilización de capacidad por team y día hábil"""
+    from ..simulation.analysis import compute_utilization_matrix
+    from ..simulation.gantt_config import create_utilization_heatmap
+
+    st.subheader("👥 Utilización de Teams")
+
+    matrix = compute_utilization_matrix(result, simulation_input.teams)
+    fig = create_utilization_heatmap(matrix)
+    if fig is None:
+        st.info("No hay asignaciones programadas para calcular la utilización.")
+        return
+
+    st.plotly_chart(fig, use_container_width=True)
+
+    overloaded_days = int((matrix.busy_devs > matrix.capacity[:, None]).any(axis=0).sum())
+    if overloaded_days:
+        st.warning(f"⚠️ {overloaded_days} días hábiles con algún team por encima de su capacidad")
+
+    _render_bottlenecks(result, simulation_input)
+
+
+def _render_bottlenecks(result, simulation_input):
+    """Renderiza las esperas por capacidad y por fase anterior de cada team y fase"""
+    from ..simulation.analysis import compute_slack_analysis
+
+    analysis = compute_slack_analysis(result, simulation_input)
+    if analysis.assignments.empty:
+        return
+
+    st.markdown("#### 🚧 Cuellos de botella")
+    st.caption("Días hábiles que cada fase espera: por la fase anterior del proyecto o por capacidad del team.")
+    st.dataframe(
+        analysis.teams.rename(columns={
+            "team_name": "Team",
+            "phases": "Fases",
+            "delayed_phases": "Fases demoradas",
+            "capacity_wait_days": "Espera por capacidad (días)",
+            "avg_capacity_wait_days": "Espera promedio (días)",
+            "max_queue_length": "Cola máxima",
+        }).drop(columns=["team_id"]),
+        hide_index=True,
+        use_container_width=True,
+    )
+
+    delayed = analysis.assignments[analysis.assignments["total_wait_days"] > 0]
+    if delayed.empty:
+        return
+    with st.expander(f"Ver fases con espera ({len(delayed)})"):
+        st.dataframe(
+            delayed.sort_values("total_wait_days", ascending=False).rename(columns={
+                "project_name": "Proyecto",
+                "team_name": "Team",
+                "ready_date": "Lista desde",
+                "calculated_start_date": "Inicio",
+                "calculated_end_date": "Fin",
+                "phase_wait_days": "Espera fase anterior",
+                "capacity_wait_days": "Espera capacidad",
+                "total_wait_days": "Espera total",
+            }).drop(columns=["assignment_id", "project_id", "team_id"]),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+
 def _render_simple_save_section(result, simulation_input, priority_overrides):
     """Renderiza una sección simplificada para guardar planes"""
     st.subheader("💾 Guardar Plan")
@@ -226,14 +293,10 @@ def _has_priority_changes(priority_overrides):
 
 def _persist_priority_changes(priority_overrides):
     """Persiste los cambios de prioridad en la base de datos"""
+    from ..common.projects_crud import update_project_priorities
+    
     try:
-        with engine.begin() as conn:
-            for project_id, new_priority in priority_overrides.items():
-                conn.execute(
-                    projects_table.update()
-                    .where(projects_table.c.id == project_id)
-                    .values(priority=new_priority)
-                )
+        update_project_priorities(priority_overrides)
         logger.info(f"Prioridades persistidas: {priority_overrides}")
     except Exception as e:
         logger.error(f"Error persistiendo prioridades: {e}")
@@ -11,6 +11,8 @@ from ..common.plans_crud import (
     delete_plan, get_plan_by_id
 )
 from ..common.plan_utils import get_active_assignments
+from ..common.export import export_plan, export_plans
+from ..common.ui_utils import render_export_downloads
 from ..common.models import Plan
 
 logger = logging.getLogger(__name__)
@@ -28,17 +30,17 @@ def render_plans():
     
     st.divider()
 
-    plans = list_plans(limit=100)
+    plans = list_plans(limit=100, include_archived=True)
     if not plans:
         st.info("No hay planes guardados aún. Los planes se crean en la pestaña de simulación.")
         return
 
     # Crear un mapa de nombres de plan a IDs para el selectbox
-    plan_options = {plan.name: plan.id for plan in plans}
+    plan_options = {(f"🗄️ {plan.name} (archivado)" if plan.archived else plan.name): plan.id for plan in plans}
     
     # Determinar la selección inicial del selectbox
     # Si hay un plan activo, lo seleccionamos. Si no, el primero de la lista.
-    active_plan_name = active_plan.name if active_plan else list(plan_options.keys())[0]
+    active_plan_name = active_plan.name if active_plan and active_plan.name in plan_options else list(plan_options.keys())[0]
     
     selected_plan_name = st.selectbox(
         "Selecciona un plan para ver sus detalles",
@@ -59,6 +61,15 @@ def render_plans():
         else:
             st.error("No se pudieron cargar los detalles del plan seleccionado.")
 
+    st.divider()
+    with st.expander("📤 Exportar historial de planes"):
+        st.caption("Asignaciones de todos los planes guardados en la base de datos, leídas por lotes "
+                   "(los planes archivados ya están en Parquet en el directorio del archivo).")
+        render_export_downloads(
+            "plans_history", f"historial_planes_{date.today().isoformat()}",
+            lambda fmt: export_plans(fmt), version=",".join(str(plan.id) for plan in plans if not plan.archived)
+        )
+
 def _display_active_plan_status(active_plan: Plan):
     """Muestra el estado y progreso del plan activo."""
     st.caption(f"Creado: {active_plan.created_at.strftime('%d/%m/%Y %H:%M')} | "
@@ -82,6 +93,26 @@ def _render_plan_details_and_actions(plan: Plan):
     """Muestra los detalles de un plan y los botones de acción."""
     
     # --- Botones de Acción ---
+    if plan.archived:
+        st.info("🗄️ Plan archivado: se consulta en modo de solo lectura desde el archivo de planes antiguos.")
+    else:
+        _render_plan_actions(plan)
+
+    # --- Pestañas con Detalles del Plan ---
+    tab_info, tab_priorities, tab_assignments = st.tabs(["ℹ️ Información", "🎯 Prioridades", "📋 Asignaciones"])
+
+    with tab_info:
+        _show_general_info(plan)
+    
+    with tab_priorities:
+        _show_plan_priorities(plan)
+
+    with tab_assignments:
+        _show_plan_assignments(plan)
+
+
+def _render_plan_actions(plan: Plan):
+    """Botones para activar, desactivar y eliminar un plan."""
     cols = st.columns(3)
     with cols[0]:
         if not plan.is_active:
@@ -114,18 +145,6 @@ def _render_plan_details_and_actions(plan: Plan):
         elif not plan.is_active:
             st.button("🗑️ Eliminar Plan", key=f"ask_delete_{plan.id}", use_container_width=True, on_click=lambda: st.session_state.update({confirm_key: True}))
 
-    # --- Pestañas con Detalles del Plan ---
-    tab_info, tab_priorities, tab_assignments = st.tabs(["ℹ️ Información", "🎯 Prioridades", "📋 Asignaciones"])
-
-    with tab_info:
-        _show_general_info(plan)
-    
-    with tab_priorities:
-        _show_plan_priorities(plan)
-
-    with tab_assignments:
-        _show_plan_assignments(plan)
-
 
 def _show_general_info(plan: Plan):
     """Muestra la información general del plan."""
@@ -177,6 +196,12 @@ def _show_plan_assignments(plan: Plan):
     } for a in sorted(plan.assignments, key=lambda x: (x.project_priority, x.tier))]
     
     st.dataframe(assignment_data, use_container_width=True, hide_index=True)
+    render_export_downloads(
+        f"plan_{plan.id}", f"plan_{plan.id}",
+        # Los planes archivados ya no están en la DB: se exportan desde sus columnas cargadas
+        (lambda fmt: export_plan(plan, fmt)) if plan.archived else (lambda fmt: export_plans(fmt, [plan.id])),
+        version=plan.checksum
+    )
 
 
 def show_plan_creation_success(plan: Plan):
@@ -8,9 +8,9 @@ from datetime import date
 # Importar utilidades comunes
 from modules.common.models import Project, Assignment
 from modules.common.projects_crud import (
-    create_project, read_all_projects, update_project, delete_project_by_name
+    create_project, read_all_projects, update_project, delete_project_by_name, apply_project_edit
 )
-from modules.common.assignments_crud import create_assignment
+from modules.common.assignments_crud import create_assignments
 from modules.common.teams_crud import read_all_teams
 
 
@@ -86,13 +86,27 @@ def _render_filtered_projects(projects, filter_key, editable=False):
     
     st.markdown("---")
     
+    # Equipos y asignaciones se cargan una sola vez para todas las tarjetas editables
+    teams = read_all_teams() if editable else {}
+    assignments_by_project = _load_assignments_by_project() if editable else {}
+    
     for project in filtered_projects:
         if editable:
-            _render_editable_project_card(project)
+            _render_editable_project_card(project, teams, assignments_by_project.get(project.id, []))
         else:
             _render_simple_project_card(project)
 
 
+def _load_assignments_by_project():
+    """Carga todas las asignaciones agrupadas por proyecto (una sola consulta)"""
+    from modules.common.assignments_crud import read_all_assignments
+    
+    assignments_by_project = {}
+    for assignment in read_all_assignments():
+        assignments_by_project.setdefault(assignment.project_id, []).append(assignment)
+    return assignments_by_project
+
+
 def _filter_projects(projects, filter_type):
     """Filtra proyectos según el tipo especificado con prioridad efectiva"""
     filtered = list(projects.values())
@@ -147,7 +161,7 @@ def _render_simple_project_card(project):
         st.markdown("</div>", unsafe_allow_html=True)
 
 
-def _render_editable_project_card(project):
+def _render_editable_project_card(project, teams=None, current_assignments=None):
     """Renderiza tarjeta editable de proyecto"""
     from modules.common.assignments_crud import read_assignments_by_project
     
@@ -225,9 +239,14 @@ def _render_editable_project_card(project):
         st.markdown("---")
         st.markdown("**🎯 Configuración de Tiers y Devs por Etapa**")
         
-        # Cargar asignaciones actuales del proyecto
-        current_assignments = read_assignments_by_project(project.id)
-        teams = read_all_teams()
+        # Asignaciones actuales del proyecto (ya cargadas por la lista o recién guardadas)
+        saved_assignments = st.session_state.pop(f"saved_assignments_{project.id}", None)
+        if saved_assignments is not None:
+            current_assignments = saved_assignments
+        elif current_assignments is None:
+            current_assignments = read_assignments_by_project(project.id)
+        if teams is None:
+            teams = read_all_teams()
         tier_changes = {}
         dev_changes = {}
         
@@ -306,7 +325,8 @@ def _render_editable_project_card(project):
                             st.info(f"Usando: {tier_hours}h (tier {assignment.tier})")
         
         if st.button(f"💾 Guardar Cambios", key=f"save_{project.id}"):
-            _save_project_changes(project, new_active, new_hours, new_total_hours, new_start_real, tier_changes, dev_changes, custom_hours_changes)
+            _save_project_changes(project, new_active, new_hours, new_total_hours, new_start_real, tier_changes, dev_changes, custom_hours_changes,
+                                  current_assignments=current_assignments, teams=teams)
 
 
 def _render_project_activation_control(project):
@@ -438,9 +458,11 @@ def _calculate_temp_progress(project, new_hours, new_total_hours):
     }
 
 
-def _save_project_changes(project, new_active, new_hours, new_total_hours, new_start_real, tier_changes=None, dev_changes=None, custom_hours_changes=None):
-    """Guarda cambios en proyecto y actualiza tiers y devs de asignaciones"""
-    from modules.common.assignments_crud import read_assignment, update_assignment
+def _save_project_changes(project, new_active, new_hours, new_total_hours, new_start_real, tier_changes=None, dev_changes=None, custom_hours_changes=None,
+                          current_assignments=None, teams=None):
+    """Guarda cambios en proyecto y actualiza tiers y devs de asignaciones en una sola transacción"""
+    from dataclasses import replace
+    from modules.common.assignments_crud import read_assignments_by_project
     
     try:
         # Actualizar proyecto
@@ -451,36 +473,43 @@ def _save_project_changes(project, new_active, new_hours, new_total_hours, new_s
         if new_active and project.fecha_inicio_real is None:
             project.fecha_inicio_real = date.today()
         
-        update_project(project)
-        
-        # Actualizar tiers de asignaciones si hay cambios
-        if tier_changes:
+        # Armar el conjunto de cambios desde las asignaciones ya cargadas
+        if current_assignments is None:
+            current_assignments = read_assignments_by_project(project.id)
+        if teams is None and tier_changes:
             teams = read_all_teams()
-            for assignment_id, new_tier in tier_changes.items():
-                assignment = read_assignment(assignment_id)
-                if assignment:
-                    assignment.tier = new_tier
-                    # Actualizar horas estimadas basado en el nuevo tier
-                    team = teams.get(assignment.team_id)
-                    if team:
-                        assignment.estimated_hours = team.get_hours_per_person_for_tier(new_tier)
-                    update_assignment(assignment)
-        
-        # Actualizar devs asignados si hay cambios
-        if dev_changes:
-            for assignment_id, new_devs in dev_changes.items():
-                assignment = read_assignment(assignment_id)
-                if assignment:
-                    assignment.devs_assigned = new_devs
-                    update_assignment(assignment)
-        
-        # Actualizar horas estimadas personalizadas si hay cambios
-        if custom_hours_changes:
-            for assignment_id, new_custom_hours in custom_hours_changes.items():
-                assignment = read_assignment(assignment_id)
-                if assignment:
-                    assignment.custom_estimated_hours = new_custom_hours
-                    update_assignment(assignment)
+        
+        tier_changes = tier_changes or {}
+        dev_changes = dev_changes or {}
+        custom_hours_changes = custom_hours_changes or {}
+        
+        changed_assignments = []
+        for assignment in current_assignments:
+            if (assignment.id not in tier_changes and assignment.id not in dev_changes
+                    and assignment.id not in custom_hours_changes):
+                continue
+            
+            changed = replace(assignment)
+            if assignment.id in tier_changes:
+                changed.tier = tier_changes[assignment.id]
+                # Actualizar horas estimadas basado en el nuevo tier
+                team = teams.get(assignment.team_id)
+                if team:
+                    changed.estimated_hours = team.get_hours_per_person_for_tier(changed.tier)
+            if assignment.id in dev_changes:
+                changed.devs_assigned = dev_changes[assignment.id]
+            if assignment.id in custom_hours_changes:
+                changed.custom_estimated_hours = custom_hours_changes[assignment.id]
+            changed_assignments.append(changed)
+        
+        updated_assignments = apply_project_edit(project, changed_assignments)
+        
+        # Reutilizar las filas devueltas por la DB en el próximo render de la tarjeta
+        if updated_assignments:
+            updated_by_id = {assignment.id: assignment for assignment in updated_assignments}
+            st.session_state[f"saved_assignments_{project.id}"] = [
+                updated_by_id.get(assignment.id, assignment) for assignment in current_assignments
+            ]
         
         st.success(f"✅ Proyecto '{project.name}' actualizado")
         st.rerun()
@@ -523,6 +552,7 @@ def _create_default_assignments(proj_id, pname, priority, start, tier_config=Non
     """Crea asignaciones por defecto para todos los equipos con tiers y devs configurados"""
     try:
         teams = read_all_teams()
+        assignments = []
         for team_id, team in teams.items():
             # Usar tier configurado o el máximo disponible como fallback
             if tier_config and team_id in tier_config:
@@ -556,7 +586,10 @@ def _create_default_assignments(proj_id, pname, priority, start, tier_config=Non
                 pending_hours=0,
                 custom_estimated_hours=None
             )
-            create_assignment(assignment)
+            assignments.append(assignment)
+        
+        # Un único INSERT multi-fila para todos los equipos
+        create_assignments(assignments)
     except Exception as e:
         st.error(f"Error creando asignaciones por defecto: {e}")
 
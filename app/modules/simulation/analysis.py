@@ -0,0 +1,259 @@
+"""
+Análisis de carga sobre resultados de simulación
+Cálculos vectorizados con NumPy (sin dependencias de UI) reutilizables desde la CLI y la API
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..common.date_utils import to_day_array
+from ..common.models import ScheduleResult, SimulationInput, Team
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class UtilizationMatrix:
+    """Devs ocupados por team (filas) y día hábil (columnas)"""
+    team_ids: List[int]
+    team_names: List[str]
+    days: np.ndarray        # datetime64[D], solo días hábiles
+    busy_devs: np.ndarray   # (teams, días)
+    capacity: np.ndarray    # (teams,) total_devs de cada team
+
+    @property
+    def utilization(self) -> np.ndarray:
+        """Fracción ocupada de la capacidad (NaN si el team no tiene devs)"""
+        capacity = self.capacity[:, None].astype(float)
+        return np.divide(
+            self.busy_devs, capacity,
+            out=np.full(self.busy_devs.shape, np.nan), where=capacity > 0
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Utilización como DataFrame (índice: team, columnas: día)"""
+        return pd.DataFrame(
+            self.utilization, index=self.team_names, columns=pd.DatetimeIndex(self.days)
+        )
+
+
+@dataclass
+class SlackAnalysis:
+    """Esperas por fase y colas por team de un resultado de simulación"""
+    assignments: pd.DataFrame   # una fila por fase programada
+    teams: pd.DataFrame         # resumen por team, el cuello de botella primero
+    queue_length: pd.DataFrame  # team × día hábil: fases listas esperando capacidad
+
+
+SLACK_ASSIGNMENT_COLUMNS = [
+    "assignment_id", "project_id", "project_name", "team_id", "team_name",
+    "ready_date", "calculated_start_date", "calculated_end_date",
+    "phase_wait_days", "capacity_wait_days", "total_wait_days",
+]
+
+SLACK_TEAM_COLUMNS = [
+    "team_id", "team_name", "phases", "delayed_phases",
+    "capacity_wait_days", "avg_capacity_wait_days", "max_queue_length",
+]
+
+
+def _accumulate_intervals(rows: np.ndarray, start_idx: np.ndarray, end_idx: np.ndarray,
+                          weights: np.ndarray, n_rows: int, n_days: int) -> np.ndarray:
+    """
+    Suma pesos sobre intervalos [inicio, fin) por fila con un arreglo de diferencias
+
+    Args:
+        rows: Fila de cada intervalo
+        start_idx: Columna de inicio de cada intervalo (inclusive)
+        end_idx: Columna de fin de cada intervalo (exclusive)
+        weights: Peso de cada intervalo
+        n_rows: Cantidad de filas
+        n_days: Cantidad de columnas
+
+    Returns:
+        np.ndarray: Matriz (n_rows, n_days) con la suma de pesos activos en cada columna
+    """
+    diff = np.zeros((n_rows, n_days + 1))
+    np.add.at(diff, (rows, start_idx), weights)
+    np.add.at(diff, (rows, end_idx), -weights)
+    return np.cumsum(diff[:, :n_days], axis=1)
+
+
+def compute_utilization_matrix(result: ScheduleResult, teams: Dict[int, Team],
+                               start_date: Optional[date] = None,
+                               end_date: Optional[date] = None) -> UtilizationMatrix:
+    """
+    Calcula la matriz de utilización team × día hábil de un resultado de simulación
+
+    Cada asignación ocupa devs_assigned desde su inicio hasta su fin (inclusive).
+    Se usa un arreglo de diferencias (+devs al inicio, -devs al día siguiente al fin)
+    y una suma acumulada por fila, sin recorrer los días.
+
+    Args:
+        result: Resultado de la simulación
+        teams: Diccionario {team_id: Team}
+        start_date: Inicio del horizonte (por defecto el primer inicio calculado)
+        end_date: Fin del horizonte (por defecto el último fin calculado)
+
+    Returns:
+        UtilizationMatrix: Matriz de devs ocupados y capacidad por team
+    """
+    team_list = sorted(teams.values(), key=lambda t: t.id)
+    team_ids = [t.id for t in team_list]
+    team_names = [t.name for t in team_list]
+    capacity = np.array([t.total_devs for t in team_list], dtype=float)
+    empty = UtilizationMatrix(team_ids, team_names, np.array([], dtype='datetime64[D]'),
+                              np.zeros((len(team_list), 0)), capacity)
+
+    assignments = [
+        a for a in result.assignments
+        if a.team_id in teams and a.calculated_start_date and a.calculated_end_date
+    ]
+    if not assignments or not team_list:
+        return empty
+
+    row_of_team = {team_id: row for row, team_id in enumerate(team_ids)}
+    rows = np.array([row_of_team[a.team_id] for a in assignments], dtype=np.int64)
+    devs = np.array([float(a.devs_assigned) for a in assignments])
+    starts = to_day_array([a.calculated_start_date for a in assignments])
+    ends = to_day_array([a.calculated_end_date for a in assignments])
+
+    horizon_start = np.datetime64(start_date, 'D') if start_date else starts.min()
+    horizon_end = np.datetime64(end_date, 'D') if end_date else ends.max()
+    if horizon_end < horizon_start:
+        return empty
+
+    n_days = int(np.busday_count(horizon_start, horizon_end + 1))
+    if n_days == 0:
+        return empty
+
+    # Índice del primer día hábil >= inicio y del primer día hábil > fin (recortados al horizonte)
+    start_idx = np.clip(np.busday_count(horizon_start, starts), 0, n_days)
+    end_idx = np.clip(np.busday_count(horizon_start, ends + 1), 0, n_days)
+    overlaps = start_idx < end_idx
+
+    # devs_assigned tiene 2 decimales: redondear elimina el residuo de punto flotante de la suma
+    busy_devs = np.round(_accumulate_intervals(
+        rows[overlaps], start_idx[overlaps], end_idx[overlaps], devs[overlaps], len(team_ids), n_days
+    ), 2)
+
+    days = np.busday_offset(horizon_start, np.arange(n_days), roll='forward')
+
+    return UtilizationMatrix(team_ids, team_names, days, busy_devs, capacity)
+
+
+def compute_slack_analysis(result: ScheduleResult, simulation_input: SimulationInput) -> SlackAnalysis:
+    """
+    Descompone la espera de cada fase en espera por la fase anterior y espera por capacidad
+
+    Recorre el resultado una sola vez (en el orden en que el scheduler lo generó) para
+    reconstruir la fase anterior de cada proyecto; el resto se calcula con NumPy. No vuelve
+    a simular. Para cada fase:
+      - lista propia: max(ready_to_start_date, inicio del proyecto)
+      - lista por dependencias: max(lista propia, día hábil siguiente al fin de la fase anterior)
+      - espera por fase anterior: días hábiles entre lista propia y lista por dependencias
+      - espera por capacidad: días hábiles entre lista por dependencias e inicio calculado
+    Las fases ancladas como completadas no esperan, pero sí cuentan como fase anterior.
+
+    Args:
+        result: Resultado de la simulación
+        simulation_input: Input usado en la simulación
+
+    Returns:
+        SlackAnalysis: Tabla por fase, resumen por team y largo de cola por día
+    """
+    today = simulation_input.simulation_start_date
+    completed_phases = simulation_input.completed_phases or {}
+
+    scheduled = []
+    project_starts = []
+    previous_ends = []
+    last_end_by_project = {}
+    for assignment in result.assignments:
+        if not assignment.calculated_start_date or not assignment.calculated_end_date:
+            continue
+        previous_end = last_end_by_project.get(assignment.project_id)
+        last_end_by_project[assignment.project_id] = assignment.calculated_end_date
+        if assignment.id in completed_phases:
+            continue
+
+        project = simulation_input.projects.get(assignment.project_id)
+        scheduled.append(assignment)
+        project_starts.append(project.fecha_inicio_real if project and project.fecha_inicio_real else today)
+        previous_ends.append(previous_end)
+
+    team_list = sorted(simulation_input.teams.values(), key=lambda t: t.id)
+    if not scheduled:
+        return SlackAnalysis(
+            assignments=pd.DataFrame(columns=SLACK_ASSIGNMENT_COLUMNS),
+            teams=pd.DataFrame(columns=SLACK_TEAM_COLUMNS),
+            queue_length=pd.DataFrame(index=[t.name for t in team_list]),
+        )
+
+    starts = to_day_array([a.calculated_start_date for a in scheduled])
+    ends = to_day_array([a.calculated_end_date for a in scheduled])
+    own_ready = np.maximum(to_day_array([a.ready_to_start_date for a in scheduled]), to_day_array(project_starts))
+
+    # Día hábil siguiente al fin de la fase anterior (misma regla que el scheduler)
+    previous_end_days = to_day_array(previous_ends)
+    has_previous = ~np.isnat(previous_end_days)
+    previous_available = own_ready.copy()
+    previous_available[has_previous] = np.busday_offset(previous_end_days[has_previous], 1, roll='backward')
+
+    dependency_ready = np.maximum(own_ready, previous_available)
+    phase_wait = np.maximum(np.busday_count(own_ready, dependency_ready), 0)
+    capacity_wait = np.maximum(np.busday_count(dependency_ready, starts), 0)
+
+    assignments_df = pd.DataFrame({
+        "assignment_id": [a.id for a in scheduled],
+        "project_id": [a.project_id for a in scheduled],
+        "project_name": [a.project_name for a in scheduled],
+        "team_id": [a.team_id for a in scheduled],
+        "team_name": [a.team_name for a in scheduled],
+        "ready_date": dependency_ready.astype(object),
+        "calculated_start_date": starts.astype(object),
+        "calculated_end_date": ends.astype(object),
+        "phase_wait_days": phase_wait,
+        "capacity_wait_days": capacity_wait,
+        "total_wait_days": phase_wait + capacity_wait,
+    }, columns=SLACK_ASSIGNMENT_COLUMNS)
+
+    # Cola por team: fases listas por dependencias que esperan capacidad, en [lista, inicio)
+    horizon_start = min(dependency_ready.min(), starts.min())
+    n_days = int(np.busday_count(horizon_start, ends.max() + 1))
+    row_of_team = {team.id: row for row, team in enumerate(team_list)}
+    waiting = (capacity_wait > 0) & np.isin(assignments_df["team_id"].to_numpy(), list(row_of_team))
+    queue = _accumulate_intervals(
+        np.array([row_of_team[team_id] for team_id in assignments_df["team_id"][waiting]], dtype=np.int64),
+        np.clip(np.busday_count(horizon_start, dependency_ready[waiting]), 0, n_days),
+        np.clip(np.busday_count(horizon_start, starts[waiting]), 0, n_days),
+        np.ones(int(waiting.sum())),
+        len(team_list), n_days,
+    ).round().astype(np.int64)
+    days = np.busday_offset(horizon_start, np.arange(n_days), roll='forward')
+    queue_df = pd.DataFrame(queue, index=[t.name for t in team_list], columns=pd.DatetimeIndex(days))
+
+    grouped = assignments_df.groupby("team_id")
+    teams_df = pd.DataFrame({
+        "team_id": [t.id for t in team_list],
+        "team_name": [t.name for t in team_list],
+    })
+    teams_df["phases"] = teams_df["team_id"].map(grouped.size()).fillna(0).astype(int)
+    teams_df["delayed_phases"] = teams_df["team_id"].map(
+        grouped["capacity_wait_days"].apply(lambda w: int((w > 0).sum()))
+    ).fillna(0).astype(int)
+    teams_df["capacity_wait_days"] = teams_df["team_id"].map(grouped["capacity_wait_days"].sum()).fillna(0).astype(int)
+    teams_df["avg_capacity_wait_days"] = np.round(
+        teams_df["capacity_wait_days"] / teams_df["phases"].where(teams_df["phases"] > 0), 1
+    ).fillna(0.0)
+    teams_df["max_queue_length"] = queue.max(axis=1) if n_days else 0
+    teams_df = teams_df.sort_values(
+        ["capacity_wait_days", "max_queue_length"], ascending=False, kind="stable"
+    ).reset_index(drop=True)
+
+    return SlackAnalysis(assignments=assignments_df, teams=teams_df, queue_length=queue_df)
@@ -0,0 +1,165 @@
+"""
+Caché de figuras del cronograma de Gantt
+Evita reconstruir el DataFrame y la figura de Plotly cuando el resultado y las opciones de vista no cambian
+"""
+
+import hashlib
+import json
+import logging
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from ..common.cache_utils import LRUCache
+from ..common.constants import FIGURE_CACHE_MAX_ENTRIES, GANTT_PAGE_SIZE, MAX_GANTT_TRACES, MAX_GANTT_WEBGL_ROWS
+from ..common.models import ScheduleResult, SimulationInput
+
+logger = logging.getLogger(__name__)
+
+# DataFrames completos por resultado y vista; las figuras se guardan por ventana
+_frame_cache = LRUCache(maxsize=FIGURE_CACHE_MAX_ENTRIES)
+_figure_cache = LRUCache(maxsize=FIGURE_CACHE_MAX_ENTRIES)
+
+
+def _display_fingerprint(result: ScheduleResult, simulation_input: SimulationInput) -> str:
+    """
+    Huella de los datos que se muestran en el Gantt pero no entran en el checksum del plan
+    (nombres, prioridades, estado del proyecto, horas y tier del hover)
+    """
+    projects_data = sorted(
+        (p.id, p.name, p.priority, bool(p.active)) for p in simulation_input.projects.values()
+    )
+    assignments_data = sorted(
+        (a.id, a.project_name, a.project_priority, a.team_name, a.estimated_hours, a.tier)
+        for a in result.assignments
+    )
+    payload = json.dumps([projects_data, assignments_data], default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def make_gantt_cache_key(result: ScheduleResult, view_type: str, simulation_input: SimulationInput) -> tuple:
+    """
+    Construye la clave de caché del DataFrame completo de una vista del Gantt
+
+    Args:
+        result: Resultado de la simulación
+        view_type: "detailed" | "consolidated"
+        simulation_input: Input de la simulación
+
+    Returns:
+        tuple: Clave hasheable
+    """
+    return (
+        result.get_checksum(),
+        _display_fingerprint(result, simulation_input),
+        view_type,
+    )
+
+
+def get_cached_gantt_frame(result: ScheduleResult, view_type: str,
+                           simulation_input: SimulationInput) -> pd.DataFrame:
+    """
+    Obtiene el DataFrame completo (precalculado) de una vista del Gantt
+
+    Args:
+        result: Resultado de la simulación
+        view_type: "detailed" | "consolidated"
+        simulation_input: Input de la simulación
+
+    Returns:
+        pd.DataFrame: Datos completos del Gantt
+    """
+    key = make_gantt_cache_key(result, view_type, simulation_input)
+    return _get_frame_for_key(key, result, view_type, simulation_input)
+
+
+def _get_frame_for_key(key: tuple, result: ScheduleResult, view_type: str,
+                       simulation_input: SimulationInput) -> pd.DataFrame:
+    """Obtiene el DataFrame completo para una clave ya calculada"""
+    from .gantt_views import prepare_gantt_data
+
+    gantt_df = _frame_cache.get(key)
+    if gantt_df is None:
+        gantt_df = prepare_gantt_data(result, view_type, simulation_input)
+        _frame_cache.set(key, gantt_df)
+    return gantt_df
+
+
+def get_cached_gantt(result: ScheduleResult, view_type: str, simulation_input: SimulationInput,
+                     project_colors: Dict[str, str] = None, phase_colors: Dict[str, str] = None,
+                     add_markers: bool = True, date_range: Optional[Tuple[date, date]] = None,
+                     page: int = 0, page_size: int = GANTT_PAGE_SIZE,
+                     detail_level: str = "auto", compact: bool = False) -> Tuple[pd.DataFrame, Optional[object], int]:
+    """
+    Obtiene el DataFrame y la figura del Gantt desde la caché, construyéndolos si no existen
+
+    El tamaño de la figura serializada se mide una sola vez, al construirla, y se guarda
+    junto a ella: los reruns servidos desde la caché no vuelven a serializarla.
+
+    Args:
+        result: Resultado de la simulación
+        view_type: "detailed" | "consolidated"
+        simulation_input: Input de la simulación
+        project_colors: Colores por proyecto (vista detallada)
+        phase_colors: Colores por fase (vista consolidada)
+        add_markers: Si agregar marcadores temporales
+        date_range: Rango de fechas visible (inicio, fin) o None para todo el cronograma
+        page: Página de proyectos a renderizar
+        page_size: Proyectos por página
+        detail_level: "auto" (según el rango visible) | "day" | "week" | "month" | "quarter"
+        compact: Si construir la figura en modo de payload mínimo
+
+    Returns:
+        Tuple[pd.DataFrame, figura, int]: Datos de la ventana, figura de Plotly (None si no hay datos)
+        y tamaño en bytes de la figura enviada al navegador
+    """
+    from .gantt_views import window_gantt_data, aggregate_gantt_data, select_detail_level
+    from .gantt_config import get_gantt_figure, get_figure_payload_size
+
+    frame_key = make_gantt_cache_key(result, view_type, simulation_input)
+    key = frame_key + (
+        tuple(sorted((project_colors or {}).items())),
+        tuple(sorted((phase_colors or {}).items())),
+        add_markers,
+        # La línea de "hoy" depende de la fecha actual
+        date.today() if add_markers else None,
+        tuple(date_range) if date_range else None,
+        page,
+        page_size,
+        detail_level,
+        compact,
+    )
+    cached = _figure_cache.get(key)
+    if cached is not None:
+        logger.info(f"Figura Gantt '{view_type}' servida desde caché")
+        return cached
+
+    gantt_df = _get_frame_for_key(frame_key, result, view_type, simulation_input)
+    start_date, end_date = date_range if date_range else (None, None)
+    # La vista detallada pasa a WebGL por encima de GANTT_WEBGL_ROW_THRESHOLD filas, por lo que
+    # solo la consolidada (siempre SVG) queda acotada a MAX_GANTT_TRACES
+    max_rows = MAX_GANTT_WEBGL_ROWS if view_type == "detailed" else MAX_GANTT_TRACES
+    window_df = window_gantt_data(gantt_df, start_date, end_date, page=page, page_size=page_size,
+                                  max_rows=max_rows)
+
+    fig = None
+    if not window_df.empty:
+        if detail_level == "auto":
+            visible_start = start_date or window_df['Start'].min().date()
+            visible_end = end_date or window_df['Finish'].max().date()
+            detail_level = select_detail_level(visible_start, visible_end)
+        window_df = aggregate_gantt_data(window_df, view_type, detail_level)
+        fig = get_gantt_figure(window_df, view_type, project_colors=project_colors,
+                               phase_colors=phase_colors, add_markers=add_markers,
+                               date_range=date_range, detail_level=detail_level, compact=compact)
+
+    cached = (window_df, fig, get_figure_payload_size(fig))
+    _figure_cache.set(key, cached)
+    return cached
+
+
+def clear_figure_cache() -> None:
+    """Vacía la caché de figuras y de DataFrames"""
+    _figure_cache.clear()
+    _frame_cache.clear()
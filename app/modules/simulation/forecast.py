@@ -0,0 +1,159 @@
+"""
+Pronóstico de entregas sin dependencias de UI
+Flujo compartido por la pestaña de simulación, la CLI y el worker de precálculo
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Optional
+
+from ..common.constants import SIMULATION_LOAD_TIMEOUT_SECONDS
+from ..common.models import ScheduleResult, SimulationInput
+from ..common.plan_utils import get_plan_progress_overrides
+from ..common.result_cache import FORECAST_KEY, SIMULATION_INPUT_KEY, get_data_fingerprint, get_or_compute
+from ..common.scenario import ScenarioOverlay
+from ..common.simulation_data_loader import load_simulation_input_from_db
+from .scheduler import ProjectScheduler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Forecast:
+    """Resultado de una simulación junto con los datos usados para calcularla"""
+    simulation_input: SimulationInput
+    result: ScheduleResult
+    adjusted_assignments: int = 0
+    fingerprint: Optional[str] = None
+    computed_at: datetime = field(default_factory=datetime.now)
+
+
+def run_scenario(base_input: SimulationInput, priority_overrides: Dict[int, int] = None,
+                 capacity_overrides: Dict[int, int] = None, simulation_date: date = None) -> Forecast:
+    """
+    Simula un escenario sobre un input compartido, sin modificarlo ni copiarlo
+
+    Los cambios de prioridad y capacidad, y las horas reducidas según el progreso del
+    plan activo, se aplican como una capa (ScenarioOverlay) que lee el scheduler.
+
+    Args:
+        base_input: Input base (puede compartirse entre escenarios e hilos)
+        priority_overrides: Diccionario {project_id: nueva_prioridad}
+        capacity_overrides: Diccionario {team_id: nuevo_total_devs}
+        simulation_date: Fecha de referencia (por defecto hoy)
+
+    Returns:
+        Forecast: Escenario y resultado de la simulación
+    """
+    simulation_date = simulation_date or date.today()
+
+    hours_overrides = {}
+    if base_input.active_plan:
+        logger.info(f"Plan activo encontrado: '{base_input.active_plan.name}'. Ajustando horas de la simulación.")
+        hours_overrides = get_plan_progress_overrides(base_input, base_input.active_plan, simulation_date)
+
+    # La fecha de referencia es el inicio temporal del scheduler
+    scenario = ScenarioOverlay(
+        base_input,
+        priority_overrides=priority_overrides,
+        hours_overrides=hours_overrides,
+        capacity_overrides=capacity_overrides,
+        simulation_start_date=simulation_date,
+    )
+
+    scheduler = ProjectScheduler()
+    result = scheduler.simulate(scenario, completed_phases=scenario.completed_phases)
+    logger.info(f"Simulación completada con {len(result.assignments)} asignaciones")
+
+    return Forecast(simulation_input=scenario, result=result, adjusted_assignments=len(hours_overrides))
+
+
+def run_forecast(priority_overrides: Dict[int, int] = None, simulation_date: date = None,
+                 timeout: float = SIMULATION_LOAD_TIMEOUT_SECONDS,
+                 capacity_overrides: Dict[int, int] = None) -> Forecast:
+    """
+    Carga los datos de la DB y simula un escenario sobre ellos
+
+    Args:
+        priority_overrides: Diccionario {project_id: nueva_prioridad}
+        simulation_date: Fecha de referencia (por defecto hoy)
+        timeout: Tiempo máximo para cargar los datos de la DB
+        capacity_overrides: Diccionario {team_id: nuevo_total_devs}
+
+    Returns:
+        Forecast: Escenario y resultado de la simulación
+    """
+    simulation_date = simulation_date or date.today()
+    base_input = load_simulation_input_from_db(simulation_date, timeout=timeout)
+    return run_scenario(base_input, priority_overrides, capacity_overrides, simulation_date)
+
+
+def get_base_input(fingerprint: str = None) -> SimulationInput:
+    """
+    Input de la DB para la huella de datos actual, compartido por todos los escenarios
+
+    Si falla alguna lectura (incluido el plan activo) la excepción se propaga y no se
+    publica un input incompleto.
+
+    Args:
+        fingerprint: Huella de los datos (se consulta si no se indica)
+
+    Returns:
+        SimulationInput: Input base (compartido: no modificar)
+    """
+    if fingerprint is None:
+        fingerprint = get_data_fingerprint()
+    return get_or_compute(
+        (SIMULATION_INPUT_KEY, fingerprint),
+        lambda: load_simulation_input_from_db(date.today())
+    )
+
+
+def get_forecast(priority_overrides: Dict[int, int] = None, fingerprint: str = None,
+                 capacity_overrides: Dict[int, int] = None) -> Forecast:
+    """
+    Pronóstico para el estado actual de la DB, compartido entre sesiones y pedidos
+
+    Se calcula una vez por huella de datos y combinación de cambios; los pedidos
+    concurrentes con los mismos parámetros esperan un único cálculo. Todos los
+    escenarios de una misma huella comparten el input cargado de la DB.
+
+    Args:
+        priority_overrides: Diccionario {project_id: nueva_prioridad}
+        fingerprint: Huella de los datos (se consulta si no se indica)
+        capacity_overrides: Diccionario {team_id: nuevo_total_devs}
+
+    Returns:
+        Forecast: Pronóstico (compartido: no modificar)
+    """
+    if fingerprint is None:
+        fingerprint = get_data_fingerprint()
+    priorities_key = tuple(sorted((priority_overrides or {}).items()))
+    capacity_key = tuple(sorted((capacity_overrides or {}).items()))
+
+    def compute() -> Forecast:
+        logger.info(
+            f"Calculando pronóstico para la huella {fingerprint} "
+            f"(cambios de prioridad: {len(priorities_key)}, de capacidad: {len(capacity_key)})"
+        )
+        forecast = run_scenario(get_base_input(fingerprint), dict(priorities_key), dict(capacity_key))
+        forecast.fingerprint = fingerprint
+        return forecast
+
+    return get_or_compute((FORECAST_KEY, fingerprint, priorities_key, capacity_key), compute)
+
+
+def get_baseline_forecast(fingerprint: str = None) -> Forecast:
+    """
+    Pronóstico sin cambios de prioridad para el estado actual de la DB
+
+    El worker de precálculo lo mantiene caliente.
+
+    Args:
+        fingerprint: Huella de los datos (se consulta si no se indica)
+
+    Returns:
+        Forecast: Pronóstico base (compartido: no modificar)
+    """
+    return get_forecast(None, fingerprint)
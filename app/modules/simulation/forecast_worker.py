@@ -0,0 +1,81 @@
+"""
+Worker de precálculo del pronóstico base
+Hilo en segundo plano que recalcula el cronograma y los datos del Gantt cuando cambian
+los datos de la DB (o el día), para que la pestaña de monitoring abra sin esperar
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from ..common.constants import FORECAST_POLL_INTERVAL_SECONDS
+from ..common.result_cache import get_data_fingerprint
+from .forecast import get_baseline_forecast
+
+logger = logging.getLogger(__name__)
+
+_worker_lock = threading.Lock()
+_worker: Optional["ForecastWorker"] = None
+
+
+class ForecastWorker(threading.Thread):
+    """Hilo daemon que mantiene publicado el pronóstico base"""
+
+    def __init__(self, poll_interval: float = FORECAST_POLL_INTERVAL_SECONDS):
+        super().__init__(name="ape-forecast-worker", daemon=True)
+        self.poll_interval = poll_interval
+        self.last_fingerprint: Optional[str] = None
+        self._stop_event = threading.Event()
+
+    def refresh(self) -> bool:
+        """
+        Recalcula el pronóstico si la huella de los datos cambió
+
+        Returns:
+            bool: True si se publicó un pronóstico nuevo
+        """
+        fingerprint = get_data_fingerprint()
+        if fingerprint == self.last_fingerprint:
+            return False
+
+        forecast = get_baseline_forecast(fingerprint)
+        self._warm_gantt(forecast)
+        self.last_fingerprint = fingerprint
+        logger.info(f"Pronóstico base publicado ({len(forecast.result.assignments)} asignaciones)")
+        return True
+
+    def _warm_gantt(self, forecast) -> None:
+        """Precalcula los DataFrames de ambas vistas del Gantt"""
+        from .figure_cache import get_cached_gantt_frame
+
+        for view_type in ("detailed", "consolidated"):
+            get_cached_gantt_frame(forecast.result, view_type, forecast.simulation_input)
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                # Un fallo puntual (DB caída, timeout) no debe detener el worker
+                logger.error(f"Error en el worker de pronóstico: {e}")
+            self._stop_event.wait(self.poll_interval)
+
+    def stop(self) -> None:
+        """Detiene el worker al terminar la espera actual"""
+        self._stop_event.set()
+
+
+def start_forecast_worker(poll_interval: float = FORECAST_POLL_INTERVAL_SECONDS) -> ForecastWorker:
+    """
+    Inicia el worker de precálculo (una sola instancia por proceso)
+
+    Returns:
+        ForecastWorker: El worker en ejecución
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = ForecastWorker(poll_interval)
+            _worker.start()
+            logger.info("Worker de pronóstico iniciado")
+        return _worker
@@ -4,9 +4,11 @@ Maneja la configuración visual y de interactividad para cada tipo de vista
 """
 
 import plotly.express as px
+import numpy as np
 import pandas as pd
 from datetime import date
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Tuple
+from ..common.constants import GANTT_WEBGL_ROW_THRESHOLD
 from .gantt_views import PHASE_COLORS, PROJECT_COLORS
 
 
@@ -119,13 +121,56 @@ def configure_consolidated_gantt(fig, gantt_df: pd.DataFrame, phase_colors: Dict
     )
 
 
-def create_detailed_gantt(gantt_df: pd.DataFrame, project_colors: Dict[str, str]):
+# Hover compartido del modo compacto: el contenido variable viaja en customdata
+COMPACT_DETAILED_HOVERTEMPLATE = (
+    "<b>%{y}</b><br>"
+    "Start: %{customdata[0]}<br>"
+    "End: %{customdata[1]}<br>"
+    "Hours: %{customdata[2]}h<br>"
+    "Devs: %{customdata[3]}<br>"
+    "Tier: %{customdata[4]}"
+    "<extra></extra>"
+)
+COMPACT_CONSOLIDATED_HOVERTEMPLATE = (
+    "<b>%{customdata[0]} - %{fullData.name}</b><br>"
+    "Start: %{customdata[1]}<br>"
+    "End: %{customdata[2]}<br>"
+    "Hours: %{customdata[3]}h<br>"
+    "Devs: %{customdata[4]}<br>"
+    "Tier: %{customdata[5]}"
+    "<extra></extra>"
+)
+
+
+def _short_dates(values) -> np.ndarray:
+    """Codifica fechas como 'YYYY-MM-DD' en lugar de timestamps ISO completos"""
+    return pd.DatetimeIndex(pd.to_datetime(values)).strftime('%Y-%m-%d').to_numpy(dtype=object)
+
+
+def _compact_hover_data(gantt_df: pd.DataFrame) -> np.ndarray:
+    """
+    Datos de hover de la vista detallada para el modo compacto
+
+    Returns:
+        np.ndarray: Filas [inicio, fin, horas, devs, tier]; el fin mostrado es Finish (exclusivo)
+    """
+    return np.column_stack([
+        pd.DatetimeIndex(gantt_df['Start']).strftime('%d/%m/%Y').to_numpy(dtype=object),
+        pd.DatetimeIndex(gantt_df['Finish']).strftime('%d/%m/%Y').to_numpy(dtype=object),
+        gantt_df['Hours'].to_numpy(dtype=object),
+        gantt_df['Devs'].to_numpy(dtype=object),
+        gantt_df['Tier'].to_numpy(dtype=object),
+    ])
+
+
+def create_detailed_gantt(gantt_df: pd.DataFrame, project_colors: Dict[str, str], compact: bool = False):
     """
     Crea el gráfico Gantt para vista detallada
     
     Args:
         gantt_df: DataFrame con datos formateados
         project_colors: Mapa de colores por proyecto
+        compact: Si minimizar el payload (hover en customdata y fechas cortas)
         
     Returns:
         Figura de Plotly configurada
@@ -133,109 +178,242 @@ def create_detailed_gantt(gantt_df: pd.DataFrame, project_colors: Dict[str, str]
     if gantt_df.empty:
         return None
     
+    if compact:
+        return _create_detailed_gantt_compact(gantt_df, project_colors)
+    
     fig = px.timeline(
         gantt_df,
         x_start="Start",
         x_end="Finish",
         y="Task",
         color="Project",
-        hover_data=["Team", "Priority", "Tier", "Devs", "Hours"],
+        custom_data=["HoverText"],
         color_discrete_map=project_colors
     )
 
-    # Use custom hover text
-    fig.update_traces(
-        hovertemplate='%{customdata}<extra></extra>',
-        customdata=gantt_df['HoverText']
-    )
+    # Use custom hover text (customdata se reparte por traza junto con cada barra)
+    fig.update_traces(hovertemplate='%{customdata[0]}<extra></extra>')
 
     # Apply layout configuration
     _configure_detailed_gantt_layout(fig, gantt_df)
     return fig
 
 
-def create_consolidated_gantt(gantt_df: pd.DataFrame, phase_colors: Dict[str, str] = None):
+def _create_detailed_gantt_compact(gantt_df: pd.DataFrame, project_colors: Dict[str, str]):
+    """
+    Vista detallada con barras horizontales de payload mínimo: base como fecha corta,
+    duración en milisegundos y hover compartido por traza
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    hover_data = _compact_hover_data(gantt_df)
+    durations = (pd.to_datetime(gantt_df['Finish']) - pd.to_datetime(gantt_df['Start'])) // pd.Timedelta(milliseconds=1)
+
+    for project_name, positions in gantt_df.groupby('Project', sort=False).indices.items():
+        group = gantt_df.iloc[positions]
+        fig.add_trace(go.Bar(
+            orientation='h',
+            base=_short_dates(group['Start']),
+            x=durations.iloc[positions].to_numpy(),
+            y=group['Task'].to_numpy(dtype=object),
+            name=str(project_name),
+            legendgroup=str(project_name),
+            marker_color=project_colors.get(project_name),
+            customdata=hover_data[positions],
+            hovertemplate=COMPACT_DETAILED_HOVERTEMPLATE
+        ))
+
+    fig.update_layout(barmode='overlay')
+    fig.update_xaxes(type='date')
+    fig.update_yaxes(
+        type='category',
+        categoryorder='array',
+        categoryarray=gantt_df['Task'].drop_duplicates().tolist()
+    )
+    _configure_detailed_gantt_layout(fig, gantt_df)
+    return fig
+
+
+def create_detailed_gantt_webgl(gantt_df: pd.DataFrame, project_colors: Dict[str, str], compact: bool = False):
+    """
+    Crea el gráfico Gantt para vista detallada dibujando las barras con WebGL
+
+    Cada barra es un segmento de línea gruesa (inicio, medio, fin, None) en una
+    traza Scattergl por proyecto, con los mismos colores y hover que la vista SVG.
+
+    Args:
+        gantt_df: DataFrame con datos formateados
+        project_colors: Mapa de colores por proyecto
+        compact: Si minimizar el payload (hover en customdata y fechas cortas)
+
+    Returns:
+        Figura de Plotly configurada
+    """
+    if gantt_df.empty:
+        return None
+
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    hover_data = _compact_hover_data(gantt_df) if compact else gantt_df['HoverText'].to_numpy(dtype=object)
+
+    # Grosor de barra equivalente al de px.timeline (35px por fila)
+    bar_width = 20
+
+    for project_name, positions in gantt_df.groupby('Project', sort=False).indices.items():
+        group = gantt_df.iloc[positions]
+        starts = pd.to_datetime(group['Start'])
+        finishes = pd.to_datetime(group['Finish'])
+        middles = starts + (finishes - starts) / 2
+        n = len(group)
+
+        # Puntos intercalados: inicio, medio, fin y un hueco por barra
+        x = np.empty(n * 4, dtype=object)
+        if compact:
+            x[0::4] = _short_dates(starts)
+            x[1::4] = _short_dates(middles.dt.floor('D'))
+            x[2::4] = _short_dates(finishes)
+        else:
+            x[0::4] = pd.DatetimeIndex(starts).to_pydatetime()
+            x[1::4] = pd.DatetimeIndex(middles).to_pydatetime()
+            x[2::4] = pd.DatetimeIndex(finishes).to_pydatetime()
+        x[3::4] = None
+
+        tasks = group['Task'].to_numpy(dtype=object)
+        y = np.empty(n * 4, dtype=object)
+        for offset in range(3):
+            y[offset::4] = tasks
+        y[3::4] = None
+
+        # Una fila de hover por punto (None en los huecos)
+        customdata = hover_data[np.repeat(positions, 4)]
+        customdata[3::4] = None
+
+        fig.add_trace(go.Scattergl(
+            x=x,
+            y=y,
+            mode='lines',
+            line=dict(color=project_colors.get(project_name), width=bar_width),
+            name=str(project_name),
+            legendgroup=str(project_name),
+            customdata=customdata,
+            hovertemplate=COMPACT_DETAILED_HOVERTEMPLATE if compact else '%{customdata}<extra></extra>',
+            connectgaps=False
+        ))
+
+    # Mantener el orden de filas de la vista SVG
+    fig.update_yaxes(
+        type='category',
+        categoryorder='array',
+        categoryarray=gantt_df['Task'].drop_duplicates().tolist()
+    )
+    fig.update_xaxes(type='date')
+
+    _configure_detailed_gantt_layout(fig, gantt_df)
+    return fig
+
+
+def create_consolidated_gantt(gantt_df: pd.DataFrame, phase_colors: Dict[str, str] = None,
+                              compact: bool = False):
     """
     Crea el gráfico Gantt para vista consolidada usando Scatter con timeline correcto
-    
+
+    Emite una sola traza por fase: los rectángulos de todos los proyectos se
+    concatenan separados por None, por lo que la cantidad de trazas es constante
+    y el armado es lineal en la cantidad de fases.
+
     Args:
         gantt_df: DataFrame con datos formateados
         phase_colors: Mapa de colores por fase
-        
+        compact: Si minimizar el payload (hover en customdata y fechas cortas)
+
     Returns:
         Figura de Plotly configurada
     """
     if gantt_df.empty:
         return None
-    
+
     if phase_colors is None:
         phase_colors = PHASE_COLORS
-    
+
     import plotly.graph_objects as go
-    import pandas as pd
-    
+    from datetime import timedelta
+
     fig = go.Figure()
 
     max_traces_per_project = 10  # Limit phases per project to avoid rendering issues
 
-    for idx, row in gantt_df.iterrows():
-        project_name = row['Task']
-        phases_info = row['PhasesInfo']
+    # Coordenadas acumuladas por fase: {phase_name: {'x': [...], 'y': [...], 'text': [...]}}
+    phase_polygons = {}
 
+    # Usar la posición de la fila (no el índice del DataFrame) para que coincida con los ticks
+    for position, (project_name, phases_info) in enumerate(zip(gantt_df['Task'], gantt_df['PhasesInfo'])):
         # Limit phases if there are too many
         if len(phases_info) > max_traces_per_project:
             phases_info = phases_info[:max_traces_per_project]
 
-        # Create a scatter trace for each phase
         for phase_info in phases_info:
             phase_name = phase_info['name']
-            phase_color = phase_colors.get(phase_name, '#CCCCCC')
-            
-            # Convert dates to timestamps
+            polygon = phase_polygons.setdefault(phase_name, {'x': [], 'y': [], 'text': []})
+
             # For Scatter visualization: end_date represents the last day of work (inclusive)
             # We add 1 day so the rectangle visually covers the entire end_date day
-            start_date = pd.Timestamp(phase_info['start'])
-            end_date = pd.Timestamp(phase_info['end'])
-
-            # Visual end: add 1 day so bar extends to end of last day
             # This ensures no gaps between consecutive phases
-            end_date_visual = end_date + pd.Timedelta(days=1)
+            start_date = pd.Timestamp(phase_info['start'])
+            end_date_visual = pd.Timestamp(phase_info['end']) + pd.Timedelta(days=1)
 
             # Display end date + 1 calendar day in hover (cosmetic change)
-            from datetime import timedelta
             end_date_display = phase_info['end'] + timedelta(days=1)
+            display_name = project_name.replace('📋 ', '')
+
+            if compact:
+                # Fechas cortas y hover como datos: el texto se arma en el navegador
+                start_date = start_date.strftime('%Y-%m-%d')
+                end_date_visual = end_date_visual.strftime('%Y-%m-%d')
+                hover_item = [
+                    display_name,
+                    phase_info['start'].strftime('%d/%m/%Y'),
+                    end_date_display.strftime('%d/%m/%Y'),
+                    phase_info['hours'],
+                    phase_info['devs'],
+                    phase_info['tier'],
+                ]
+            else:
+                # Generate phase-specific hover text (showing end date + 1 calendar day)
+                hover_item = (
+                    f"<b>{display_name} - {phase_name}</b><br>"
+                    f"Start: {phase_info['start'].strftime('%d/%m/%Y')}<br>"
+                    f"End: {end_date_display.strftime('%d/%m/%Y')}<br>"
+                    f"Hours: {phase_info['hours']}h<br>"
+                    f"Devs: {phase_info['devs']}<br>"
+                    f"Tier: {phase_info['tier']}"
+                )
+            # Las 4 esquinas del rectángulo más un None que lo separa del siguiente
+            polygon['x'].extend([start_date, end_date_visual, end_date_visual, start_date, start_date, None])
+            polygon['y'].extend([position - 0.4, position - 0.4, position + 0.4, position + 0.4, position - 0.4, None])
+            polygon['text'].extend([hover_item] * 5 + [None])
+
+    # Una traza de Scatter por fase con todos sus rectángulos
+    for phase_name, polygon in phase_polygons.items():
+        phase_color = phase_colors.get(phase_name, '#CCCCCC')
+        if compact:
+            hover_kwargs = dict(customdata=polygon['text'], hovertemplate=COMPACT_CONSOLIDATED_HOVERTEMPLATE)
+        else:
+            hover_kwargs = dict(text=polygon['text'], hovertemplate="%{text}<extra></extra>")
+        fig.add_trace(go.Scatter(
+            x=polygon['x'],
+            y=polygon['y'],
+            fill='toself',
+            fillcolor=phase_color,
+            line=dict(color=phase_color, width=1),
+            mode='lines',
+            name=phase_name,
+            showlegend=True,
+            legendgroup=phase_name,
+            **hover_kwargs
+        ))
 
-            # Generate phase-specific hover text (showing end date + 1 calendar day)
-            hover_text = (
-                f"<b>{project_name.replace('📋 ', '')} - {phase_name}</b><br>"
-                f"Start: {phase_info['start'].strftime('%d/%m/%Y')}<br>"
-                f"End: {end_date_display.strftime('%d/%m/%Y')}<br>"
-                f"Hours: {phase_info['hours']}h<br>"
-                f"Devs: {phase_info['devs']}<br>"
-                f"Tier: {phase_info['tier']}"
-            )
-            # Create rectangle using Scatter with fill
-            # Define the 4 corners of the rectangle for this phase
-            x_coords = [start_date, end_date_visual, end_date_visual, start_date, start_date]
-            y_coords = [idx - 0.4, idx - 0.4, idx + 0.4, idx + 0.4, idx - 0.4]
-            
-            # Agregar traza de Scatter para esta fase
-            fig.add_trace(go.Scatter(
-                x=x_coords,
-                y=y_coords,
-                fill='toself',
-                fillcolor=phase_color,
-                line=dict(color=phase_color, width=1),
-                mode='lines',
-                name=phase_name,
-                hovertemplate=hover_text + "<extra></extra>",
-                showlegend=phase_name not in [trace.name for trace in fig.data if hasattr(trace, 'name')],
-                legendgroup=phase_name,
-                # Usar el centro del rectángulo para el hover
-                hoverinfo='text',
-                text=hover_text
-            ))
-    
     # Configurar el layout
     fig.update_layout(
         title={
@@ -268,7 +446,7 @@ def create_consolidated_gantt(gantt_df: pd.DataFrame, phase_colors: Dict[str, st
         tickfont=dict(size=12),
         tickmode='array',
         tickvals=list(range(len(gantt_df))),
-        ticktext=[row['Task'] for _, row in gantt_df.iterrows()],
+        ticktext=gantt_df['Task'].tolist(),
         showgrid=False
     )
     
@@ -363,37 +541,80 @@ def add_timeline_markers(fig, gantt_df: pd.DataFrame, show_today: bool = True, s
         pass
 
 
-def add_weekend_shading(fig, start_date, end_date):
+def build_non_business_day_path(start_date, end_date, holidays: Optional[Iterable[date]] = None) -> Optional[str]:
+    """
+    Construye un path SVG con un rectángulo por cada tramo de días no hábiles
+    (fines de semana y feriados) entre dos fechas.
+
+    Args:
+        start_date: Fecha de inicio del rango.
+        end_date: Fecha de fin del rango.
+        holidays: Feriados adicionales a sombrear.
+
+    Returns:
+        Path en coordenadas de datos (x) y papel (y), o None si no hay días no hábiles.
+    """
+    # Incluir el día siguiente para que un sábado final cubra también el domingo
+    days = pd.date_range(start_date, pd.Timestamp(end_date) + pd.Timedelta(days=1), freq='D')
+    if days.empty:
+        return None
+
+    non_business = days.weekday >= 5
+    if holidays:
+        non_business |= days.isin(pd.to_datetime(list(holidays)))
+
+    # Bordes de cada tramo contiguo de días no hábiles
+    edges = np.diff(np.concatenate(([0], non_business.astype(np.int8), [0])))
+    run_starts = days[0] + pd.to_timedelta(np.flatnonzero(edges == 1), unit='D')
+    run_ends = days[0] + pd.to_timedelta(np.flatnonzero(edges == -1), unit='D')
+    if run_starts.empty:
+        return None
+
+    x0 = run_starts.strftime('%Y-%m-%d')
+    x1 = run_ends.strftime('%Y-%m-%d')
+    return " ".join(f"M {a},0 L {b},0 L {b},1 L {a},1 Z" for a, b in zip(x0, x1))
+
+
+def add_weekend_shading(fig, start_date, end_date, holidays: Optional[Iterable[date]] = None):
     """
-    Agrega sombreado para los fines de semana (sábado y domingo) en el gráfico.
+    Agrega sombreado para los fines de semana (sábado y domingo) y feriados en el gráfico.
+
+    Usa una única forma de tipo path con todos los tramos, por lo que el layout
+    tiene siempre una sola forma sin importar el rango de fechas.
 
     Args:
         fig: Figura de Plotly.
         start_date: Fecha de inicio del rango a sombrear.
         end_date: Fecha de fin del rango a sombrear.
+        holidays: Feriados adicionales a sombrear (opcional).
     """
-    from datetime import timedelta
-    
-    current_date = start_date
-    while current_date <= end_date:
-        if current_date.weekday() == 5:  # Es sábado
-            fig.add_shape(
-                type="rect",
-                xref="x",
-                yref="paper",
-                x0=current_date,
-                y0=0,
-                x1=current_date + timedelta(days=2),
-                y1=1,
-                fillcolor="rgba(200, 200, 200, 0.2)",
-                line_width=0,
-                layer="below"
-            )
-        current_date += timedelta(days=1)
+    path = build_non_business_day_path(start_date, end_date, holidays)
+    if path is None:
+        return
+
+    fig.add_shape(
+        type="path",
+        path=path,
+        xref="x",
+        yref="paper",
+        fillcolor="rgba(200, 200, 200, 0.2)",
+        line_width=0,
+        layer="below"
+    )
+
+
+# Configuración del eje X para niveles de detalle agregados
+DETAIL_LEVEL_AXES = {
+    "week": dict(dtick=7 * 24 * 60 * 60 * 1000, tickformat='%d %b %Y'),
+    "month": dict(dtick="M1", tickformat='%b %Y'),
+    "quarter": dict(dtick="M3", tickformat='%b %Y'),
+}
 
 
 def get_gantt_figure(gantt_df: pd.DataFrame, view_type: str, project_colors: Dict[str, str] = None, 
-                     phase_colors: Dict[str, str] = None, add_markers: bool = True):
+                     phase_colors: Dict[str, str] = None, add_markers: bool = True,
+                     date_range: Optional[Tuple[date, date]] = None, detail_level: str = "day",
+                     renderer: str = "auto", compact: bool = False):
     """
     Función principal para crear figuras de Gantt según el tipo de vista
     
@@ -403,6 +624,10 @@ def get_gantt_figure(gantt_df: pd.DataFrame, view_type: str, project_colors: Dic
         project_colors: Colores por proyecto (para vista detallada)
         phase_colors: Colores por fase (para vista consolidada)
         add_markers: Si agregar marcadores temporales
+        date_range: Rango visible (inicio, fin) opcional; None muestra todo el cronograma
+        detail_level: Nivel de detalle de los datos ("day" | "week" | "month" | "quarter")
+        renderer: "svg" | "webgl" | "auto" (WebGL a partir de GANTT_WEBGL_ROW_THRESHOLD filas, solo vista detallada)
+        compact: Si minimizar el payload enviado al navegador (hover en customdata y fechas cortas)
         
     Returns:
         Figura de Plotly configurada
@@ -418,12 +643,18 @@ def get_gantt_figure(gantt_df: pd.DataFrame, view_type: str, project_colors: Dic
                 project: PROJECT_COLORS[i % len(PROJECT_COLORS)] 
                 for i, project in enumerate(unique_projects)
             }
-        fig = create_detailed_gantt(gantt_df, project_colors)
+        use_webgl = renderer == "webgl" or (
+            renderer == "auto" and len(gantt_df) > GANTT_WEBGL_ROW_THRESHOLD
+        )
+        if use_webgl:
+            fig = create_detailed_gantt_webgl(gantt_df, project_colors, compact=compact)
+        else:
+            fig = create_detailed_gantt(gantt_df, project_colors, compact=compact)
         
     elif view_type == "consolidated":
         if phase_colors is None:
             phase_colors = PHASE_COLORS
-        fig = create_consolidated_gantt(gantt_df, phase_colors)
+        fig = create_consolidated_gantt(gantt_df, phase_colors, compact=compact)
         
     else:
         raise ValueError(f"Tipo de vista no válido: {view_type}")
@@ -433,11 +664,80 @@ def get_gantt_figure(gantt_df: pd.DataFrame, view_type: str, project_colors: Dic
         min_date = pd.to_datetime(gantt_df['Start'].min()).date()
         max_date = pd.to_datetime(gantt_df['Finish'].max()).date()
         
-        # Agregar sombreado de fines de semana
-        add_weekend_shading(fig, min_date, max_date)
+        # Limitar el eje X a la ventana seleccionada
+        if date_range is not None:
+            range_start, range_end = date_range
+            min_date = max(min_date, range_start) if range_start else min_date
+            max_date = min(max_date, range_end) if range_end else max_date
+            fig.update_xaxes(range=[min_date, max_date])
+        
+        if detail_level == "day":
+            # Agregar sombreado de fines de semana
+            add_weekend_shading(fig, min_date, max_date)
+        else:
+            # Con datos agregados el sombreado diario no aporta; ajustar los ticks al nivel
+            fig.update_xaxes(**DETAIL_LEVEL_AXES.get(detail_level, {}))
         
         # Agregar marcadores de tiempo si es necesario
         if add_markers:
             add_timeline_markers(fig, gantt_df, show_today=True, show_months=False)
     
-    return fig
\ No newline at end of file
+    return fig
+
+
+def get_figure_payload_size(fig) -> int:
+    """
+    Tamaño en bytes de la figura serializada tal como se envía al navegador
+
+    Args:
+        fig: Figura de Plotly
+
+    Returns:
+        int: Bytes del JSON de la figura (0 si no hay figura)
+    """
+    if fig is None:
+        return 0
+    return len(fig.to_json().encode('utf-8'))
+
+
+def create_utilization_heatmap(matrix):
+    """
+    Crea el heatmap de utilización de capacidad por team y día hábil
+
+    Args:
+        matrix: UtilizationMatrix calculada con compute_utilization_matrix
+
+    Returns:
+        Figura de Plotly (None si no hay días en el horizonte)
+    """
+    import plotly.graph_objects as go
+
+    if matrix.days.size == 0:
+        return None
+
+    utilization = np.round(matrix.utilization * 100, 1)
+    busy = matrix.busy_devs
+    capacity = np.broadcast_to(matrix.capacity[:, None], busy.shape)
+
+    fig = go.Figure(go.Heatmap(
+        z=utilization,
+        x=_short_dates(matrix.days),
+        y=matrix.team_names,
+        customdata=np.dstack([busy, capacity]),
+        colorscale=[[0.0, "#f7fbff"], [0.5, "#6baed6"], [0.8, "#fdae61"], [1.0, "#d7191c"]],
+        zmin=0,
+        zmax=max(100.0, float(np.nanmax(utilization)) if np.isfinite(utilization).any() else 100.0),
+        colorbar=dict(title="% ocupado"),
+        hovertemplate=(
+            "<b>%{y}</b><br>%{x}<br>"
+            "Devs ocupados: %{customdata[0]:.2f} / %{customdata[1]:.0f}<br>"
+            "Utilización: %{z:.1f}%<extra></extra>"
+        ),
+    ))
+    fig.update_layout(
+        height=max(250, 40 * len(matrix.team_names) + 120),
+        margin=dict(l=10, r=10, t=30, b=10),
+        xaxis=dict(type="date", title=None),
+        yaxis=dict(autorange="reversed", title=None),
+    )
+    return fig
@@ -5,10 +5,14 @@ Implementa la lógica de transformación de datos para vista detallada y consoli
 
 import math
 import pandas as pd
-from datetime import date
-from typing import List, Dict, Optional
+from datetime import date, timedelta
+from typing import List, Dict, Optional, Tuple
+import logging
 from ..common.models import Assignment, ScheduleResult, SimulationInput
-from ..common.constants import PHASE_ORDER_MAP
+from ..common.constants import (
+    PHASE_ORDER_MAP, MAX_GANTT_TRACES, GANTT_PAGE_SIZE,
+    GANTT_DETAIL_LEVELS, GANTT_DETAIL_MAX_SPAN_DAYS
+)
 
 
 # Esquema de colores para las fases (Vista Consolidada)
@@ -22,6 +26,15 @@ PHASE_COLORS = {
 # Colores por proyecto (Vista Detallada) - mantener actual
 PROJECT_COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f']
 
+logger = logging.getLogger(__name__)
+
+# Frecuencias de pandas para cada nivel de detalle agregado
+DETAIL_LEVEL_FREQS = {
+    "week": "W",
+    "month": "M",
+    "quarter": "Q"
+}
+
 
 def get_phase_order(team_name: str) -> int:
     """
@@ -106,8 +119,6 @@ def transform_to_detailed_view(assignments: List[Assignment], projects: Dict = N
                         project_active = proj_data.get('active', True)
                         break
             
-            from datetime import timedelta
-
             start_date = assignment.calculated_start_date
             end_date = assignment.calculated_end_date
             # Display end date + 1 calendar day in hover (cosmetic change)
@@ -156,7 +167,10 @@ def transform_to_detailed_view(assignments: List[Assignment], projects: Dict = N
     gantt_df = gantt_df.sort_values(['EffectivePriority', 'Project', 'PhaseOrder'])
     
     # Eliminar la columna temporal
-    gantt_df = gantt_df.drop('EffectivePriority', axis=1)
+    gantt_df = gantt_df.drop('EffectivePriority', axis=1).reset_index(drop=True)
+    
+    # Ranking de proyectos por prioridad efectiva (para ventanas y paginación)
+    gantt_df['ProjectRank'] = gantt_df.groupby('Project', sort=False).ngroup()
     
     return gantt_df
 
@@ -252,8 +266,6 @@ def transform_to_consolidated_view(assignments: List[Assignment], projects: Dict
         final_priority = correct_priority if correct_priority is not None else project_priority
         
         # Crear texto de hover para vista consolidada
-        from datetime import timedelta
-
         # Display end dates + 1 calendar day (cosmetic change)
         project_end_display = project_end + timedelta(days=1)
 
@@ -311,7 +323,10 @@ def transform_to_consolidated_view(assignments: List[Assignment], projects: Dict
     gantt_df = gantt_df.sort_values(['EffectivePriority', 'Project'])
     
     # Eliminar la columna temporal
-    gantt_df = gantt_df.drop('EffectivePriority', axis=1)
+    gantt_df = gantt_df.drop('EffectivePriority', axis=1).reset_index(drop=True)
+    
+    # Ranking de proyectos por prioridad efectiva (para ventanas y paginación)
+    gantt_df['ProjectRank'] = range(len(gantt_df))
     
     return gantt_df
 
@@ -344,6 +359,192 @@ def prepare_gantt_data(result: ScheduleResult, view_type: str, simulation_input:
         raise ValueError(f"Tipo de vista no válido: {view_type}")
 
 
+def _filter_date_range(gantt_df: pd.DataFrame, start_date: Optional[date],
+                       end_date: Optional[date]) -> pd.DataFrame:
+    """Filas del Gantt que se solapan con el rango de fechas (Finish es exclusivo)"""
+    if start_date is not None:
+        gantt_df = gantt_df[gantt_df['Finish'] > pd.Timestamp(start_date)]
+    if end_date is not None:
+        gantt_df = gantt_df[gantt_df['Start'] <= pd.Timestamp(end_date)]
+    return gantt_df
+
+
+def window_gantt_data(gantt_df: pd.DataFrame, start_date: Optional[date] = None,
+                      end_date: Optional[date] = None, page: int = 0,
+                      page_size: int = GANTT_PAGE_SIZE, max_rows: int = MAX_GANTT_TRACES) -> pd.DataFrame:
+    """
+    Recorta el DataFrame precalculado a un rango de fechas y a una página de proyectos
+    
+    Los proyectos visibles en el rango se ordenan por prioridad efectiva (ProjectRank)
+    y se devuelve la página solicitada, acotada a max_rows filas.
+    
+    Args:
+        gantt_df: DataFrame completo generado por prepare_gantt_data
+        start_date: Inicio del rango visible (inclusive)
+        end_date: Fin del rango visible (inclusive)
+        page: Número de página (empezando en 0)
+        page_size: Cantidad de proyectos por página
+        max_rows: Máximo de filas a renderizar
+        
+    Returns:
+        pd.DataFrame: Porción del Gantt a renderizar
+    """
+    if gantt_df.empty:
+        return gantt_df
+    
+    window_df = _filter_date_range(gantt_df, start_date, end_date)
+    if window_df.empty:
+        return window_df
+    
+    # Paginar por ranking de proyecto; las filas ya están ordenadas por ProjectRank
+    visible_ranks = window_df['ProjectRank'].unique()
+    page_ranks = visible_ranks[page * page_size:(page + 1) * page_size]
+    if len(page_ranks) == 0:
+        return window_df.iloc[0:0]
+    
+    ranks = window_df['ProjectRank'].to_numpy()
+    lo = ranks.searchsorted(page_ranks[0], side='left')
+    hi = ranks.searchsorted(page_ranks[-1], side='right')
+    window_df = window_df.iloc[lo:hi]
+    
+    if len(window_df) > max_rows:
+        logger.warning(f"Ventana del Gantt con {len(window_df)} filas; se limita a {max_rows}")
+        window_df = window_df.iloc[:max_rows]
+    
+    # En la vista consolidada, descartar las fases que quedan fuera del rango
+    if 'PhasesInfo' in window_df.columns and (start_date is not None or end_date is not None):
+        window_df = window_df.copy()
+        window_df['PhasesInfo'] = [
+            [phase for phase in phases
+             if (start_date is None or phase['end'] >= start_date)
+             and (end_date is None or phase['start'] <= end_date)]
+            for phases in window_df['PhasesInfo']
+        ]
+    
+    return window_df
+
+
+def get_total_gantt_pages(gantt_df: pd.DataFrame, page_size: int = GANTT_PAGE_SIZE,
+                          start_date: Optional[date] = None, end_date: Optional[date] = None) -> int:
+    """
+    Cantidad de páginas de proyectos del Gantt
+    
+    Cuenta solo los proyectos visibles en el rango de fechas, igual que window_gantt_data.
+    
+    Args:
+        gantt_df: DataFrame completo generado por prepare_gantt_data
+        page_size: Cantidad de proyectos por página
+        start_date: Inicio del rango visible (inclusive)
+        end_date: Fin del rango visible (inclusive)
+        
+    Returns:
+        int: Número de páginas (mínimo 1)
+    """
+    window_df = _filter_date_range(gantt_df, start_date, end_date)
+    if window_df.empty:
+        return 1
+    total_projects = window_df['ProjectRank'].nunique()
+    return max(1, math.ceil(total_projects / page_size))
+
+
+def select_detail_level(start_date: date, end_date: date) -> str:
+    """
+    Elige el nivel de detalle según el rango visible
+    
+    Args:
+        start_date: Inicio del rango visible
+        end_date: Fin del rango visible
+        
+    Returns:
+        str: "day" | "week" | "month" | "quarter"
+    """
+    span_days = (end_date - start_date).days
+    for level in GANTT_DETAIL_LEVELS:
+        max_span = GANTT_DETAIL_MAX_SPAN_DAYS.get(level)
+        if max_span is None or span_days <= max_span:
+            return level
+    return GANTT_DETAIL_LEVELS[-1]
+
+
+def _snap_to_period(start: date, end: date, freq: str) -> Tuple[date, date]:
+    """Extiende un intervalo inclusivo a los límites de los períodos que toca"""
+    return pd.Period(start, freq).start_time.date(), pd.Period(end, freq).end_time.date()
+
+
+def _aggregate_consolidated_view(gantt_df: pd.DataFrame, freq: str) -> pd.DataFrame:
+    """
+    Ajusta las fases de cada proyecto a los límites de período y fusiona los segmentos
+    contiguos o solapados de la misma fase
+
+    Ninguna fase se descarta: cada una queda dentro de un segmento de su mismo nombre y
+    sus horas se suman una sola vez.
+    """
+    df = gantt_df.copy()
+    
+    aggregated_phases = []
+    for phases in df['PhasesInfo']:
+        snapped = []
+        for index, phase in enumerate(phases):
+            start, end = _snap_to_period(phase['start'], phase['end'], freq)
+            snapped.append((index, {**phase, 'start': start, 'end': end}))
+        
+        # Fusionar por fase en orden cronológico; el índice conserva el orden original de las fases
+        merged_phases = []
+        last_by_name = {}
+        for index, phase in sorted(snapped, key=lambda item: (item[1]['name'], item[1]['start'], item[0])):
+            previous = last_by_name.get(phase['name'])
+            if previous is not None and phase['start'] <= previous['end'] + timedelta(days=1):
+                previous['end'] = max(previous['end'], phase['end'])
+                previous['hours'] += phase['hours']
+                previous['duration'] += phase['duration']
+                previous['devs'] = max(previous['devs'], phase['devs'])
+            else:
+                last_by_name[phase['name']] = phase
+                merged_phases.append((index, phase))
+        
+        merged_phases.sort(key=lambda item: (item[1]['start'], item[0]))
+        for _, phase in merged_phases:
+            phase['calendar_days'] = float((phase['end'] - phase['start']).days)
+        aggregated_phases.append([phase for _, phase in merged_phases])
+    
+    df['PhasesInfo'] = aggregated_phases
+    df['Start'] = df['Start'].dt.to_period(freq).dt.start_time
+    last_day = (df['Finish'] - pd.Timedelta(days=1)).dt.to_period(freq).dt.end_time.dt.normalize()
+    df['Finish'] = last_day + pd.Timedelta(days=1)
+    return df
+
+
+def aggregate_gantt_data(gantt_df: pd.DataFrame, view_type: str, detail_level: str) -> pd.DataFrame:
+    """
+    Reduce el detalle del Gantt agrupando las fases por semana, mes o trimestre
+    
+    Solo la vista consolidada se agrupa: en la detallada cada fila es una tarea distinta
+    (proyecto-equipo), por lo que ajustar sus fechas no reduciría filas y haría que las barras
+    contradigan las fechas del hover. Las dos vistas usan el nivel para el sombreado y los ejes.
+    
+    Args:
+        gantt_df: DataFrame del Gantt (completo o ventana)
+        view_type: "detailed" | "consolidated"
+        detail_level: "day" | "week" | "month" | "quarter"
+        
+    Returns:
+        pd.DataFrame: Datos agregados ("day" y la vista detallada devuelven los datos sin cambios)
+    """
+    if gantt_df.empty or detail_level == "day":
+        return gantt_df
+    
+    freq = DETAIL_LEVEL_FREQS.get(detail_level)
+    if freq is None:
+        raise ValueError(f"Nivel de detalle no válido: {detail_level}")
+    
+    if view_type == "detailed":
+        return gantt_df
+    elif view_type == "consolidated":
+        return _aggregate_consolidated_view(gantt_df, freq)
+    else:
+        raise ValueError(f"Tipo de vista no válido: {view_type}")
+
+
 def get_project_colors_map(projects: Dict, color_palette: List[str] = None) -> Dict[str, str]:
     """
     Genera un mapa de colores para proyectos
@@ -6,12 +6,13 @@ Versión final con lógica de secuenciación, priorización y paralelismo correg
 import math
 import json
 import logging
+from dataclasses import fields, is_dataclass
 from datetime import date
 from typing import List, Dict
 import pandas as pd
 from pandas.tseries.offsets import BusinessDay
 
-from ..common.models import Assignment, Team, Project, ScheduleResult, SimulationInput
+from ..common.models import Assignment, Team, Project, ScheduleResult, ScheduledAssignment, SimulationInput
 from ..common.date_utils import validate_date_range
 from ..common.constants import PHASE_ORDER_MAP
 
@@ -22,6 +23,10 @@ class EnhancedJSONEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, date):
             return obj.isoformat()
+        if hasattr(obj, 'to_dict'):
+            return obj.to_dict()
+        if is_dataclass(obj):
+            return {f.name: getattr(obj, f.name) for f in fields(obj)}
         if hasattr(obj, '__dict__'):
             return obj.__dict__
         return super().default(obj)
@@ -71,11 +76,8 @@ class ProjectScheduler:
                     
                     # Asumimos que la fecha de inicio es la misma que la de fin si no la tenemos.
                     # Esto es una simplificación; idealmente, también guardaríamos la fecha de inicio real.
-                    assignment.calculated_start_date = actual_end_date 
-                    assignment.calculated_end_date = actual_end_date
-                    
-                    # La marcamos como procesada.
-                    processed_assignments.append(assignment)
+                    # La marcamos como procesada (sin modificar la asignación de entrada).
+                    processed_assignments.append(ScheduledAssignment(assignment, actual_end_date, actual_end_date))
                     
                     # La siguiente fase puede empezar un día hábil después.
                     next_available_date = self._add_business_days(actual_end_date, 1)
@@ -109,16 +111,13 @@ class ProjectScheduler:
                 
                 end_date = self._add_business_days(start_date, days_needed - 1)
 
-                assignment.calculated_start_date = start_date
-                assignment.calculated_end_date = end_date
-                
                 next_available_date = self._add_business_days(end_date, 1)
                 for i in range(devs_needed):
                     team_availability[team.id][i] = next_available_date
 
                 last_phase_end_date = next_available_date
                 project_end_dates[project.id] = last_phase_end_date
-                processed_assignments.append(assignment)
+                processed_assignments.append(ScheduledAssignment(assignment, start_date, end_date))
 
         project_summaries = self._generate_project_summaries(processed_assignments, simulation_input.projects)
         
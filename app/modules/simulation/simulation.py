@@ -6,17 +6,16 @@ Eliminado código DEBUG y simplificadas las funciones complejas
 import streamlit as st
 import pandas as pd
 from datetime import date
-from .scheduler import ProjectScheduler
+from .forecast import get_forecast
 from ..common.models import SimulationInput
 import logging
-from ..common.plans_crud import get_active_plan
-from ..common.plan_utils import get_active_assignments, get_completed_phases
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
 # Importar utilidades comunes
-from ..common.ui_utils import DRAGGABLE_AVAILABLE, setup_draggable_list
+from ..common.ui_utils import DRAGGABLE_AVAILABLE, setup_draggable_list, render_export_downloads
+from ..common.export import export_schedule
 from ..common.simulation_data_loader import load_simulation_input_from_db
 
 
@@ -250,48 +249,15 @@ def _should_run_simulation(priority_overrides, auto_run):
 def _execute_simulation(initial_data, priority_overrides, sim_start_date):
     """Ejecuta la simulación con los parámetros dados"""
     try:
-        # Preparar datos de simulación usando la fecha actual
-        simulation_input = load_simulation_input_from_db(date.today())
+        with st.spinner("Ejecutando simulación..."):
+            # Pronóstico compartido entre sesiones; sin cambios de prioridad es el base
+            # que precalcula el worker
+            forecast = get_forecast(priority_overrides)
         
-        # Aplicar overrides de prioridad
-        _apply_priority_overrides(simulation_input, priority_overrides)
-
-        # --- NUEVA LÓGICA PARA AJUSTAR HORAS POR PLAN ACTIVO ---
-        active_plan = get_active_plan()
-        if active_plan:
-            logger.info(f"Plan activo encontrado: '{active_plan.name}'. Ajustando horas de la simulación.")
-            
-            # Obtener el progreso de las asignaciones activas en el plan
-            progress_info = get_active_assignments(active_plan, date.today())
-            
-            if progress_info:
-                # Crear un mapa de project_id y team_id a horas restantes para búsqueda rápida
-                progress_map = {
-                    (p['assignment'].project_id, p['assignment'].team_id, p['assignment'].tier): p['remaining_hours']
-                    for p in progress_info
-                }
-                
-                logger.info(f"Progreso encontrado para {len(progress_map)} asignaciones activas.")
-
-                # Actualizar las horas en simulation_input.assignments
-                assignments_updated = 0
-                for assignment in simulation_input.assignments:
-                    key = (assignment.project_id, assignment.team_id, assignment.tier)
-                    if key in progress_map:
-                        remaining_hours = progress_map[key]
-                        if remaining_hours < assignment.estimated_hours:
-                            logger.info(f"  - Ajustando asignación: Proyecto {assignment.project_name} (Tier {assignment.tier})")
-                            logger.info(f"    Horas originales: {assignment.estimated_hours}, Horas restantes: {remaining_hours}")
-                            assignment.estimated_hours = remaining_hours
-                            assignments_updated += 1
-                
-                if assignments_updated > 0:
-                    st.success(f"Se ajustaron las horas de {assignments_updated} fases de proyecto según el progreso del plan activo.")
-        # --- FIN DE LA NUEVA LÓGICA ---
+        simulation_input, result = forecast.simulation_input, forecast.result
         
-        # Usar fecha actual como referencia temporal para el scheduler
-        # CORRECCIÓN: Asegurar que la fecha de simulación no interfiera con fecha_inicio_real
-        simulation_input.simulation_start_date = date.today()
+        if forecast.adjusted_assignments > 0:
+            st.success(f"Se ajustaron las horas de {forecast.adjusted_assignments} fases de proyecto según el progreso del plan activo.")
         
         # Agregar logs para verificar fechas de inicio real
         logger.info("🔍 DEBUG FECHAS DE INICIO REAL EN PROYECTOS:")
@@ -301,13 +267,6 @@ def _execute_simulation(initial_data, priority_overrides, sim_start_date):
             else:
                 logger.info(f"  - Proyecto {project.name} (ID: {project_id}): SIN fecha_inicio_real")
         
-        # Obtener fases completadas para anclarlas en la simulación
-        completed_phases = get_completed_phases()
-        # Ejecutar simulación
-        with st.spinner("Ejecutando simulación..."):
-            scheduler = ProjectScheduler()
-            result = scheduler.simulate(simulation_input, completed_phases=completed_phases)
-        
         # Guardar resultados
         st.session_state.simulation_result = result
         st.session_state.simulation_input_data = simulation_input
@@ -321,19 +280,6 @@ def _execute_simulation(initial_data, priority_overrides, sim_start_date):
         st.session_state.simulation_input_data = None
 
 
-def _apply_priority_overrides(simulation_input, priority_overrides):
-    """Aplica los cambios de prioridad a los datos de simulación"""
-    for project_id, new_priority in priority_overrides.items():
-        if project_id in simulation_input.projects:
-            # Actualizar prioridad en project
-            simulation_input.projects[project_id].priority = new_priority
-            
-            # Actualizar project_priority en assignments
-            for assignment in simulation_input.assignments:
-                if assignment.project_id == project_id:
-                    assignment.project_priority = new_priority
-
-
 def _render_simulation_results(priority_overrides):
     """Renderiza los resultados de la simulación"""
     if not hasattr(st.session_state, 'simulation_result') or st.session_state.simulation_result is None:
@@ -381,24 +327,32 @@ def _render_gantt_chart(result, simulation_input):
     )
     
     try:
-        from .gantt_views import prepare_gantt_data, get_project_colors_map, get_gantt_metrics
-        from .gantt_config import get_gantt_figure
-        
-        # Preparar y mostrar datos
-        gantt_df = prepare_gantt_data(result, view_type, simulation_input)
-        
+        from .gantt_views import get_project_colors_map
+        from .figure_cache import get_cached_gantt, get_cached_gantt_frame
+
+        # Ventana visible: rango de fechas y página de proyectos
+        full_df = get_cached_gantt_frame(result, view_type, simulation_input)
+        date_range, page, detail_level, compact = _render_gantt_window_controls(full_df)
+
+        # Preparar datos y figura (reutiliza la caché si el resultado y la vista no cambiaron)
+        project_colors = get_project_colors_map(simulation_input.projects)
+        gantt_df, fig, payload_size = get_cached_gantt(
+            result, view_type, simulation_input, project_colors=project_colors, add_markers=True,
+            date_range=date_range, page=page, detail_level=detail_level, compact=compact
+        )
+
         if not gantt_df.empty:
-            # DEBUG: Mostrar la tabla de datos del Gantt
 
-            project_colors = get_project_colors_map(simulation_input.projects)
-            # Usar fecha actual para el Gantt
-            fig = get_gantt_figure(gantt_df, view_type, project_colors=project_colors, add_markers=True)
-            
             if fig:
                 st.plotly_chart(fig, use_container_width=True)
+                st.caption(f"📦 Tamaño de la figura enviada: {payload_size / 1024:,.1f} KB")
                 _render_gantt_metrics(gantt_df, view_type)
                 with st.expander("Ver datos de la simulación"):
                     st.dataframe(gantt_df)
+                    render_export_downloads(
+                        "simulation_result", f"simulacion_{simulation_input.simulation_start_date.isoformat()}",
+                        lambda fmt: export_schedule(result, fmt), version=result.get_checksum()
+                    )
             else:
                 st.warning("⚠️ No se pudo generar el gráfico Gantt")
         else:
@@ -408,6 +362,70 @@ def _render_gantt_chart(result, simulation_input):
         st.error(f"❌ Error generando el cronograma: {str(e)}")
 
 
+def _render_gantt_window_controls(full_df):
+    """Renderiza controles de ventana (rango de fechas, página, nivel de detalle y modo compacto) para portfolios grandes"""
+    from .gantt_views import get_total_gantt_pages
+
+    if full_df.empty:
+        return None, 0, "auto", True
+
+    min_date = full_df['Start'].min().date()
+    max_date = full_df['Finish'].max().date()
+
+    with st.expander("🪟 Ventana del cronograma", expanded=get_total_gantt_pages(full_df) > 1):
+        col1, col2 = st.columns(2)
+        with col1:
+            selected_range = st.date_input(
+                "Rango de fechas",
+                value=(min_date, max_date),
+                min_value=min_date,
+                max_value=max_date,
+                key="gantt_window_range"
+            )
+
+        # Mientras se elige el rango, date_input puede devolver una sola fecha
+        date_range = None
+        if isinstance(selected_range, (list, tuple)) and len(selected_range) == 2:
+            if tuple(selected_range) != (min_date, max_date):
+                date_range = tuple(selected_range)
+
+        # Las páginas se cuentan sobre los proyectos visibles en el rango; si al achicarlo
+        # la página elegida deja de existir, se lleva a la última
+        start_date, end_date = date_range or (None, None)
+        total_pages = get_total_gantt_pages(full_df, start_date=start_date, end_date=end_date)
+        st.session_state.setdefault("gantt_window_page", 1)
+        if st.session_state["gantt_window_page"] > total_pages:
+            st.session_state["gantt_window_page"] = total_pages
+
+        with col2:
+            page = st.number_input(
+                f"Página de proyectos (de {total_pages})",
+                min_value=1,
+                max_value=total_pages,
+                step=1,
+                key="gantt_window_page",
+                help="Los proyectos se paginan por prioridad efectiva"
+            ) - 1
+        detail_level = st.selectbox(
+            "Nivel de detalle",
+            options=["auto", "day", "week", "month", "quarter"],
+            format_func=lambda x: {
+                "auto": "Automático", "day": "Día", "week": "Semana",
+                "month": "Mes", "quarter": "Trimestre"
+            }[x],
+            key="gantt_detail_level",
+            help="Automático elige el nivel según el rango visible"
+        )
+        compact = st.checkbox(
+            "Modo compacto",
+            value=True,
+            key="gantt_compact_mode",
+            help="Reduce el tamaño de la figura enviada al navegador (hover armado en el cliente y fechas cortas)"
+        )
+
+    return date_range, int(page), detail_level, compact
+
+
 def _render_gantt_metrics(gantt_df, view_type):
     """Renderiza métricas específicas del Gantt"""
     from .gantt_views import get_gantt_metrics
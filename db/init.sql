@@ -1,5 +1,6 @@
 -- Esquema de base de datos APE - Versión limpia post-migración
 -- Eliminadas columnas redundantes: horas_trabajadas, horas_totales_estimadas, phase, paused_on
+-- Tablas de planes e índices: migraciones versionadas en app/modules/common/migrations.py
 
 CREATE TABLE projects (
   id SERIAL PRIMARY KEY,